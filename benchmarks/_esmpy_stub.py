@@ -0,0 +1,20 @@
+"""
+Stub ESMpy for the benchmarks; import this module before xregrid.
+
+The benchmarks never build ESMF objects, so a plain namespace of constants
+is enough and avoids the attribute-creation overhead of MagicMock.
+"""
+
+import sys
+import types
+
+NS = types.SimpleNamespace
+sys.modules["esmpy"] = NS(
+    CoordSys=NS(SPH_DEG=1),
+    StaggerLoc=NS(CENTER=0, CORNER=1),
+    GridItem=NS(MASK=1),
+    RegridMethod=NS(BILINEAR=0, CONSERVE=1, NEAREST_STOD=2, NEAREST_DTOS=3, PATCH=4),
+    UnmappedAction=NS(IGNORE=1),
+    ExtrapMethod=NS(NEAREST_STOD=0, NEAREST_IDAVG=1, CREEP_FILL=2),
+    LogKind=NS(MULTI=1),
+)
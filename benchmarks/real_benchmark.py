@@ -12,7 +12,8 @@ def create_sample_dataset(nlat, nlon, ntime=1):
     time = np.arange(ntime)
 
     # Use float32 to save memory
-    data = np.random.rand(ntime, nlat, nlon).astype(np.float32)
+    rng = np.random.default_rng(0)
+    data = rng.random((ntime, nlat, nlon), dtype=np.float32)
 
     ds = xr.Dataset(
         {"temperature": (["time", "lat", "lon"], data)},
@@ -15,12 +15,10 @@ def create_sample_data():
     # Create a 2-degree global grid
     ds = create_global_grid(2.0, 2.0)
 
-    # Add some dummy data
-    lat = ds.lat.values
-    lon = ds.lon.values
-    data = (
-        np.sin(np.deg2rad(lat))[:, np.newaxis] * np.cos(np.deg2rad(lon))[np.newaxis, :]
-    )
+    # Add some dummy data (separable field: one outer product in float32)
+    sin_lat = np.sin(np.deg2rad(ds.lat.values, dtype=np.float32))
+    cos_lon = np.cos(np.deg2rad(ds.lon.values, dtype=np.float32))
+    data = np.outer(sin_lat, cos_lon)
 
     ds["sample_var"] = (["lat", "lon"], data)
     ds["sample_var"].attrs["units"] = "dimensionless"
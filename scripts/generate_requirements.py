@@ -1,5 +1,7 @@
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 try:
     import tomllib
@@ -24,25 +26,25 @@ def main():
     if deps is None:
         deps = data.get("project", {}).get("dependencies", [])
 
+    header = (
+        "# This file is auto-generated from pyproject.toml{}. Do not edit directly.\n"
+    )
+    files = []
+
     # Core requirements
-    with open("requirements.txt", "w") as f:
-        f.write(
-            "# This file is auto-generated from pyproject.toml. Do not edit directly.\n"
-        )
-        for dep in deps:
-            f.write(f"{dep}\n")
-    print("Successfully generated requirements.txt")
+    files.append(
+        ("requirements.txt", header.format("") + "".join(f"{dep}\n" for dep in deps))
+    )
 
     # Custom requirements without esmpy (useful for custom ESMF builds)
-    with open("requirements_no_esmpy.txt", "w") as f:
-        f.write(
-            "# This file is auto-generated from pyproject.toml. Do not edit directly.\n"
+    files.append(
+        (
+            "requirements_no_esmpy.txt",
+            header.format("")
+            + "# It omits esmpy to support custom ESMF installations.\n"
+            + "".join(f"{dep}\n" for dep in deps if dep != "esmpy"),
         )
-        f.write("# It omits esmpy to support custom ESMF installations.\n")
-        for dep in deps:
-            if dep != "esmpy":
-                f.write(f"{dep}\n")
-    print("Successfully generated requirements_no_esmpy.txt")
+    )
 
     # Optional requirements (e.g. test, viz)
     optional_deps = data.get("project", {}).get("optional-dependencies", {})
@@ -55,16 +57,18 @@ def main():
         if extra == "full":
             continue  # Skip meta-extra
 
-        filename = f"requirements-{extra}.txt"
-        with open(filename, "w") as f:
-            f.write(
-                f"# This file is auto-generated from pyproject.toml [{extra}]. Do not edit directly.\n"
-            )
-            for dep in extra_deps:
-                # If it's a reference to the package itself, like xregrid[test], skip or handle
-                if dep.startswith("xregrid["):
-                    continue
-                f.write(f"{dep}\n")
+        # References to the package itself, like xregrid[test], are skipped
+        content = header.format(f" [{extra}]") + "".join(
+            f"{dep}\n" for dep in extra_deps if not dep.startswith("xregrid[")
+        )
+        files.append((f"requirements-{extra}.txt", content))
+
+    # All contents are built in memory first; the writes are then issued
+    # concurrently, which overlaps the metadata operations on network
+    # filesystems (NFS, Lustre).
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(lambda item: Path(item[0]).write_text(item[1]), files))
+    for filename, _ in files:
         print(f"Successfully generated {filename}")
 
 
@@ -1,3 +1,5 @@
+from typing import Any
+
 from xregrid.utils import (
     create_global_grid,
     create_grid_from_crs,
@@ -6,9 +8,37 @@ from xregrid.utils import (
     create_regional_grid,
     load_esmf_file,
 )
-from .viz import plot, plot_comparison, plot_interactive, plot_static
 from .xregrid import Regridder
 
+# Plotting functions are imported on first access, so that `import xregrid`
+# does not pay for importing matplotlib/cartopy/holoviews.
+_VIZ_FUNCTIONS = frozenset(
+    {"plot", "plot_static", "plot_interactive", "plot_comparison"}
+)
+_viz_module = None
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily resolve the plotting functions from `xregrid.viz`.
+
+    The resolved attribute is stored in the module globals, so later
+    accesses do not go through this function again.
+    """
+    global _viz_module
+    if name in _VIZ_FUNCTIONS:
+        if _viz_module is None:
+            from . import viz as _viz_module
+        attr = getattr(_viz_module, name)
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _VIZ_FUNCTIONS)
+
+
 __all__ = [
     "Regridder",
     "plot",
@@ -6,8 +6,26 @@ import sys
 
 import xarray as xr
 from xregrid import Regridder, create_global_grid, create_regional_grid
+from xregrid.grid import _get_mesh_info
 from xregrid.utils import get_rdhpcs_cluster
 
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "xregrid"
+)
+
+
+def _parse_extent(value: str) -> tuple:
+    """Parse ``min_lat,max_lat,min_lon,max_lon`` into four floats."""
+    parts = value.split(",")
+    try:
+        if len(parts) != 4:
+            raise ValueError
+        return tuple(map(float, parts))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected min_lat,max_lat,min_lon,max_lon, got {value!r}"
+        ) from None
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="xregrid CLI: Regrid NetCDF files.")
@@ -27,8 +45,16 @@ def parse_args():
     )
     parser.add_argument(
         "--extent",
+        type=_parse_extent,
         help="Target grid extent as min_lat,max_lat,min_lon,max_lon (only used if target is a resolution).",
     )
+    parser.add_argument(
+        "--target-chunks",
+        type=int,
+        metavar="N",
+        help="Chunk size for the lat/lon axes of a generated target grid, "
+        "which keeps its coordinates Dask-backed (lazy).",
+    )
     parser.add_argument(
         "--periodic",
         action="store_true",
@@ -42,6 +68,14 @@ def parse_args():
     parser.add_argument(
         "--weights-file", default="weights.nc", help="Path to the weights file."
     )
+    parser.add_argument(
+        "--weights-cache",
+        nargs="?",
+        const=DEFAULT_CACHE_DIR,
+        metavar="DIR",
+        help="Reuse weights from a cache keyed on the grids and options "
+        f"(default directory: {DEFAULT_CACHE_DIR}).",
+    )
     parser.add_argument(
         "--skipna", action="store_true", help="Handle NaNs by re-normalizing weights."
     )
@@ -98,6 +132,14 @@ def main():
         # 2. Load Source Dataset
         print(f"Loading source dataset: {args.src}")
         ds_src = xr.open_dataset(args.src, chunks={})
+        if client is not None:
+            # Let Dask size the chunks of the non-spatial dimensions so the
+            # reads are spread over the workers; the spatial dimensions stay
+            # whole, as each regridding task needs complete fields.
+            spatial_dims = _get_mesh_info(ds_src)[3]
+            ds_src = ds_src.chunk(
+                {dim: -1 if dim in spatial_dims else "auto" for dim in ds_src.dims}
+            )
 
         # 3. Load or Create Target Grid
         if os.path.exists(args.target):
@@ -107,18 +149,20 @@ def main():
             try:
                 res = float(args.target)
                 if args.extent:
-                    lat_min, lat_max, lon_min, lon_max = map(
-                        float, args.extent.split(",")
-                    )
+                    lat_min, lat_max, lon_min, lon_max = args.extent
                     print(
                         f"Creating regional target grid: res={res}, extent=[{lat_min}, {lat_max}, {lon_min}, {lon_max}]"
                     )
                     ds_tgt = create_regional_grid(
-                        (lat_min, lat_max), (lon_min, lon_max), res, res
+                        (lat_min, lat_max),
+                        (lon_min, lon_max),
+                        res,
+                        res,
+                        chunks=args.target_chunks,
                     )
                 else:
                     print(f"Creating global target grid: res={res}")
-                    ds_tgt = create_global_grid(res, res)
+                    ds_tgt = create_global_grid(res, res, chunks=args.target_chunks)
             except ValueError:
                 print(
                     f"Error: target '{args.target}' is neither a file nor a valid resolution."
@@ -138,6 +182,7 @@ def main():
             filename=args.weights_file,
             skipna=args.skipna,
             parallel=(client is not None),
+            cache_dir=args.weights_cache,
         )
 
         # 5. Perform Regridding
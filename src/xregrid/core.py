@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+import threading
+import weakref
 from typing import Any, Optional, Tuple
 
 import numpy as np
+import scipy.sparse
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import cupy
+    import cupyx.scipy.sparse
+except ImportError:
+    cupy = None
 
 
 # Global cache for workers to reuse ESMF source objects and weight matrices
@@ -28,11 +42,780 @@ def _setup_worker_cache(key: str, value: Any) -> None:
     _WORKER_CACHE[key] = value
 
 
-def _matmul(matrix: Any, data: np.ndarray) -> np.ndarray:
+if numba is not None:
+
+    @numba.njit(parallel=True, nogil=True, fastmath={"reassoc", "contract"}, cache=True)
+    def _apply_weights_numba(
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        row_bounds: np.ndarray,
+        x_flat: np.ndarray,
+        out_flat: np.ndarray,
+    ) -> None:
+        """
+        Row-parallel CSR sparse matrix-vector product.
+
+        Computes ``out_flat[t, i] = sum_k weights[k] * x_flat[t, indices[k]]``
+        for every destination row ``i`` and every leading slice ``t``. Rows are
+        processed in contiguous ranges with balanced nonzero counts rather
+        than split evenly by row index, so rows with many weights (e.g.
+        conservative regridding) do not leave threads idle.
+
+        Parameters
+        ----------
+        indptr, indices, weights : np.ndarray
+            The CSR triplet of the weight matrix, with sorted column indices.
+        row_bounds : np.ndarray
+            Row ranges with balanced nonzero counts, one per parallel task
+            (see ``_nnz_row_bounds``).
+        x_flat : np.ndarray
+            The source data (2D: other x spatial), C-contiguous.
+        out_flat : np.ndarray
+            Preallocated output (2D: other x n_dst).
+        """
+        n_other = x_flat.shape[0]
+        for p in numba.prange(row_bounds.shape[0] - 1):
+            for i in range(row_bounds[p], row_bounds[p + 1]):
+                start = indptr[i]
+                end = indptr[i + 1]
+                # Four independent accumulators (modulo unrolling) so the gathers
+                # of sorted column indices can be issued back-to-back.
+                end4 = start + ((end - start) // 4) * 4
+                for t in range(n_other):
+                    acc0 = 0.0
+                    acc1 = 0.0
+                    acc2 = 0.0
+                    acc3 = 0.0
+                    for j in range(start, end4, 4):
+                        acc0 += weights[j] * x_flat[t, indices[j]]
+                        acc1 += weights[j + 1] * x_flat[t, indices[j + 1]]
+                        acc2 += weights[j + 2] * x_flat[t, indices[j + 2]]
+                        acc3 += weights[j + 3] * x_flat[t, indices[j + 3]]
+                    for j in range(end4, end):
+                        acc0 += weights[j] * x_flat[t, indices[j]]
+                    out_flat[t, i] = (acc0 + acc1) + (acc2 + acc3)
+
+    @numba.njit(parallel=True, nogil=True, fastmath={"reassoc", "contract"}, cache=True)
+    def _apply_weights_numba_batched(
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        row_bounds: np.ndarray,
+        x_t: np.ndarray,
+        out_t: np.ndarray,
+    ) -> None:
+        """
+        Row-parallel CSR sparse matrix-dense matrix product (SpMM).
+
+        Computes ``out_t = W @ x_t`` with the batch (non-spatial) axis last,
+        so each weight and column index is loaded once and reused across all
+        right-hand sides, and the innermost loop is unit-stride.
+
+        Parameters
+        ----------
+        indptr, indices, weights : np.ndarray
+            The CSR triplet of the weight matrix.
+        row_bounds : np.ndarray
+            Row ranges with balanced nonzero counts, one per parallel task
+            (see ``_nnz_row_bounds``).
+        x_t : np.ndarray
+            The source data (2D: spatial x other), C-contiguous.
+        out_t : np.ndarray
+            Preallocated output (2D: n_dst x other).
+        """
+        n_batch = x_t.shape[1]
+        for p in numba.prange(row_bounds.shape[0] - 1):
+            for i in range(row_bounds[p], row_bounds[p + 1]):
+                for t in range(n_batch):
+                    out_t[i, t] = 0.0
+                for j in range(indptr[i], indptr[i + 1]):
+                    w = weights[j]
+                    col = indices[j]
+                    for t in range(n_batch):
+                        out_t[i, t] += w * x_t[col, t]
+
+    @numba.njit(parallel=True, nogil=True, fastmath={"reassoc", "contract"}, cache=True)
+    def _apply_weights_numba_ell(
+        col_ell: np.ndarray,
+        val_ell: np.ndarray,
+        row_len: np.ndarray,
+        x_t: np.ndarray,
+        out_t: np.ndarray,
+    ) -> None:
+        """
+        Row-parallel ELLPACK sparse matrix-dense matrix product.
+
+        The weights are stored as fixed-width ``(n_dst, width)`` arrays (see
+        ``_ell_layout``), so rows are read at a constant stride without the
+        ``indptr`` indirection. Only the first ``row_len[i]`` entries of
+        row ``i`` are used.
+
+        Parameters
+        ----------
+        col_ell : np.ndarray
+            Source column indices (2D: n_dst x width).
+        val_ell : np.ndarray
+            Weight values (2D: n_dst x width).
+        row_len : np.ndarray
+            Number of stored weights per row.
+        x_t : np.ndarray
+            The source data (2D: spatial x other), C-contiguous.
+        out_t : np.ndarray
+            Preallocated output (2D: n_dst x other).
+        """
+        n_dst = col_ell.shape[0]
+        n_batch = x_t.shape[1]
+        for i in numba.prange(n_dst):
+            for t in range(n_batch):
+                out_t[i, t] = 0.0
+            for k in range(row_len[i]):
+                w = val_ell[i, k]
+                col = col_ell[i, k]
+                for t in range(n_batch):
+                    out_t[i, t] += w * x_t[col, t]
+
+    @numba.njit(parallel=True, nogil=True, fastmath={"reassoc", "contract"}, cache=True)
+    def _apply_weights_numba_ell_row(
+        col_ell: np.ndarray,
+        val_ell: np.ndarray,
+        row_len: np.ndarray,
+        x_flat: np.ndarray,
+        out_flat: np.ndarray,
+    ) -> None:
+        """
+        Row-parallel ELLPACK sparse matrix-vector product.
+
+        Each output value is accumulated in a register, which for one or two
+        slices is faster than accumulating through the batch-innermost
+        output of ``_apply_weights_numba_ell``.
+
+        Parameters
+        ----------
+        col_ell, val_ell, row_len : np.ndarray
+            The ELLPACK layout of the weight matrix (see ``_ell_layout``).
+        x_flat : np.ndarray
+            The source data (2D: other x spatial), C-contiguous.
+        out_flat : np.ndarray
+            Preallocated output (2D: other x n_dst).
+        """
+        n_dst = col_ell.shape[0]
+        n_other = x_flat.shape[0]
+        for i in numba.prange(n_dst):
+            for t in range(n_other):
+                acc = 0.0
+                for k in range(row_len[i]):
+                    acc += val_ell[i, k] * x_flat[t, col_ell[i, k]]
+                out_flat[t, i] = acc
+
+    @numba.njit(parallel=True, nogil=True, fastmath={"reassoc", "contract"}, cache=True)
+    def _apply_weights_numba_ell_time(
+        col_ell: np.ndarray,
+        val_ell: np.ndarray,
+        row_len: np.ndarray,
+        x_flat: np.ndarray,
+        out_flat: np.ndarray,
+    ) -> None:
+        """
+        Slice-parallel ELLPACK sparse matrix product.
+
+        The fixed-width counterpart of ``_apply_weights_numba_time``.
+
+        Parameters
+        ----------
+        col_ell, val_ell, row_len : np.ndarray
+            The ELLPACK layout of the weight matrix (see ``_ell_layout``).
+        x_flat : np.ndarray
+            The source data (2D: other x spatial), C-contiguous.
+        out_flat : np.ndarray
+            Preallocated output (2D: other x n_dst), C-contiguous.
+        """
+        n_dst = col_ell.shape[0]
+        for t in numba.prange(x_flat.shape[0]):
+            x_row = x_flat[t]
+            for i in range(n_dst):
+                acc = 0.0
+                for k in range(row_len[i]):
+                    acc += val_ell[i, k] * x_row[col_ell[i, k]]
+                out_flat[t, i] = acc
+
+    @numba.njit(parallel=True, nogil=True, fastmath={"reassoc", "contract"}, cache=True)
+    def _apply_weights_numba_ell4_time(
+        col_ell: np.ndarray,
+        val_ell: np.ndarray,
+        x_flat: np.ndarray,
+        out_flat: np.ndarray,
+    ) -> None:
+        """
+        Slice-parallel product for exactly four weights per row (bilinear).
+
+        The four terms of each row are written out, so there is no loop over
+        the row and no ``row_len`` lookup. Only valid when every row of the
+        ELLPACK layout holds four weights.
+
+        Parameters
+        ----------
+        col_ell, val_ell : np.ndarray
+            The ELLPACK layout of the weight matrix (2D: n_dst x 4).
+        x_flat : np.ndarray
+            The source data (2D: other x spatial), C-contiguous.
+        out_flat : np.ndarray
+            Preallocated output (2D: other x n_dst), C-contiguous.
+        """
+        n_dst = col_ell.shape[0]
+        for t in numba.prange(x_flat.shape[0]):
+            x_row = x_flat[t]
+            for i in range(n_dst):
+                out_flat[t, i] = (
+                    val_ell[i, 0] * x_row[col_ell[i, 0]]
+                    + val_ell[i, 1] * x_row[col_ell[i, 1]]
+                ) + (
+                    val_ell[i, 2] * x_row[col_ell[i, 2]]
+                    + val_ell[i, 3] * x_row[col_ell[i, 3]]
+                )
+
+    @numba.njit(parallel=True, nogil=True, fastmath={"reassoc", "contract"}, cache=True)
+    def _apply_weights_numba_time(
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        x_flat: np.ndarray,
+        out_flat: np.ndarray,
+    ) -> None:
+        """
+        Slice-parallel CSR sparse matrix product.
+
+        Each thread computes complete non-spatial slices (e.g. time steps),
+        reading one contiguous source row and writing one contiguous output
+        row, with the read-only weights shared across threads.
+
+        Parameters
+        ----------
+        indptr, indices, weights : np.ndarray
+            The CSR triplet of the weight matrix.
+        x_flat : np.ndarray
+            The source data (2D: other x spatial), C-contiguous.
+        out_flat : np.ndarray
+            Preallocated output (2D: other x n_dst), C-contiguous.
+        """
+        n_dst = indptr.shape[0] - 1
+        for t in numba.prange(x_flat.shape[0]):
+            x_row = x_flat[t]
+            for i in range(n_dst):
+                acc = 0.0
+                for j in range(indptr[i], indptr[i + 1]):
+                    acc += weights[j] * x_row[indices[j]]
+                out_flat[t, i] = acc
+
+    @numba.njit(parallel=True, nogil=True, fastmath={"reassoc", "contract"}, cache=True)
+    def _apply_weights_numba_skipna(
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        row_bounds: np.ndarray,
+        x_flat: np.ndarray,
+        out_flat: np.ndarray,
+        wsum_flat: np.ndarray,
+    ) -> None:
+        """
+        Row-parallel CSR sparse matrix-vector product that skips NaNs.
+
+        Computes ``out_flat[t, i] = sum_k weights[k] * x_flat[t, indices[k]]``
+        and ``wsum_flat[t, i] = sum_k weights[k]`` over the non-NaN source
+        values only, in a single pass over the weights and the data.
+
+        Parameters
+        ----------
+        indptr, indices, weights : np.ndarray
+            The CSR triplet of the weight matrix.
+        row_bounds : np.ndarray
+            Row ranges with balanced nonzero counts, one per parallel task
+            (see ``_nnz_row_bounds``).
+        x_flat : np.ndarray
+            The source data (2D: other x spatial), C-contiguous.
+        out_flat : np.ndarray
+            Preallocated output (2D: other x n_dst).
+        wsum_flat : np.ndarray
+            Preallocated sum of valid weights (2D: other x n_dst).
+        """
+        n_other = x_flat.shape[0]
+        for p in numba.prange(row_bounds.shape[0] - 1):
+            for i in range(row_bounds[p], row_bounds[p + 1]):
+                for t in range(n_other):
+                    acc = 0.0
+                    acc_w = 0.0
+                    for j in range(indptr[i], indptr[i + 1]):
+                        v = x_flat[t, indices[j]]
+                        if not np.isnan(v):
+                            acc += weights[j] * v
+                            acc_w += weights[j]
+                    out_flat[t, i] = acc
+                    wsum_flat[t, i] = acc_w
+
+    @numba.njit(parallel=True, nogil=True, fastmath={"reassoc", "contract"}, cache=True)
+    def _apply_weights_numba_skipna_batched(
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        row_bounds: np.ndarray,
+        x_t: np.ndarray,
+        out_t: np.ndarray,
+        wsum_t: np.ndarray,
+    ) -> None:
+        """
+        NaN-skipping CSR product with the batch (non-spatial) axis last.
+
+        Batched counterpart of ``_apply_weights_numba_skipna``: each weight
+        and column index is loaded once for all slices.
+
+        Parameters
+        ----------
+        indptr, indices, weights : np.ndarray
+            The CSR triplet of the weight matrix.
+        row_bounds : np.ndarray
+            Row ranges with balanced nonzero counts, one per parallel task
+            (see ``_nnz_row_bounds``).
+        x_t : np.ndarray
+            The source data (2D: spatial x other), C-contiguous.
+        out_t : np.ndarray
+            Preallocated output (2D: n_dst x other).
+        wsum_t : np.ndarray
+            Preallocated sum of valid weights (2D: n_dst x other).
+        """
+        n_batch = x_t.shape[1]
+        for p in numba.prange(row_bounds.shape[0] - 1):
+            for i in range(row_bounds[p], row_bounds[p + 1]):
+                for t in range(n_batch):
+                    out_t[i, t] = 0.0
+                    wsum_t[i, t] = 0.0
+                for j in range(indptr[i], indptr[i + 1]):
+                    w = weights[j]
+                    col = indices[j]
+                    for t in range(n_batch):
+                        v = x_t[col, t]
+                        if not np.isnan(v):
+                            out_t[i, t] += w * v
+                            wsum_t[i, t] += w
+
+else:
+    _apply_weights_numba = None
+    _apply_weights_numba_batched = None
+    _apply_weights_numba_ell = None
+    _apply_weights_numba_ell_row = None
+    _apply_weights_numba_ell_time = None
+    _apply_weights_numba_ell4_time = None
+    _apply_weights_numba_time = None
+    _apply_weights_numba_skipna = None
+    _apply_weights_numba_skipna_batched = None
+
+
+# Minimum number of non-spatial slices per Numba thread for which slices,
+# rather than destination rows, are distributed across threads
+_TIME_PARALLEL_MIN_SLICES = 4
+
+# Minimum number of non-spatial slices for which the NaN-skipping product is
+# computed with the batch axis innermost
+_SKIPNA_BATCHED_MIN_SLICES = 4
+
+# Limits for storing weights in the fixed-width ELLPACK layout: the widest
+# row, and the minimum fraction of stored weights among the padded slots
+_ELL_MAX_WIDTH = 16
+_ELL_MIN_FILL = 0.75
+
+# Minimum number of non-spatial slices for which the ELLPACK product is
+# computed with the batch axis innermost
+_ELL_BATCHED_MIN_SLICES = 3
+
+# Layouts derived from weight matrices (ELLPACK arrays, row partitions),
+# keyed by id() and kind, and validated by weakref
+_LAYOUT_CACHE: dict = {}
+
+# The default 'workqueue' threading layer of Numba is not thread-safe, so
+# concurrent kernel launches (e.g. from the Dask threaded scheduler) are
+# serialized unless a thread-safe layer (tbb/omp) is active.
+_NUMBA_LOCK = threading.Lock()
+_NUMBA_THREADSAFE: Optional[bool] = None
+
+
+def _numba_threadsafe() -> bool:
+    """
+    Check whether the active Numba threading layer supports concurrent launches.
+
+    Returns
+    -------
+    bool
+        True if the threading layer is 'tbb' or 'omp'.
+    """
+    global _NUMBA_THREADSAFE
+    if _NUMBA_THREADSAFE is None:
+        try:
+            layer = numba.threading_layer()
+        except ValueError:
+            # Threading layer is only selected after the first parallel launch
+            return False
+        _NUMBA_THREADSAFE = layer in ("tbb", "omp")
+    return _NUMBA_THREADSAFE
+
+
+def _launch_numba(kernel: Any, *args: Any) -> None:
+    """
+    Launch a Numba kernel, serializing launches if the threading layer requires it.
+
+    Parameters
+    ----------
+    kernel : Any
+        The compiled Numba kernel.
+    *args : Any
+        Arguments forwarded to the kernel.
+    """
+    if _numba_threadsafe():
+        kernel(*args)
+    else:
+        with _NUMBA_LOCK:
+            kernel(*args)
+
+
+def _nnz_row_bounds(indptr: np.ndarray, n_parts: int) -> np.ndarray:
+    """
+    Partition CSR rows into contiguous ranges with balanced nonzero counts.
+
+    Parameters
+    ----------
+    indptr : np.ndarray
+        The CSR row pointer array.
+    n_parts : int
+        The requested number of ranges.
+
+    Returns
+    -------
+    np.ndarray
+        Monotonic row boundaries; range ``p`` is ``[bounds[p], bounds[p + 1])``.
+    """
+    n_rows = indptr.shape[0] - 1
+    n_parts = max(1, min(n_parts, n_rows))
+    targets = np.linspace(0, indptr[-1], n_parts + 1)
+    bounds = np.searchsorted(indptr, targets, side="left").astype(np.int64)
+    bounds[0] = 0
+    bounds[-1] = n_rows
+    return np.maximum.accumulate(bounds)
+
+
+def _matrix_layout(matrix: Any, kind: str, build: Any, *args: Any) -> Any:
+    """
+    Get a layout derived from a CSR matrix, building it once per matrix.
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.csr_matrix
+        The sparse weight matrix.
+    kind : str
+        Name of the layout, part of the cache key.
+    build : callable
+        Builds the layout as ``build(matrix, *args)``.
+    *args : Any
+        Hashable build arguments, part of the cache key.
+
+    Returns
+    -------
+    Any
+        The cached or newly built layout. Entries are rebuilt if the CSR
+        arrays of the matrix were replaced, and dropped with the matrix.
+    """
+    key = (id(matrix), kind) + args
+    entry = _LAYOUT_CACHE.get(key)
+    if (
+        entry is not None
+        and entry[0]() is matrix
+        and entry[1] is matrix.data
+        and entry[2] is matrix.indices
+        and entry[3] is matrix.indptr
+    ):
+        return entry[4]
+
+    layout = build(matrix, *args)
+    ref = weakref.ref(matrix, lambda _, key=key: _LAYOUT_CACHE.pop(key, None))
+    _LAYOUT_CACHE[key] = (ref, matrix.data, matrix.indices, matrix.indptr, layout)
+    return layout
+
+
+def _row_bounds(matrix: Any, n_parts: int) -> np.ndarray:
+    """
+    Get the nonzero-balanced row partition of a CSR matrix (cached).
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.csr_matrix
+        The sparse weight matrix.
+    n_parts : int
+        The requested number of ranges.
+
+    Returns
+    -------
+    np.ndarray
+        Row boundaries as returned by ``_nnz_row_bounds``.
+    """
+    return _matrix_layout(
+        matrix, "row_bounds", lambda m, n: _nnz_row_bounds(m.indptr, n), n_parts
+    )
+
+
+def _row_weight_sums(matrix: Any) -> np.ndarray:
+    """
+    Get the sum of the weights of each destination row (cached).
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.csr_matrix
+        The sparse weight matrix.
+
+    Returns
+    -------
+    np.ndarray
+        The 1D row sums, in the dtype of the weights. The array is shared
+        between calls and must not be modified.
+    """
+    return _matrix_layout(matrix, "row_sums", _build_row_weight_sums)
+
+
+def _build_row_weight_sums(matrix: Any) -> np.ndarray:
+    """
+    Sum the weights of each CSR row in one O(nnz) pass (see ``_row_weight_sums``).
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.csr_matrix
+        The sparse weight matrix.
+
+    Returns
+    -------
+    np.ndarray
+        The 1D row sums; zero for rows without weights.
+    """
+    sums = np.zeros(matrix.shape[0], dtype=matrix.dtype)
+    starts = matrix.indptr[:-1]
+    nonempty = starts < matrix.indptr[1:]
+    if matrix.nnz:
+        # Dropping empty rows leaves the segment boundaries unchanged
+        sums[nonempty] = np.add.reduceat(matrix.data, starts[nonempty])
+    sums.setflags(write=False)
+    return sums
+
+
+def _can_use_numba(matrix: Any, data: Any) -> bool:
+    """
+    Check whether the Numba CSR kernel can be used for a given product.
+
+    Parameters
+    ----------
+    matrix : Any
+        The sparse weight matrix.
+    data : Any
+        The dense data array.
+
+    Returns
+    -------
+    bool
+        True if Numba is available, the matrix is a SciPy CSR matrix and
+        the data is a 2D floating point NumPy array.
+    """
+    return (
+        _apply_weights_numba is not None
+        and scipy.sparse.issparse(matrix)
+        and matrix.format == "csr"
+        and isinstance(data, np.ndarray)
+        and data.ndim == 2
+        and data.dtype.kind == "f"
+        and matrix.dtype.kind == "f"
+    )
+
+
+def _ell_layout(
+    matrix: Any,
+) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Get the ELLPACK (fixed-width) layout of a CSR matrix with short rows.
+
+    Matrices whose rows all hold a few weights (bilinear: 4, patch: up to 16)
+    are stored as ``(n_dst, width)`` column/value arrays plus the number of
+    weights per row (ELLPACK-R). Rows shorter than ``width`` are padded, but
+    the padding is never read. When all rows have the same length the CSR
+    arrays are reshaped without copying. Layouts are cached per matrix, so
+    the padding is built once per weight matrix rather than once per call.
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.csr_matrix
+        The sparse weight matrix.
+
+    Returns
+    -------
+    tuple of np.ndarray or None
+        (col_ell, val_ell, row_len), or None if the rows are too long or too
+        uneven for a compact fixed-width layout.
+    """
+    return _matrix_layout(matrix, "ell", _build_ell_layout)
+
+
+def _build_ell_layout(
+    matrix: Any,
+) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Build the ELLPACK layout of a CSR matrix (see ``_ell_layout``).
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.csr_matrix
+        The sparse weight matrix.
+
+    Returns
+    -------
+    tuple of np.ndarray or None
+        (col_ell, val_ell, row_len), or None if no compact layout exists.
+    """
+    n_dst = matrix.shape[0]
+    row_len = np.diff(matrix.indptr)
+    width = int(row_len.max()) if n_dst else 0
+    if (
+        width == 0
+        or width > _ELL_MAX_WIDTH
+        or matrix.nnz < _ELL_MIN_FILL * (n_dst * width)
+    ):
+        layout = None
+    elif matrix.nnz == n_dst * width:
+        layout = (
+            matrix.indices.reshape(n_dst, width),
+            matrix.data.reshape(n_dst, width),
+            row_len,
+        )
+    else:
+        slots = np.arange(width) < row_len[:, None]
+        col_ell = np.zeros((n_dst, width), dtype=matrix.indices.dtype)
+        val_ell = np.zeros((n_dst, width), dtype=matrix.dtype)
+        col_ell[slots] = matrix.indices
+        val_ell[slots] = matrix.data
+        layout = (col_ell, val_ell, row_len)
+    return layout
+
+
+def _gather_layout(matrix: Any) -> Optional[np.ndarray]:
+    """
+    Get the source index of each destination point of a selection matrix.
+
+    Matrices with exactly one weight of 1.0 per row (identical grids,
+    nearest neighbour without unmapped points) only pick source values, so
+    they are applied as an index gather instead of a sparse product. The
+    result is identical, since ``1.0 * x == x`` for every value of ``x``.
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.csr_matrix
+        The sparse weight matrix.
+
+    Returns
+    -------
+    np.ndarray or None
+        The column index of each row, or None if the matrix is not a
+        selection matrix. The array is shared between calls.
+    """
+    return _matrix_layout(matrix, "gather", _build_gather_layout)
+
+
+def _build_gather_layout(matrix: Any) -> Optional[np.ndarray]:
+    """
+    Build the gather indices of a selection matrix (see ``_gather_layout``).
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.csr_matrix
+        The sparse weight matrix.
+
+    Returns
+    -------
+    np.ndarray or None
+        The column index of each row, or None if the matrix is not a
+        selection matrix.
+    """
+    n_dst = matrix.shape[0]
+    if (
+        n_dst == 0
+        or matrix.nnz != n_dst
+        or not np.array_equal(matrix.indptr, np.arange(n_dst + 1))
+        or not (matrix.data == 1).all()
+    ):
+        return None
+    return matrix.indices
+
+
+def _weights_to_gpu(matrix: Any) -> Any:
+    """
+    Transfer a sparse weight matrix to the GPU.
+
+    The returned matrix can be stored in the worker cache so the weights stay
+    resident on the device across calls; ``_matmul`` then only transfers the
+    data blocks.
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.spmatrix
+        The sparse weight matrix.
+
+    Returns
+    -------
+    cupyx.scipy.sparse.csr_matrix
+        The weight matrix in device memory.
+
+    Raises
+    ------
+    ImportError
+        If CuPy is not installed.
+    """
+    if cupy is None:
+        raise ImportError("CuPy is required for GPU weight application.")
+    return cupyx.scipy.sparse.csr_matrix(matrix.tocsr())
+
+
+def _drop_masked_columns(matrix: Any, mask: np.ndarray) -> Any:
+    """
+    Remove the weights of masked source points from a sparse weight matrix.
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.spmatrix
+        The sparse weight matrix (n_dst x n_src).
+    mask : np.ndarray
+        Boolean mask of length n_src, True where the source point is invalid.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        A CSR matrix with the same shape and no entries in masked columns.
+    """
+    matrix = matrix.tocsr()
+    keep = np.logical_not(mask[matrix.indices])
+    n_dst = matrix.shape[0]
+    rows = np.repeat(np.arange(n_dst), np.diff(matrix.indptr))
+    row_counts = np.bincount(rows[keep], minlength=n_dst)
+    indptr = np.zeros_like(matrix.indptr)
+    np.cumsum(row_counts, out=indptr[1:])
+    return scipy.sparse.csr_matrix(
+        (matrix.data[keep], matrix.indices[keep], indptr), shape=matrix.shape
+    )
+
+
+def _matmul(
+    matrix: Any, data: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
     Backend-agnostic matrix multiplication (matrix @ data.T).T.
 
     Handles both NumPy and CuPy backends and ensures a NumPy array is returned.
+    If Numba is installed, SciPy CSR matrices applied to floating point
+    NumPy data are dispatched to a row-parallel CSR kernel. Multiple
+    non-spatial slices are processed in a single SpMM pass, and matrices
+    with few weights per row (e.g. bilinear) use ELLPACK kernels. With many
+    slices per thread, whole slices are distributed across threads.
+    Selection matrices (one weight of 1.0 per row) are applied as an index
+    gather.
 
     Parameters
     ----------
@@ -40,18 +823,170 @@ def _matmul(matrix: Any, data: np.ndarray) -> np.ndarray:
         The sparse weight matrix.
     data : np.ndarray
         The dense data array (2D: other x spatial).
+    out : np.ndarray, optional
+        Preallocated output array (2D: other x n_dst). If given, the result
+        is written into it (cast to its dtype) and it is returned.
 
     Returns
     -------
     np.ndarray
         The result of (matrix @ data.T).T as a NumPy array.
     """
-    res = (matrix @ data.T).T
-    if hasattr(res, "get"):
-        return res.get()
+    if isinstance(data, np.ndarray) and data.dtype == np.float16:
+        # Half precision is a storage format only: neither SciPy nor Numba
+        # provide float16 arithmetic, so accumulate in float32.
+        data = data.astype(np.float32)
+
+    gather = None
+    if (
+        scipy.sparse.issparse(matrix)
+        and matrix.format == "csr"
+        and isinstance(data, np.ndarray)
+        and data.ndim == 2
+    ):
+        gather = _gather_layout(matrix)
+
+    if gather is not None:
+        # Selection matrix: a contiguous index gather per slice
+        out_dtype = np.result_type(matrix.dtype, data.dtype)
+        if (
+            out is not None
+            and out.dtype == out_dtype
+            and out.shape == (data.shape[0], matrix.shape[0])
+        ):
+            res = np.take(data, gather, axis=1, out=out)
+        else:
+            res = np.take(data, gather, axis=1).astype(out_dtype, copy=False)
+    elif _can_use_numba(matrix, data):
+        out_dtype = np.result_type(matrix.dtype, data.dtype)
+        # Oversubscribe the threads so that uneven ranges still balance out
+        row_bounds = _row_bounds(matrix, 4 * numba.get_num_threads())
+        triplet = (matrix.indptr, matrix.indices, matrix.data, row_bounds)
+        n_other = data.shape[0]
+        n_dst = matrix.shape[0]
+        if (
+            out is not None
+            and out.dtype == out_dtype
+            and out.shape == (n_other, n_dst)
+            and out.flags.c_contiguous
+        ):
+            # Row-major kernels write straight into the caller's buffer
+            out_flat = out
+        else:
+            out_flat = None
+
+        ell = _ell_layout(matrix)
+        if n_other >= _TIME_PARALLEL_MIN_SLICES * numba.get_num_threads():
+            # Enough slices to keep every thread busy with whole slices
+            x_flat = np.ascontiguousarray(data)
+            if out_flat is None:
+                out_flat = np.empty((n_other, n_dst), dtype=out_dtype)
+            if ell is not None and ell[0].shape[1] == 4 and matrix.nnz == 4 * n_dst:
+                # Exactly four weights in every row (bilinear, all points mapped)
+                _launch_numba(
+                    _apply_weights_numba_ell4_time, *ell[:2], x_flat, out_flat
+                )
+            elif ell is not None:
+                _launch_numba(_apply_weights_numba_ell_time, *ell, x_flat, out_flat)
+            else:
+                _launch_numba(
+                    _apply_weights_numba_time,
+                    matrix.indptr,
+                    matrix.indices,
+                    matrix.data,
+                    x_flat,
+                    out_flat,
+                )
+            res = out_flat
+        elif ell is not None and n_other < _ELL_BATCHED_MIN_SLICES:
+            # Short rows, few slices: ELLPACK rows accumulated in registers
+            x_flat = np.ascontiguousarray(data)
+            if out_flat is None:
+                out_flat = np.empty((n_other, n_dst), dtype=out_dtype)
+            _launch_numba(_apply_weights_numba_ell_row, *ell, x_flat, out_flat)
+            res = out_flat
+        elif ell is not None:
+            # Short rows: fixed-width ELLPACK layout without indptr indirection
+            x_t = np.ascontiguousarray(data.T)
+            out_t = np.empty((n_dst, n_other), dtype=out_dtype)
+            _launch_numba(_apply_weights_numba_ell, *ell, x_t, out_t)
+            res = out_t.T
+        elif n_other == 1:
+            x_flat = np.ascontiguousarray(data)
+            if out_flat is None:
+                out_flat = np.empty((1, n_dst), dtype=out_dtype)
+            _launch_numba(_apply_weights_numba, *triplet, x_flat, out_flat)
+            res = out_flat
+        else:
+            # Multiple slices: one SpMM pass with the batch axis innermost
+            x_t = np.ascontiguousarray(data.T)
+            out_t = np.empty((n_dst, n_other), dtype=out_dtype)
+            _launch_numba(_apply_weights_numba_batched, *triplet, x_t, out_t)
+            res = out_t.T
+    else:
+        if (
+            cupy is not None
+            and cupyx.scipy.sparse.issparse(matrix)
+            and isinstance(data, np.ndarray)
+        ):
+            # Device-resident weights: only the data block is transferred
+            data = cupy.asarray(data)
+        res = (matrix @ data.T).T
+        if hasattr(res, "get"):
+            res = res.get()
+
+    if out is not None:
+        if res is not out:
+            np.copyto(out, res, casting="same_kind")
+        return out
     return res
 
 
+def _matmul_skipna(
+    matrix: Any, data: np.ndarray
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Apply weights while skipping NaNs, with one fused Numba pass.
+
+    Parameters
+    ----------
+    matrix : Any
+        The sparse weight matrix.
+    data : np.ndarray
+        The dense data array (2D: other x spatial).
+
+    Returns
+    -------
+    tuple of np.ndarray or None
+        The weighted sums of the valid values and the sums of their weights
+        (both 2D: other x n_dst), or None if the Numba kernel cannot be used.
+    """
+    if isinstance(data, np.ndarray) and data.dtype == np.float16:
+        data = data.astype(np.float32)
+    if _apply_weights_numba_skipna is None or not _can_use_numba(matrix, data):
+        return None
+
+    n_other = data.shape[0]
+    n_dst = matrix.shape[0]
+    out_dtype = np.result_type(matrix.dtype, data.dtype)
+    row_bounds = _row_bounds(matrix, 4 * numba.get_num_threads())
+    triplet = (matrix.indptr, matrix.indices, matrix.data, row_bounds)
+    if n_other >= _SKIPNA_BATCHED_MIN_SLICES:
+        values = np.empty((n_dst, n_other), dtype=out_dtype)
+        weights_sum = np.empty((n_dst, n_other), dtype=matrix.dtype)
+        x_t = np.ascontiguousarray(data.T)
+        _launch_numba(
+            _apply_weights_numba_skipna_batched, *triplet, x_t, values, weights_sum
+        )
+        return values.T, weights_sum.T
+
+    values = np.empty((n_other, n_dst), dtype=out_dtype)
+    weights_sum = np.empty((n_other, n_dst), dtype=matrix.dtype)
+    x_flat = np.ascontiguousarray(data)
+    _launch_numba(_apply_weights_numba_skipna, *triplet, x_flat, values, weights_sum)
+    return values, weights_sum
+
+
 def _apply_weights_core(
     data_block: np.ndarray,
     weights_matrix: Any,
@@ -61,6 +996,7 @@ def _apply_weights_core(
     total_weights: Optional[np.ndarray] = None,
     na_thres: float = 1.0,
     weights_key: Optional[str] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Apply regridding weights to a data block (NumPy array).
@@ -83,11 +1019,14 @@ def _apply_weights_core(
         Threshold for NaN handling.
     weights_key : str, optional
         Explicit key for the weights in the worker cache.
+    out : np.ndarray, optional
+        Preallocated, C-contiguous output array with the shape and dtype of
+        the regridded block. If given, the result is written into it.
 
     Returns
     -------
     np.ndarray
-        The regridded data block.
+        The regridded data block (``out`` if provided).
     """
     # Worker-local cache retrieval
     weights_matrix_key = weights_key
@@ -122,6 +1061,13 @@ def _apply_weights_core(
     else:
         flat_data = data_block.reshape(n_other, n_spatial)
 
+    flat_out = None
+    if out is not None:
+        # Reshape of a C-contiguous array is a view, so results land in `out`
+        if not out.flags.c_contiguous:
+            raise ValueError("The `out` array must be C-contiguous.")
+        flat_out = out.reshape(n_other, -1)
+
     if skipna:
         # Use a more memory-efficient NaN detection
         mask = np.isnan(flat_data)
@@ -129,7 +1075,7 @@ def _apply_weights_core(
 
         if not has_nans:
             # Fast path: No NaNs in this data block
-            result = _matmul(weights_matrix, flat_data)
+            result = _matmul(weights_matrix, flat_data, out=flat_out)
             if total_weights is not None:
                 with np.errstate(divide="ignore", invalid="ignore"):
                     result /= total_weights
@@ -145,49 +1091,66 @@ def _apply_weights_core(
                 if not np.all(mask[:, :sample_size] == mask0[:sample_size]):
                     is_mask_stationary = False
                 else:
-                    for i in range(1, n_other):
-                        if not np.array_equal(mask[i], mask0):
-                            is_mask_stationary = False
-                            break
+                    # One broadcast comparison over all slices instead of a
+                    # Python-level loop of per-slice comparisons, comparing
+                    # eight mask bytes at a time when the row length allows
+                    rows = mask
+                    if n_spatial % 8 == 0 and mask.flags.c_contiguous:
+                        rows = mask.view(np.uint64)
+                    is_mask_stationary = bool((rows[1:] == rows[0]).all())
 
             zero = flat_data.dtype.type(0)
             if is_mask_stationary:
-                # Memory win: Use broadcasting for the stationary mask
+                # Optimization: Cache the stationary mask products to avoid redundant
+                # work across multiple Dask chunks (e.g. different time segments).
                 mask = mask[0:1]
-                safe_data = np.where(mask, zero, flat_data)
-            else:
-                safe_data = np.where(mask, zero, flat_data)
-
-            result = _matmul(weights_matrix, safe_data)
-
-            if is_mask_stationary:
-                # Optimization: Cache the stationary weights_sum to avoid redundant sparse matmuls
-                # across multiple Dask chunks (e.g. different time segments).
                 weights_sum = None
+                masked_weights = None
                 if weights_matrix_key:
                     ws_cache_key = f"ws_{weights_matrix_key}"
                     mask_cache_key = f"mask_{weights_matrix_key}"
+                    wm_cache_key = f"wm_{weights_matrix_key}"
 
                     if ws_cache_key in _WORKER_CACHE:
                         # Validate that the mask is identical to the cached one
                         cached_mask = _WORKER_CACHE.get(mask_cache_key)
-                        if np.array_equal(mask[0:1], cached_mask):
+                        if np.array_equal(mask, cached_mask):
                             weights_sum = _WORKER_CACHE[ws_cache_key]
+                            masked_weights = _WORKER_CACHE.get(wm_cache_key)
+
+                if masked_weights is None and scipy.sparse.issparse(weights_matrix):
+                    masked_weights = _drop_masked_columns(weights_matrix, mask[0])
+
+                if masked_weights is not None:
+                    # Masked columns carry no weights, so NaNs are never read and
+                    # the data does not need to be copied with zeros filled in.
+                    result = _matmul(masked_weights, flat_data)
+                else:
+                    result = _matmul(weights_matrix, np.where(mask, zero, flat_data))
 
                 if weights_sum is None:
                     # Compute normalization only for the first (representative) mask
                     # Use float32 for normalization weights to save memory on large grids
-                    valid_mask_single = np.logical_not(mask[0:1]).astype(np.float32)
+                    valid_mask_single = np.logical_not(mask).astype(np.float32)
                     weights_sum = _matmul(weights_matrix, valid_mask_single)
 
                     if weights_matrix_key:
                         _WORKER_CACHE[ws_cache_key] = weights_sum
-                        _WORKER_CACHE[mask_cache_key] = mask[0:1].copy()
+                        _WORKER_CACHE[mask_cache_key] = mask.copy()
+                        if masked_weights is not None:
+                            _WORKER_CACHE[wm_cache_key] = masked_weights
             else:
-                # Sum weights of valid (non-NaN) points for each slice
-                # We use float32 to keep peak memory down for ~1km grids
-                valid_mask = np.logical_not(mask).astype(np.float32)
-                weights_sum = _matmul(weights_matrix, valid_mask)
+                # Values and valid weights in one pass, without a filled copy
+                fused = _matmul_skipna(weights_matrix, flat_data)
+                if fused is not None:
+                    result, weights_sum = fused
+                else:
+                    result = _matmul(weights_matrix, np.where(mask, zero, flat_data))
+
+                    # Sum weights of valid (non-NaN) points for each slice
+                    # We use float32 to keep peak memory down for ~1km grids
+                    valid_mask = np.logical_not(mask).astype(np.float32)
+                    weights_sum = _matmul(weights_matrix, valid_mask)
 
             with np.errstate(divide="ignore", invalid="ignore"):
                 result /= weights_sum
@@ -201,7 +1164,11 @@ def _apply_weights_core(
                     )
     else:
         # Standard path (skipna=False): Just apply weights
-        result = _matmul(weights_matrix, flat_data)
+        result = _matmul(weights_matrix, flat_data, out=flat_out)
 
     new_shape = other_dims_shape + shape_target
+    if out is not None:
+        if result is not flat_out:
+            np.copyto(out, result.reshape(new_shape), casting="same_kind")
+        return out
     return result.reshape(new_shape).astype(data_block.dtype, copy=False)
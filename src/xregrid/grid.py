@@ -8,6 +8,26 @@ import xarray as xr
 
 from .utils import _find_coord
 
+# Dimension names treated as time or vertical axes
+_NON_SPATIAL_DIM_NAMES = frozenset(
+    {
+        "time",
+        "t",
+        "tden",
+        "time_counter",
+        "t_step",
+        "lev",
+        "level",
+        "depth",
+        "pressure",
+        "sigma",
+        "pres",
+        "height",
+        "altitude",
+        "z",
+    }
+)
+
 
 def _get_non_spatial_dims(ds: xr.Dataset) -> set[str]:
     """
@@ -25,47 +45,49 @@ def _get_non_spatial_dims(ds: xr.Dataset) -> set[str]:
     """
     non_spatial_dims = set()
 
-    # 1. Use cf-xarray axes
+    # 1. Use cf-xarray axes (one scan of the dataset)
     try:
-        # Time axis
-        if "T" in ds.cf.axes:
-            non_spatial_dims.update(ds.cf.axes["T"])
-        # Vertical axis
-        if "Z" in ds.cf.axes:
-            non_spatial_dims.update(ds.cf.axes["Z"])
+        axes = ds.cf.axes
+        non_spatial_dims.update(axes.get("T", ()))
+        non_spatial_dims.update(axes.get("Z", ()))
     except (KeyError, AttributeError):
         pass
 
     # 2. Heuristics based on dimension names
-    time_names = ["time", "t", "tden", "time_counter", "t_step"]
-    vert_names = [
-        "lev",
-        "level",
-        "depth",
-        "pressure",
-        "sigma",
-        "pres",
-        "height",
-        "altitude",
-        "z",
-    ]
-
+    coords = ds.coords
     for dim in ds.dims:
-        dim_lower = str(dim).lower()
-        if dim_lower in time_names or dim_lower in vert_names:
+        if str(dim).lower() in _NON_SPATIAL_DIM_NAMES:
             non_spatial_dims.add(str(dim))
 
         # 3. Dtype check for time if it's a coordinate
-        if dim in ds.coords:
-            dtype = ds[dim].dtype
-            if np.issubdtype(dtype, np.datetime64) or np.issubdtype(
-                dtype, np.timedelta64
-            ):
-                non_spatial_dims.add(str(dim))
+        elif dim in coords and coords[dim].dtype.kind in "mM":
+            non_spatial_dims.add(str(dim))
 
     return non_spatial_dims
 
 
+def _update_grid_digest(digest: Any, ds: xr.Dataset, bounds: bool = False) -> None:
+    """
+    Feed the spatial layout and coordinates of a grid into a hash digest.
+
+    Parameters
+    ----------
+    digest : hashlib hash object
+        The digest to update (e.g. ``hashlib.blake2b()``).
+    ds : xr.Dataset
+        The grid dataset.
+    bounds : bool, default False
+        Whether to include the cell bounds (needed for conservative methods).
+    """
+    lon, lat, shape, dims, _ = _get_mesh_info(ds)
+    arrays = [lat.values, lon.values]
+    if bounds:
+        arrays.extend(b for b in _get_grid_bounds(ds) if b is not None)
+    digest.update(repr((shape, dims)).encode())
+    for arr in arrays:
+        digest.update(np.ascontiguousarray(arr, dtype=np.float64).view(np.uint8))
+
+
 def _get_mesh_info(
     ds: xr.Dataset,
 ) -> Tuple[xr.DataArray, xr.DataArray, Tuple[int, ...], Tuple[str, ...], bool]:
@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+# Sentinel distance; kept finite so the fastmath kernels never see infinities
+_FAR = 1.0e30
+
+
+def _unit_xyz(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """
+    Project latitude/longitude (degrees) onto the unit sphere.
+
+    Parameters
+    ----------
+    lat, lon : np.ndarray
+        Coordinates in degrees (1D).
+
+    Returns
+    -------
+    np.ndarray
+        Cartesian coordinates (n x 3). Chord distances between these points
+        are monotonic in great-circle distance.
+    """
+    lat_r = np.deg2rad(lat)
+    lon_r = np.deg2rad(lon)
+    cos_lat = np.cos(lat_r)
+    return np.stack(
+        [cos_lat * np.cos(lon_r), cos_lat * np.sin(lon_r), np.sin(lat_r)], axis=1
+    )
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath={"reassoc", "contract"}, cache=True)
+    def _nearest_bucket_query(
+        cell_start: np.ndarray,
+        cell_items: np.ndarray,
+        src_xyz: np.ndarray,
+        lat0: float,
+        dlat: float,
+        n_lat: int,
+        lon0: float,
+        dlon: float,
+        n_lon: int,
+        wrap: bool,
+        tgt_lat: np.ndarray,
+        tgt_lon: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        """
+        Exact nearest source site for each target point using bucket rings.
+
+        For every target the window of buckets around its own bucket is grown
+        (doubling the ring radius) until the closest site found is nearer
+        than a lower bound on the great-circle distance to any bucket outside
+        the window.
+
+        Parameters
+        ----------
+        cell_start, cell_items : np.ndarray
+            CSR-style bucket table: the sites of bucket ``c`` are
+            ``cell_items[cell_start[c]:cell_start[c + 1]]``.
+        src_xyz : np.ndarray
+            Unit-sphere coordinates of all source sites (n_src x 3).
+        lat0, dlat, n_lat : float, float, int
+            Latitude origin, bucket size and number of bucket rows (degrees).
+        lon0, dlon, n_lon : float, float, int
+            Longitude origin, bucket size and number of bucket columns
+            (degrees).
+        wrap : bool
+            Whether the bucket columns span the full circle of longitude.
+        tgt_lat, tgt_lon : np.ndarray
+            Target coordinates in degrees, longitudes relative to the bucket
+            origin.
+        out : np.ndarray
+            Output source index per target, -1 if none was found.
+        """
+        deg = np.pi / 180.0
+        for t in numba.prange(tgt_lat.shape[0]):
+            phi = tgt_lat[t]
+            lam = tgt_lon[t]
+            out[t] = -1
+            if np.isnan(phi) or np.isnan(lam):
+                continue
+            cos_phi = np.cos(phi * deg)
+            tx = cos_phi * np.cos((lam + lon0) * deg)
+            ty = cos_phi * np.sin((lam + lon0) * deg)
+            tz = np.sin(phi * deg)
+            iy = min(max(int(np.floor((phi - lat0) / dlat)), 0), n_lat - 1)
+            ix = min(max(int(np.floor(lam / dlon)), 0), n_lon - 1)
+
+            r = 1
+            while True:
+                r0 = max(iy - r, 0)
+                r1 = min(iy + r, n_lat - 1)
+                # Widen the longitude window towards the poles, where buckets
+                # of constant angular size shrink, to keep it roughly square
+                edge = max(abs(lat0 + r0 * dlat), abs(lat0 + (r1 + 1) * dlat))
+                shrink = max(np.cos(min(edge, 90.0) * deg), 1.0 / n_lon)
+                w = min(int(np.ceil(r / shrink)), n_lon)
+                full_lon = wrap and 2 * w + 1 >= n_lon
+                if full_lon:
+                    c0 = 0
+                    c1 = n_lon - 1
+                elif wrap:
+                    c0 = ix - w
+                    c1 = ix + w
+                else:
+                    c0 = max(ix - w, 0)
+                    c1 = min(ix + w, n_lon - 1)
+
+                best = _FAR
+                best_j = -1
+                for row in range(r0, r1 + 1):
+                    for c in range(c0, c1 + 1):
+                        cell = row * n_lon + (c % n_lon)
+                        for k in range(cell_start[cell], cell_start[cell + 1]):
+                            j = cell_items[k]
+                            dx = src_xyz[j, 0] - tx
+                            dy = src_xyz[j, 1] - ty
+                            dz = src_xyz[j, 2] - tz
+                            d = dx * dx + dy * dy + dz * dz
+                            if d < best or (d == best and j < best_j):
+                                best = d
+                                best_j = j
+
+                # Lower bound (degrees of arc) to every bucket outside the window
+                bound = _FAR
+                if r0 > 0:
+                    bound = min(bound, phi - (lat0 + r0 * dlat))
+                if r1 < n_lat - 1:
+                    bound = min(bound, lat0 + (r1 + 1) * dlat - phi)
+                if not full_lon:
+                    gap = _FAR
+                    if wrap or c0 > 0:
+                        gap = min(gap, lam - c0 * dlon)
+                    if wrap or c1 < n_lon - 1:
+                        gap = min(gap, (c1 + 1) * dlon - lam)
+                    if gap < _FAR:
+                        # Distance to the nearest meridian at a longitude offset
+                        gap = min(max(gap, 0.0), 90.0)
+                        bound = min(bound, np.arcsin(cos_phi * np.sin(gap * deg)) / deg)
+                if bound >= _FAR:
+                    break
+                chord = 2.0 * np.sin(max(bound, 0.0) * deg / 2.0)
+                if best_j >= 0 and best <= chord * chord:
+                    break
+                r *= 2
+            out[t] = best_j
+
+else:
+    _nearest_bucket_query = None
+
+
+class _NearestS2DBucketIndex:
+    """
+    Uniform latitude/longitude bucket index over a cloud of source sites.
+
+    Sites are binned into buckets sized to hold a few sites each and stored
+    in a CSR-style table. A query only scans the buckets around each target
+    point, so the expected cost per target is constant instead of linear in
+    the number of sites. Distances are great-circle distances.
+
+    Parameters
+    ----------
+    lat, lon : np.ndarray
+        Source site coordinates in degrees (1D).
+    valid : np.ndarray, optional
+        Boolean mask of sites that may be returned (e.g. unmasked sites).
+    sites_per_bucket : float, default 2.5
+        Target mean number of sites per bucket.
+    """
+
+    def __init__(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        valid: Optional[np.ndarray] = None,
+        sites_per_bucket: float = 2.5,
+    ) -> None:
+        if _nearest_bucket_query is None:
+            raise ImportError("The nearest-neighbor bucket index requires numba.")
+
+        lat = np.asarray(lat, dtype=np.float64).ravel()
+        lon = np.asarray(lon, dtype=np.float64).ravel() % 360.0
+        keep = np.isfinite(lat) & np.isfinite(lon)
+        if valid is not None:
+            keep &= np.asarray(valid, dtype=bool).ravel()
+        sites = np.flatnonzero(keep)
+        lat_s, lon_s = lat[sites], lon[sites]
+
+        self.src_xyz = _unit_xyz(lat, lon)
+
+        if sites.size:
+            # Pick the longitude origin giving the narrowest extent, so that
+            # regional clouds across the dateline get a compact bucket box
+            lon_alt = (lon_s + 180.0) % 360.0 - 180.0
+            if np.ptp(lon_alt) < np.ptp(lon_s):
+                lon0, lon_span = lon_alt.min(), np.ptp(lon_alt)
+            else:
+                lon0, lon_span = lon_s.min(), np.ptp(lon_s)
+            self.lat0 = lat_s.min()
+            lat_span = max(np.ptp(lat_s), 1e-6)
+        else:
+            lon0, lon_span, self.lat0, lat_span = 0.0, 360.0, -90.0, 180.0
+
+        size = np.sqrt(
+            lat_span * max(lon_span, 1e-6) * sites_per_bucket / max(sites.size, 1)
+        )
+        self.n_lat = int(min(max(np.ceil(lat_span / size), 1), 4096))
+        self.dlat = lat_span / self.n_lat * (1 + 1e-12)
+        # Wrap the columns around the globe once a bucket would straddle it
+        self.wrap = lon_span + size >= 360.0
+        if self.wrap:
+            lon0, lon_span = 0.0, 360.0
+        self.lon0 = lon0
+        self.n_lon = int(min(max(np.ceil(lon_span / size), 1), 8192))
+        self.dlon = max(lon_span, 1e-6) / self.n_lon * (1 + 1e-12)
+
+        iy = np.clip(
+            ((lat_s - self.lat0) // self.dlat).astype(np.int64), 0, self.n_lat - 1
+        )
+        ix = np.clip(
+            (self._relative_lon(lon_s) // self.dlon).astype(np.int64), 0, self.n_lon - 1
+        )
+        cell = iy * self.n_lon + ix
+        order = np.argsort(cell, kind="stable")
+        self.cell_items = sites[order]
+        self.cell_start = np.zeros(self.n_lat * self.n_lon + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(cell, minlength=self.n_lat * self.n_lon),
+            out=self.cell_start[1:],
+        )
+
+    def _relative_lon(self, lon: np.ndarray) -> np.ndarray:
+        """Express longitudes (degrees) relative to the bucket origin."""
+        rel = (np.asarray(lon, dtype=np.float64) - self.lon0) % 360.0
+        if not self.wrap:
+            # Points outside the box map to the side they are closest to
+            span = self.n_lon * self.dlon
+            rel = np.where(rel > span + (360.0 - span) / 2, rel - 360.0, rel)
+        return rel
+
+    def query(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """
+        Find the nearest valid source site for each target point.
+
+        Parameters
+        ----------
+        lat, lon : np.ndarray
+            Target coordinates in degrees.
+
+        Returns
+        -------
+        np.ndarray
+            Flat source index per target point (int64), -1 where no valid
+            source site exists or the target coordinates are not finite.
+        """
+        lat = np.ascontiguousarray(lat, dtype=np.float64).ravel()
+        lon = np.ascontiguousarray(self._relative_lon(np.ravel(lon)))
+        out = np.empty(lat.size, dtype=np.int64)
+        _nearest_bucket_query(
+            self.cell_start,
+            self.cell_items,
+            self.src_xyz,
+            self.lat0,
+            self.dlat,
+            self.n_lat,
+            self.lon0,
+            self.dlon,
+            self.n_lon,
+            self.wrap,
+            lat,
+            lon,
+            out,
+        )
+        return out
+
+
+class _NearestS2DTreeIndex:
+    """
+    KD-tree index over source points for nearest-neighbor lookups.
+
+    Geographic points are projected onto the unit sphere, so Euclidean
+    nearest neighbors in the tree are great-circle nearest neighbors. With
+    ``spherical=False`` the tree is built on planar (lon, lat) pairs, which
+    matches ESMF's Cartesian coordinate system. The tree is built once and
+    queries are O(log n) per target point, parallelized over all cores.
+
+    Parameters
+    ----------
+    lat, lon : np.ndarray
+        Source point coordinates in degrees (any shape, flattened in C
+        order).
+    valid : np.ndarray, optional
+        Boolean mask of points that may be returned (e.g. unmasked points).
+    spherical : bool, default True
+        Whether to use great-circle rather than planar distances.
+    """
+
+    def __init__(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        valid: Optional[np.ndarray] = None,
+        spherical: bool = True,
+    ) -> None:
+        self.spherical = spherical
+        lat = np.asarray(lat, dtype=np.float64).ravel()
+        lon = np.asarray(lon, dtype=np.float64).ravel()
+        keep = np.isfinite(lat) & np.isfinite(lon)
+        if valid is not None:
+            keep &= np.asarray(valid, dtype=bool).ravel()
+        self.sites = np.flatnonzero(keep)
+        self.tree = cKDTree(self._points(lat[self.sites], lon[self.sites]))
+
+    def _points(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """Map coordinates (degrees) to the tree's Euclidean space."""
+        if self.spherical:
+            return _unit_xyz(lat, lon)
+        return np.column_stack([lon, lat])
+
+    def query(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """
+        Find the nearest valid source point for each target point.
+
+        Parameters
+        ----------
+        lat, lon : np.ndarray
+            Target coordinates in degrees.
+
+        Returns
+        -------
+        np.ndarray
+            Flat source index per target point (int64), -1 where no valid
+            source point exists or the target coordinates are not finite.
+        """
+        lat = np.asarray(lat, dtype=np.float64).ravel()
+        lon = np.asarray(lon, dtype=np.float64).ravel()
+        out = np.full(lat.size, -1, dtype=np.int64)
+        if self.sites.size == 0:
+            return out
+        finite = np.flatnonzero(np.isfinite(lat) & np.isfinite(lon))
+        _, idx = self.tree.query(
+            self._points(lat[finite], lon[finite]), k=1, workers=-1
+        )
+        out[finite] = self.sites[idx]
+        return out
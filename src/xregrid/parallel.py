@@ -13,6 +13,7 @@ def _assemble_weights_task(
     results: list[Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[str]]],
     n_src: int,
     n_dst: int,
+    dtype: Any = np.float64,
 ) -> Any:
     """
     Internal worker task to assemble weights from multiple chunks.
@@ -25,6 +26,8 @@ def _assemble_weights_task(
         Total number of source points.
     n_dst : int
         Total number of destination points.
+    dtype : dtype-like, default np.float64
+        Storage dtype of the weights.
 
     Returns
     -------
@@ -44,12 +47,14 @@ def _assemble_weights_task(
             all_data.append(d)
 
     if not all_rows:
-        return coo_matrix((n_dst, n_src)).tocsr()
+        return coo_matrix((n_dst, n_src), dtype=dtype).tocsr()
 
     rows = np.concatenate(all_rows)
     cols = np.concatenate(all_cols)
-    data = np.concatenate(all_data)
-    return coo_matrix((data, (rows, cols)), shape=(n_dst, n_src)).tocsr()
+    data = np.concatenate(all_data).astype(dtype, copy=False)
+    matrix = coo_matrix((data, (rows, cols)), shape=(n_dst, n_src)).tocsr()
+    matrix.sort_indices()
+    return matrix
 
 
 def _get_weights_sum_task(matrix: Any) -> np.ndarray:
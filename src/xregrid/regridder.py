@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import os
 import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Optional, Tuple, Type, Union
 
 import cf_xarray  # noqa: F401
 import numpy as np
 import xarray as xr
-from scipy.sparse import coo_matrix
+from scipy.sparse import coo_matrix, csr_matrix
 
 from xregrid.utils import update_history, get_crs_info
 from xregrid.grid import (
@@ -16,8 +20,15 @@ from xregrid.grid import (
     _bounds_to_vertices,
     _get_grid_bounds,
     _create_esmf_grid,
+    _to_degrees,
+    _update_grid_digest,
+)
+from xregrid.core import _apply_weights_core, _row_weight_sums, _setup_worker_cache
+from xregrid.nearest import (
+    _NearestS2DBucketIndex,
+    _NearestS2DTreeIndex,
+    _nearest_bucket_query,
 )
-from xregrid.core import _apply_weights_core, _setup_worker_cache
 from xregrid.parallel import (
     _assemble_weights_task,
     _get_weights_sum_task,
@@ -28,17 +39,31 @@ from xregrid.parallel import (
 
 if TYPE_CHECKING:
     import dask.distributed
-    from scipy.sparse import csr_matrix
 
 try:
     from dask.base import is_dask_collection
 except ImportError:
     is_dask_collection = None  # type: ignore
 
+
+def _return_precomputed(
+    values: np.ndarray, data: np.ndarray, **kwargs: Any
+) -> np.ndarray:
+    """Stand-in for `_apply_weights_core` returning already regridded values."""
+    return values
+
+
 # Global cache for the driver to store distributed futures
 # Keyed by (client_id, weight_key)
 _DRIVER_CACHE: dict = {}
 
+# In-memory cache of weights shared by Regridders built on the same grids or
+# loaded from the same file. Keyed by (weights digest, weights dtype) or by
+# (path, mtime, size, weights dtype); values are (csr_matrix, metadata) pairs
+# and the least recently used entry is evicted first.
+_WEIGHTS_CACHE: OrderedDict = OrderedDict()
+_WEIGHTS_CACHE_SIZE = 16
+
 
 class Regridder:
     """
@@ -65,6 +90,13 @@ class Regridder:
         Threshold for NaN handling.
     periodic : bool
         Whether the grid is periodic in longitude.
+
+    Notes
+    -----
+    The Numba kernels that apply the weights release the GIL, so Dask's
+    threaded scheduler (``dask.config.set(scheduler="threads")``) regrids
+    chunks concurrently while sharing one copy of the weights in memory.
+    Process-based schedulers need a copy of the weights in every worker.
     """
 
     # Internal state default values
@@ -76,6 +108,8 @@ class Regridder:
     skipna: bool = False
     na_thres: float = 1.0
     periodic: bool = False
+    weights_dtype: Any = np.float64
+    nearest_index: bool = False
     provenance: list[str] = []
     _uid: str = ""
 
@@ -89,6 +123,7 @@ class Regridder:
     _weights_matrix: Optional[Union[csr_matrix, dask.distributed.Future]] = None
     _dask_client: Optional[dask.distributed.Client] = None
     _dask_futures: Optional[list[dask.distributed.Future]] = None
+    _nn_index: Optional[Any] = None
 
     def __init__(
         self,
@@ -106,6 +141,10 @@ class Regridder:
         compute: bool = True,
         extrap_method: Optional[str] = None,
         extrap_dist_exponent: float = 2.0,
+        weights_dtype: Any = np.float64,
+        cache_dir: Optional[str] = None,
+        cache_weights: bool = False,
+        nearest_index: bool = False,
     ) -> None:
         """
         Initialize the Regridder.
@@ -123,7 +162,8 @@ class Regridder:
         reuse_weights : bool, default False
             Load weights from filename if it exists.
         filename : str, default 'weights.nc'
-            Path to weights file.
+            Path to weights file. Names ending in '.npz' store the CSR arrays
+            in a NumPy archive, which reloads faster than NetCDF.
         skipna : bool, default False
             Handle NaNs in input data by re-normalizing weights.
         na_thres : float, default 1.0
@@ -145,6 +185,27 @@ class Regridder:
             Extrapolation method (nearest_s2d, nearest_idw, creep_fill).
         extrap_dist_exponent : float, default 2.0
             Exponent for IDW extrapolation.
+        weights_dtype : dtype-like, default np.float64
+            Storage dtype of the sparse weights. Weight application is
+            memory-bound, so np.float32 halves the bytes moved per product
+            at the cost of single-precision weights.
+        cache_dir : str, optional
+            Directory of a content-addressed weights cache. If given, the
+            weights file is named after a digest of the grid coordinates,
+            mask and regridding parameters and is reused whenever it exists,
+            overriding `filename` and `reuse_weights`.
+        cache_weights : bool, default False
+            Keep the weights in an in-memory cache shared by all Regridders
+            of this process, so that building another Regridder for the same
+            grids and parameters skips weight generation, and reloading an
+            unchanged weights file skips reading it. Cached weight arrays are
+            shared read-only. Generated weights are not cached with `mpi` or
+            `parallel`.
+        nearest_index : bool, default False
+            Build serial `nearest_s2d` weights on geographic grids with a
+            built-in spherical nearest-neighbor index instead of ESMF. This
+            avoids building ESMF grids, but ties between equidistant source
+            points may be broken differently than by ESMF.
         """
         if mpi and parallel:
             raise ValueError(
@@ -199,6 +260,8 @@ class Regridder:
         self.compute_on_init = compute
         self.extrap_method = extrap_method
         self.extrap_dist_exponent = extrap_dist_exponent
+        self.weights_dtype = np.dtype(weights_dtype)
+        self.nearest_index = nearest_index
 
         # Generate a unique ID for this regridder instance to avoid cache collisions
         import uuid
@@ -276,16 +339,159 @@ class Regridder:
         self._dask_futures: Optional[list] = None
         self._dask_client: Optional[Any] = None
         self._dask_start_time: Optional[float] = None
+        self._nn_index: Optional[Any] = None
         self.provenance: list[str] = []
 
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            filename = self.filename = self._cache_filename(cache_dir)
+            reuse_weights = True
+
         if reuse_weights and os.path.exists(filename):
-            self._load_weights()
+            file_key = self._weights_file_key() if cache_weights else None
+            if not self._restore_cached_weights(file_key):
+                self._load_weights()
             # Validate loaded weights against provided grids and parameters
             self._validate_weights()
-        else:
+            self._remember_weights(file_key)
+            return
+
+        cache_key = None
+        if (
+            cache_weights
+            and not (mpi or parallel)
+            and not hasattr(self.source_grid_ds, "uxgrid")
+            and not hasattr(self.target_grid_ds, "uxgrid")
+        ):
+            cache_key = (self._weights_digest(), self.weights_dtype.str)
+        if not self._restore_cached_weights(cache_key):
             self._generate_weights()
-            if reuse_weights:
-                self._save_weights()
+            self._remember_weights(cache_key)
+        if reuse_weights:
+            self._save_weights()
+            # Serve later loads of the file just written from memory
+            if cache_weights and not mpi and os.path.exists(filename):
+                self._remember_weights(self._weights_file_key())
+
+    def _weights_file_key(self) -> Tuple[Any, ...]:
+        """
+        Build the in-memory cache key of the weights file.
+
+        Files are keyed by path and modification stamp, so a rewritten file
+        is read again.
+
+        Returns
+        -------
+        tuple
+            (absolute path, mtime in ns, size, weights dtype).
+        """
+        stat = os.stat(self.filename)
+        return (
+            os.path.abspath(self.filename),
+            stat.st_mtime_ns,
+            stat.st_size,
+            self.weights_dtype.str,
+        )
+
+    def _restore_cached_weights(self, key: Optional[Tuple[Any, ...]]) -> bool:
+        """
+        Install weights from the in-memory weights cache.
+
+        Parameters
+        ----------
+        key : tuple, optional
+            Cache key; None disables the lookup.
+
+        Returns
+        -------
+        bool
+            True if the weights were found in the cache.
+        """
+        cached = _WEIGHTS_CACHE.get(key) if key is not None else None
+        if cached is None:
+            return False
+        _WEIGHTS_CACHE.move_to_end(key)
+        matrix = cached[0]
+        self._set_loaded_attrs(cached[1])
+        # Each Regridder gets its own matrix object over the shared arrays
+        self._set_weights_matrix(
+            csr_matrix(
+                (matrix.data, matrix.indices, matrix.indptr),
+                shape=matrix.shape,
+                copy=False,
+            )
+        )
+        return True
+
+    def _remember_weights(self, key: Optional[Tuple[Any, ...]]) -> None:
+        """
+        Store the current eager weights in the in-memory weights cache.
+
+        The CSR arrays are marked read-only, since they are shared with
+        the Regridders that later restore them.
+
+        Parameters
+        ----------
+        key : tuple, optional
+            Cache key; None disables caching.
+        """
+        matrix = self._weights_matrix
+        if key is None or not isinstance(matrix, csr_matrix):
+            return
+        # The arrays are shared with later Regridders, so freeze them
+        matrix.sort_indices()
+        for arr in (matrix.data, matrix.indices, matrix.indptr):
+            arr.flags.writeable = False
+        _WEIGHTS_CACHE[key] = (matrix, self._weights_attrs())
+        _WEIGHTS_CACHE.move_to_end(key)
+        while len(_WEIGHTS_CACHE) > _WEIGHTS_CACHE_SIZE:
+            _WEIGHTS_CACHE.popitem(last=False)
+
+    def _cache_filename(self, cache_dir: str) -> str:
+        """
+        Build the path of the cached weights file for this configuration.
+
+        Parameters
+        ----------
+        cache_dir : str
+            The cache directory.
+
+        Returns
+        -------
+        str
+            Path of a file named after `_weights_digest`.
+        """
+        return os.path.join(cache_dir, f"{self._weights_digest()}.nc")
+
+    def _weights_digest(self) -> str:
+        """
+        Fingerprint the inputs that determine the weights.
+
+        Returns
+        -------
+        str
+            Hex BLAKE2b digest of the source and target coordinates (and
+            bounds for conservative regridding), the source mask and the
+            regridding parameters.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for ds in (self.source_grid_ds, self.target_grid_ds):
+            _update_grid_digest(digest, ds, bounds=self.method == "conservative")
+        if self.mask_var and self.mask_var in self.source_grid_ds:
+            mask = self.source_grid_ds[self.mask_var].values != 0
+            digest.update(np.ascontiguousarray(mask).view(np.uint8))
+        params = (
+            self.method,
+            self.periodic,
+            self.mask_var,
+            self.extrap_method,
+            self.extrap_dist_exponent,
+            self.skipna,
+            self.na_thres,
+            self._use_nearest_index(),
+        )
+        digest.update(repr(params).encode())
+        return digest.hexdigest()
 
     @classmethod
     def from_weights(
@@ -556,6 +762,10 @@ class Regridder:
 
         This is the core weight generation method for serial or MPI-based execution.
         """
+        if self._use_nearest_index():
+            self._generate_weights_nearest()
+            return
+
         import esmpy
 
         if self.parallel:
@@ -701,8 +911,11 @@ class Regridder:
         n_dst = int(np.prod(self._shape_target))
 
         self._weights_matrix = coo_matrix(
-            (data, (rows, cols)), shape=(n_dst, n_src)
+            (data.astype(self.weights_dtype, copy=False), (rows, cols)),
+            shape=(n_dst, n_src),
         ).tocsr()
+        # Sorted column indices give a monotonic gather over the source data
+        self._weights_matrix.sort_indices()
 
         if self.skipna:
             # Optimization: Use sum(axis=1) instead of memory-intensive ones multiplication
@@ -710,6 +923,95 @@ class Regridder:
 
         self.generation_time = time.perf_counter() - start_time
 
+    def _use_nearest_index(self) -> bool:
+        """
+        Check whether nearest_s2d weights can be built without ESMF.
+
+        This applies to serial generation on geographic grids when
+        `nearest_index` is enabled.
+
+        Returns
+        -------
+        bool
+            True if a nearest-neighbor index should be used.
+        """
+        if (
+            not self.nearest_index
+            or self.method != "nearest_s2d"
+            or self.parallel
+            or self.extrap_method
+        ):
+            return False
+
+        for ds in (self.source_grid_ds, self.target_grid_ds):
+            crs = get_crs_info(ds)
+            if crs is not None and not crs.is_geographic:
+                return False
+        return True
+
+    def _generate_weights_nearest(self) -> None:
+        """
+        Generate nearest_s2d weights with a nearest-neighbor index.
+
+        Each destination point is mapped to its closest (unmasked) source
+        point with weight 1, matching ESMF's NEAREST_STOD. Unstructured
+        sources use a great-circle bucket index when Numba is available,
+        other sources a KD-tree. As in ESMF, distances are great-circle for
+        periodic or unstructured grids and planar in (lon, lat) otherwise.
+        Destination points without finite coordinates are left unmapped.
+        The index is kept on the instance as ``_nn_index``.
+        """
+        start_time = time.perf_counter()
+        src_lon, src_lat, src_shape, src_dims, is_unstructured_src = (
+            self._get_mesh_info(self.source_grid_ds)
+        )
+        dst_lon, dst_lat, dst_shape, dst_dims, is_unstructured_dst = (
+            self._get_mesh_info(self.target_grid_ds)
+        )
+        self._shape_source = src_shape
+        self._dims_source = src_dims
+        self._is_unstructured_src = is_unstructured_src
+        self._shape_target = dst_shape
+        self._dims_target = dst_dims
+        self._is_unstructured_tgt = is_unstructured_dst
+
+        valid = None
+        if self.mask_var and self.mask_var in self.source_grid_ds:
+            v_mask = self.source_grid_ds[self.mask_var]
+            non_spatial = _get_non_spatial_dims(self.source_grid_ds)
+            mask_isel = {d: 0 for d in non_spatial if d in v_mask.dims}
+            if mask_isel:
+                v_mask = v_mask.isel(mask_isel, drop=True)
+            valid = v_mask.values != 0
+
+        src_lat = _to_degrees(src_lat).values
+        src_lon = _to_degrees(src_lon).values
+        spherical = self.periodic or is_unstructured_src or is_unstructured_dst
+        if is_unstructured_src and _nearest_bucket_query is not None:
+            self._nn_index = _NearestS2DBucketIndex(src_lat, src_lon, valid=valid)
+        else:
+            self._nn_index = _NearestS2DTreeIndex(
+                src_lat, src_lon, valid=valid, spherical=spherical
+            )
+        nearest = self._nn_index.query(
+            _to_degrees(dst_lat).values, _to_degrees(dst_lon).values
+        )
+
+        n_src = int(np.prod(src_shape))
+        n_dst = int(np.prod(dst_shape))
+        mapped = nearest >= 0
+        indptr = np.zeros(n_dst + 1, dtype=np.int64)
+        np.cumsum(mapped, out=indptr[1:])
+        self._weights_matrix = csr_matrix(
+            (np.ones(indptr[-1], dtype=self.weights_dtype), nearest[mapped], indptr),
+            shape=(n_dst, n_src),
+        )
+
+        if self.skipna:
+            self._total_weights = mapped.astype(np.float64)
+
+        self.generation_time = time.perf_counter() - start_time
+
     def _generate_weights_dask(self, compute: bool = True) -> None:
         """
         Generate regridding weights using Dask parallel workers.
@@ -897,7 +1199,11 @@ class Regridder:
         # Perform concatenation on a worker to protect driver memory
         # We use top-level task functions to avoid capturing 'self' and mocks.
         self._weights_matrix = self._dask_client.submit(
-            _assemble_weights_task, self._dask_futures, n_src, n_dst
+            _assemble_weights_task,
+            self._dask_futures,
+            n_src,
+            n_dst,
+            dtype=self.weights_dtype,
         )
 
         if self.skipna:
@@ -912,9 +1218,42 @@ class Regridder:
         # Clear futures to free memory
         self._dask_futures = None
 
+    def _weights_attrs(self) -> dict[str, Any]:
+        """
+        Collect the metadata stored alongside the weights.
+
+        Returns
+        -------
+        dict
+            Grid shapes and dimension names, regridding parameters and
+            provenance of the current weights.
+        """
+        return {
+            "n_src": int(self._weights_matrix.shape[1]),
+            "n_dst": int(self._weights_matrix.shape[0]),
+            "shape_src": [int(n) for n in self._shape_source]
+            if self._shape_source
+            else [],
+            "shape_dst": [int(n) for n in self._shape_target]
+            if self._shape_target
+            else [],
+            "dims_src": list(self._dims_source) if self._dims_source else [],
+            "dims_target": list(self._dims_target) if self._dims_target else [],
+            "is_unstructured_src": int(self._is_unstructured_src),
+            "is_unstructured_tgt": int(self._is_unstructured_tgt),
+            "method": self.method,
+            "periodic": int(self.periodic),
+            "skipna": int(self.skipna),
+            "na_thres": self.na_thres,
+            "provenance": "; ".join(self.provenance) if self.provenance else "",
+            "extrap_method": self.extrap_method or "none",
+            "extrap_dist_exponent": self.extrap_dist_exponent,
+            "generation_time": self.generation_time if self.generation_time else 0.0,
+        }
+
     def _save_weights(self) -> None:
         """
-        Save regridding weights and metadata to a NetCDF file.
+        Save regridding weights and metadata to a NetCDF or .npz file.
 
         Only the root rank (PET 0) performs file I/O.
         """
@@ -929,6 +1268,10 @@ class Regridder:
         # Use weights property to ensure they are gathered if remote
         weights_matrix = self.weights
 
+        if self.filename.endswith(".npz"):
+            self._save_weights_npz(weights_matrix)
+            return
+
         # Convert to COO to access row and col attributes
         weights_coo = weights_matrix.tocoo()
 
@@ -938,81 +1281,141 @@ class Regridder:
                 "col": (["n_s"], weights_coo.col + 1),
                 "S": (["n_s"], weights_coo.data),
             },
-            attrs={
-                "n_src": self._weights_matrix.shape[1],
-                "n_dst": self._weights_matrix.shape[0],
-                "shape_src": list(self._shape_source) if self._shape_source else [],
-                "shape_dst": list(self._shape_target) if self._shape_target else [],
-                "dims_src": list(self._dims_source) if self._dims_source else [],
-                "dims_target": list(self._dims_target) if self._dims_target else [],
-                "is_unstructured_src": int(self._is_unstructured_src),
-                "is_unstructured_tgt": int(self._is_unstructured_tgt),
-                "method": self.method,
-                "periodic": int(self.periodic),
-                "skipna": int(self.skipna),
-                "na_thres": self.na_thres,
-                "provenance": "; ".join(self.provenance) if self.provenance else "",
-                "extrap_method": self.extrap_method or "none",
-                "extrap_dist_exponent": self.extrap_dist_exponent,
-                "generation_time": self.generation_time
-                if self.generation_time
-                else 0.0,
-            },
+            attrs=self._weights_attrs(),
         )
         update_history(ds_weights, "Weights generated by Regridder")
         ds_weights.to_netcdf(self.filename)
 
+    def _save_weights_npz(self, weights_matrix: csr_matrix) -> None:
+        """
+        Save the CSR arrays and metadata to an uncompressed NumPy archive.
+
+        Parameters
+        ----------
+        weights_matrix : csr_matrix
+            The weight matrix to save.
+        """
+        # Write through a file object so np.savez does not append '.npz'
+        with open(self.filename, "wb") as f:
+            np.savez(
+                f,
+                indptr=weights_matrix.indptr,
+                indices=weights_matrix.indices,
+                data=weights_matrix.data,
+                attrs=np.array(json.dumps(self._weights_attrs())),
+            )
+
     def _load_weights(self) -> None:
         """
-        Load regridding weights and metadata from a NetCDF file.
+        Load regridding weights and metadata from a NetCDF or .npz file.
         """
+        if self.filename.endswith(".npz"):
+            self._load_weights_npz()
+            return
+
+        # Read only the three weight variables, each in a single pass
         with xr.open_dataset(self.filename) as ds_weights:
-            ds_weights.load()
-            rows = ds_weights["row"].values - 1
-            cols = ds_weights["col"].values - 1
+            rows = ds_weights["row"].values
+            cols = ds_weights["col"].values
             data = ds_weights["S"].values
-            n_src = ds_weights.attrs["n_src"]
-            n_dst = ds_weights.attrs["n_dst"]
-
-            def _to_tuple(attr: Any) -> Tuple[Any, ...]:
-                """
-                Convert attribute to tuple.
-
-                Parameters
-                ----------
-                attr : Any
-                    The attribute to convert.
-
-                Returns
-                -------
-                Tuple
-                    The converted tuple.
-                """
-                if isinstance(attr, str):
-                    # Handle cases where attributes might be stored as string representations
-                    attr = attr.strip("()[]").replace(" ", "").split(",")
-                    return tuple(int(x) if x.isdigit() else x for x in attr if x)
-                return tuple(attr)
-
-            self._shape_source = _to_tuple(ds_weights.attrs["shape_src"])
-            self._shape_target = _to_tuple(ds_weights.attrs["shape_dst"])
-            self._dims_source = _to_tuple(ds_weights.attrs["dims_src"])
-            self._dims_target = _to_tuple(ds_weights.attrs["dims_target"])
-            self._is_unstructured_src = bool(ds_weights.attrs["is_unstructured_src"])
-            self._is_unstructured_tgt = bool(ds_weights.attrs["is_unstructured_tgt"])
-            self._loaded_periodic = bool(ds_weights.attrs.get("periodic", False))
-            self._loaded_method = ds_weights.attrs.get("method")
-            self._loaded_extrap = ds_weights.attrs.get("extrap_method", "none")
-            self._loaded_skipna = bool(ds_weights.attrs.get("skipna", False))
-            self._loaded_na_thres = float(ds_weights.attrs.get("na_thres", 1.0))
-            self.generation_time = ds_weights.attrs.get("generation_time")
-            loaded_prov = ds_weights.attrs.get("provenance", "")
-            if loaded_prov:
-                self.provenance = loaded_prov.split("; ")
+            attrs = dict(ds_weights.attrs)
+
+        # Convert from 1-based indices in place
+        rows -= 1
+        cols -= 1
+        data = data.astype(self.weights_dtype, copy=False)
+        shape = (attrs["n_dst"], attrs["n_src"])
+        self._set_loaded_attrs(attrs)
+        if rows.size == 0 or np.all(rows[1:] >= rows[:-1]):
+            # Files written by _save_weights are sorted by row: build the CSR
+            # row pointer directly instead of converting from COO
+            indptr = np.zeros(shape[0] + 1, dtype=cols.dtype)
+            np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+            matrix = csr_matrix((data, cols, indptr), shape=shape)
+        else:
+            matrix = coo_matrix((data, (rows, cols)), shape=shape).tocsr()
+        self._set_weights_matrix(matrix)
 
-        self._weights_matrix = coo_matrix(
-            (data, (rows, cols)), shape=(n_dst, n_src)
-        ).tocsr()
+    def _load_weights_npz(self) -> None:
+        """
+        Load the CSR arrays and metadata written by `_save_weights_npz`.
+
+        The arrays are used as stored, without the COO to CSR conversion of
+        the NetCDF path.
+        """
+        with np.load(self.filename) as archive:
+            attrs = json.loads(archive["attrs"].item())
+            matrix = csr_matrix(
+                (
+                    archive["data"].astype(self.weights_dtype, copy=False),
+                    archive["indices"],
+                    archive["indptr"],
+                ),
+                shape=(attrs["n_dst"], attrs["n_src"]),
+            )
+
+        self._set_loaded_attrs(attrs)
+        self._set_weights_matrix(matrix)
+
+    def _set_loaded_attrs(self, attrs: dict[str, Any]) -> None:
+        """
+        Restore grid information and parameters from saved weights metadata.
+
+        Parameters
+        ----------
+        attrs : dict
+            Metadata as written by `_weights_attrs`.
+        """
+
+        def _to_tuple(attr: Any) -> Tuple[Any, ...]:
+            """
+            Convert attribute to tuple.
+
+            Parameters
+            ----------
+            attr : Any
+                The attribute to convert.
+
+            Returns
+            -------
+            Tuple
+                The converted tuple.
+            """
+            if isinstance(attr, str):
+                # Handle cases where attributes might be stored as string representations
+                attr = attr.strip("()[]").replace(" ", "").split(",")
+                return tuple(int(x) if x.isdigit() else x for x in attr if x)
+            # netCDF returns single-element attributes as scalars
+            return tuple(np.atleast_1d(attr).tolist())
+
+        self._shape_source = _to_tuple(attrs["shape_src"])
+        self._shape_target = _to_tuple(attrs["shape_dst"])
+        self._dims_source = _to_tuple(attrs["dims_src"])
+        self._dims_target = _to_tuple(attrs["dims_target"])
+        self._is_unstructured_src = bool(attrs["is_unstructured_src"])
+        self._is_unstructured_tgt = bool(attrs["is_unstructured_tgt"])
+        self._loaded_periodic = bool(attrs.get("periodic", False))
+        self._loaded_method = attrs.get("method")
+        self._loaded_extrap = attrs.get("extrap_method", "none")
+        self._loaded_skipna = bool(attrs.get("skipna", False))
+        self._loaded_na_thres = float(attrs.get("na_thres", 1.0))
+        self.generation_time = attrs.get("generation_time")
+        loaded_prov = attrs.get("provenance", "")
+        if loaded_prov:
+            self.provenance = loaded_prov.split("; ")
+
+    def _set_weights_matrix(self, matrix: csr_matrix) -> None:
+        """
+        Install loaded weights as the regridding matrix.
+
+        Parameters
+        ----------
+        matrix : csr_matrix
+            The loaded weight matrix.
+        """
+        self._weights_matrix = matrix
+        # Sorted column indices give a monotonic gather over the source data
+        self._weights_matrix.sort_indices()
 
         if self.skipna:
             # Optimization: Use sum(axis=1) instead of memory-intensive ones multiplication
@@ -1076,7 +1479,7 @@ class Regridder:
             unmapped_2d = (weights_sum_2d == 0).astype(np.int8)
         else:
             # Eager diagnostics
-            weights_sum = np.array(self._weights_matrix.sum(axis=1)).flatten()
+            weights_sum = _row_weight_sums(self._weights_matrix).copy()
             unmapped = (weights_sum == 0).astype(np.int8)
 
             # Reshape to target grid shape
@@ -1192,7 +1595,21 @@ class Regridder:
             "periodic": self.periodic,
         }
 
-        if not skip_heavy:
+        if not skip_heavy and format == "dict" and not is_remote:
+            # O(nnz) row sums, cached with the weights
+            weights_sum = _row_weight_sums(self._weights_matrix)
+            mapped = weights_sum[weights_sum != 0]
+            unmapped_count = n_dst - mapped.size
+            report.update(
+                {
+                    "unmapped_count": unmapped_count,
+                    "unmapped_fraction": unmapped_count / n_dst,
+                    "weight_sum_min": float(mapped.min()) if mapped.size else 0.0,
+                    "weight_sum_max": float(weights_sum.max()),
+                    "weight_sum_mean": float(weights_sum.mean()),
+                }
+            )
+        elif not skip_heavy:
             ds_diag = self.diagnostics()
             weights_sum = ds_diag.weight_sum
             unmapped_mask = ds_diag.unmapped_mask
@@ -1300,20 +1717,19 @@ class Regridder:
             Summary of the regridder configuration.
         """
         quality_str = "quality=deferred"
+        nnz_str = ""
         n_dst = int(np.prod(self._shape_target)) if self._shape_target else 0
 
-        # Avoid remote calls and expensive reports in __repr__
+        # Avoid remote calls in __repr__; eager reports are cheap (O(nnz), cached)
         is_remote = hasattr(self._weights_matrix, "key")
         if is_remote:
             quality_str = "quality=lazy"
         elif n_dst > 0:
+            if hasattr(self._weights_matrix, "nnz"):
+                nnz_str = f"nnz={self._weights_matrix.nnz}, "
             try:
-                if n_dst < 1_000_000:
-                    # Only show quality if already eager and not too massive
-                    report = self.quality_report()
-                    quality_str = f"unmapped={report['unmapped_fraction']:.2%}"
-                else:
-                    quality_str = "quality=deferred"
+                report = self.quality_report()
+                quality_str = f"unmapped={report['unmapped_fraction']:.2%}"
             except Exception:
                 quality_str = "quality=unknown"
 
@@ -1322,7 +1738,7 @@ class Regridder:
             f"src_shape={self._shape_source}, "
             f"dst_shape={self._shape_target}, "
             f"periodic={self.periodic}, "
-            f"{quality_str})"
+            f"{nnz_str}{quality_str})"
         )
 
     def plot_weights(self, row_idx: int, mode: str = "static", **kwargs: Any) -> Any:
@@ -1517,6 +1933,7 @@ class Regridder:
         skipna: Optional[bool] = None,
         na_thres: Optional[float] = None,
         _precomputed_aux: Optional[dict[str, xr.DataArray]] = None,
+        _precomputed_values: Optional[np.ndarray] = None,
     ) -> xr.DataArray:
         """
         Regrid a single DataArray, including auxiliary spatial coordinates.
@@ -1535,6 +1952,10 @@ class Regridder:
             NaN threshold. If None, uses initialization default.
         _precomputed_aux : dict, optional
             Pre-regridded auxiliary coordinates to avoid redundant computation.
+        _precomputed_values : np.ndarray, optional
+            Already regridded values of an eager DataArray (non-spatial dims
+            first, in their original order), e.g. from a batched application
+            over several variables. Only the metadata is built around them.
 
         Returns
         -------
@@ -1590,6 +2011,7 @@ class Regridder:
         # Identify non-spatial variables to exclude from regridding
         non_spatial_dims = _get_non_spatial_dims(da_in)
 
+        aux_names = []
         for c_name, c_da in da_in.coords.items():
             # Avoid infinite recursion
             if id(c_da) in _processed_ids or c_name in _processed_ids:
@@ -1603,17 +2025,27 @@ class Regridder:
                 d in c_da.dims for d in self._dims_source
             ):
                 # This is an auxiliary spatial coordinate
-                if _precomputed_aux and c_name in _precomputed_aux:
-                    aux_coords_to_regrid[c_name] = _precomputed_aux[c_name]
-                else:
-                    aux_coords_to_regrid[c_name] = self._regrid_dataarray(
-                        c_da,
-                        update_history_attr=False,
-                        _processed_ids=_processed_ids,
-                        skipna=skipna,
-                        na_thres=na_thres,
-                        _precomputed_aux=_precomputed_aux,
-                    )
+                aux_names.append(c_name)
+
+        pending = [
+            c for c in aux_names if not (_precomputed_aux and c in _precomputed_aux)
+        ]
+        aux_coords = self._aux_coords_for_regrid(da_in, pending)
+        # Eager auxiliary coordinates sharing a dtype share one weight application
+        aux_values = self._apply_batched(aux_coords, skipna=skipna, na_thres=na_thres)
+        for c_name in aux_names:
+            if c_name not in aux_coords:
+                aux_coords_to_regrid[c_name] = _precomputed_aux[c_name]
+            else:
+                aux_coords_to_regrid[c_name] = self._regrid_dataarray(
+                    aux_coords[c_name],
+                    update_history_attr=False,
+                    _processed_ids=_processed_ids,
+                    skipna=skipna,
+                    na_thres=na_thres,
+                    _precomputed_aux=_precomputed_aux,
+                    _precomputed_values=aux_values.get(c_name),
+                )
 
         # CF-Awareness: Map logical dimensions to physical dimension names in da_in
 
@@ -1733,7 +2165,9 @@ class Regridder:
         # and move output_sizes to dask_gufunc_kwargs for future compatibility
         # vectorize=False because _apply_weights_core handles non-core dimensions
         out = xr.apply_ufunc(
-            _apply_weights_core,
+            _apply_weights_core
+            if _precomputed_values is None
+            else functools.partial(_return_precomputed, _precomputed_values),
             da_in,
             kwargs={
                 "weights_matrix": weights_arg,
@@ -1941,6 +2375,114 @@ class Regridder:
             pass
         return False
 
+    def _apply_batched(
+        self,
+        das: dict[str, xr.DataArray],
+        skipna: bool,
+        na_thres: float,
+    ) -> dict[str, np.ndarray]:
+        """
+        Regrid eager variables of the same dtype with one weight application.
+
+        The non-spatial slices of all variables in a group are stacked into
+        a single ``(n_batch, n_src)`` block, so the weights are streamed once
+        for the whole group rather than once per variable.
+
+        Parameters
+        ----------
+        das : dict of str to xr.DataArray
+            Candidate variables to regrid.
+        skipna : bool
+            Whether to handle NaNs.
+        na_thres : float
+            NaN threshold.
+
+        Returns
+        -------
+        dict of str to np.ndarray
+            Regridded values (non-spatial dims first) of the batched
+            variables; variables that cannot be batched are omitted.
+        """
+        # NaN masks usually differ between variables, which would defeat the
+        # stationary-mask path of skipna, and remote weights are only
+        # applied on the cluster
+        if skipna or not isinstance(self._weights_matrix, csr_matrix):
+            return {}
+
+        groups: dict[np.dtype, list[str]] = {}
+        for name, da in das.items():
+            is_lazy = (
+                is_dask_collection(da.data)
+                if is_dask_collection
+                else hasattr(da.data, "dask")
+            )
+            if (
+                not is_lazy
+                and isinstance(da.data, np.ndarray)
+                and all(d in da.dims for d in self._dims_source)
+            ):
+                groups.setdefault(da.dtype, []).append(name)
+
+        results: dict[str, np.ndarray] = {}
+        for names in groups.values():
+            if len(names) < 2:
+                continue
+            blocks = [
+                das[n]
+                .transpose(..., *self._dims_source)
+                .data.reshape((-1,) + self._shape_source)
+                for n in names
+            ]
+            out = _apply_weights_core(
+                np.concatenate(blocks),
+                self._weights_matrix,
+                self._dims_source,
+                self._shape_target,
+                na_thres=na_thres,
+            )
+            start = 0
+            for name, block in zip(names, blocks):
+                da = das[name]
+                batch_shape = tuple(
+                    da.sizes[d] for d in da.dims if d not in self._dims_source
+                )
+                results[name] = out[start : start + len(block)].reshape(
+                    batch_shape + self._shape_target
+                )
+                start += len(block)
+        return results
+
+    @staticmethod
+    def _aux_coords_for_regrid(
+        obj: Union[xr.DataArray, xr.Dataset], names: list[str]
+    ) -> dict[str, xr.DataArray]:
+        """
+        Select auxiliary spatial coordinates for regridding, one at a time.
+
+        Each coordinate is returned without the other selected coordinates,
+        which are regridded on their own, so none of them is regridded again
+        as a coordinate of another.
+
+        Parameters
+        ----------
+        obj : xr.DataArray or xr.Dataset
+            The object holding the coordinates.
+        names : list of str
+            Names of the auxiliary spatial coordinates.
+
+        Returns
+        -------
+        dict of str to xr.DataArray
+            The coordinates, keyed by name.
+        """
+        coords = {}
+        for name in names:
+            c_da = obj.coords[name]
+            coords[name] = c_da.drop_vars(
+                [n for n in names if n != name and n in c_da.coords]
+            )
+        return coords
+
     def _regrid_dataset(
         self,
         ds_in: xr.Dataset,
@@ -1976,22 +2518,42 @@ class Regridder:
 
         # 1. Pre-regrid all unique auxiliary spatial coordinates to avoid redundancy.
         # This reduces Dask graph complexity and avoids redundant ESMF weight applications.
-        precomputed_aux: dict[str, xr.DataArray] = {}
-        for c_name, c_da in ds_in.coords.items():
-            if c_name in ds_in.dims:
-                continue
-            if c_name in non_spatial_dims:
-                continue
+        aux_coords = self._aux_coords_for_regrid(
+            ds_in,
+            [
+                c_name
+                for c_name, c_da in ds_in.coords.items()
+                if c_name not in ds_in.dims
+                and c_name not in non_spatial_dims
+                and all(d in c_da.dims for d in self._dims_source)
+            ],
+        )
 
-            # Check if this is an auxiliary spatial coordinate
-            if all(d in c_da.dims for d in self._dims_source):
-                precomputed_aux[c_name] = self._regrid_dataarray(
-                    c_da,
-                    update_history_attr=False,
-                    _processed_ids={id(c_da), c_name},
-                    skipna=skipna,
-                    na_thres=na_thres,
-                )
+        # Eager auxiliary coordinates and data variables sharing a dtype are
+        # regridded together up front (names are unique within a Dataset)
+        batched = self._apply_batched(
+            {
+                **aux_coords,
+                **{
+                    n: da
+                    for n, da in ds_in.data_vars.items()
+                    if n not in non_spatial_dims and "cf_role" not in da.attrs
+                },
+            },
+            skipna=skipna,
+            na_thres=na_thres,
+        )
+
+        precomputed_aux: dict[str, xr.DataArray] = {}
+        for c_name, c_da in aux_coords.items():
+            precomputed_aux[c_name] = self._regrid_dataarray(
+                c_da,
+                update_history_attr=False,
+                _processed_ids={id(c_da), c_name},
+                skipna=skipna,
+                na_thres=na_thres,
+                _precomputed_values=batched.get(c_name),
+            )
 
         # 2. Regrid data variables
         for name, da in ds_in.data_vars.items():
@@ -2037,6 +2599,7 @@ class Regridder:
                     skipna=skipna,
                     na_thres=na_thres,
                     _precomputed_aux=precomputed_aux,
+                    _precomputed_values=batched.get(name),
                 )
             else:
                 regridded_items[name] = da
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import datetime
+import functools
 import os
 import socket
+import time
 from typing import Any, Dict, Optional, Tuple, Union
 
 import numpy as np
@@ -25,56 +26,94 @@ except ImportError:
 import xarray as xr
 
 
-def _create_rectilinear_grid(
+def _cell_axis(
+    start: float,
+    stop: float,
+    res: float,
+    linspace: Any = np.linspace,
+    chunks: Optional[int] = None,
+) -> Tuple[Any, Any]:
+    """
+    Compute cell centers and edges of a regularly spaced axis.
+
+    The number of cells is derived once and centers/edges are placed with
+    ``linspace``, so the axis length does not depend on accumulated rounding
+    error as with ``arange``.
+
+    Parameters
+    ----------
+    start, stop : float
+        Axis extent.
+    res : float
+        Cell size.
+    linspace : callable, default np.linspace
+        ``np.linspace`` or ``dask.array.linspace``.
+    chunks : int, optional
+        Chunk size, only passed to ``dask.array.linspace``.
+
+    Returns
+    -------
+    tuple
+        (centers, edges) as float64 arrays of length n and n + 1.
+    """
+    n = int(round((stop - start) / res))
+    stop = start + n * res
+    kwargs = {} if chunks is None else {"chunks": chunks}
+    centers = linspace(start + res / 2, stop - res / 2, n, dtype=np.float64, **kwargs)
+    edges = linspace(start, stop, n + 1, dtype=np.float64, **kwargs)
+    return centers, edges
+
+
+@functools.lru_cache(maxsize=32)
+def _rectilinear_axes(
     lat_range: Tuple[float, float],
     lon_range: Tuple[float, float],
     res_lat: float,
     res_lon: float,
-    add_bounds: bool = True,
-    chunks: Optional[Union[int, Dict[str, int]]] = None,
-    history_msg: str = "",
-    crs: str = "EPSG:4326",
+    add_bounds: bool,
+) -> Tuple[np.ndarray, ...]:
+    """
+    Build (and memoize) the NumPy coordinate arrays of a rectilinear grid.
+
+    The arrays are marked read-only since they are shared by the memoized
+    grid template; datasets handed to callers hold copies.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (lat, lon) and, if ``add_bounds``, the (N, 2) bounds (lat_b, lon_b).
+    """
+    lat, lat_b_1d = _cell_axis(*lat_range, res_lat)
+    lon, lon_b_1d = _cell_axis(*lon_range, res_lon)
+    axes = [lat, lon]
+    if add_bounds:
+        axes.append(np.stack([lat_b_1d[:-1], lat_b_1d[1:]], axis=1))
+        axes.append(np.stack([lon_b_1d[:-1], lon_b_1d[1:]], axis=1))
+    for arr in axes:
+        arr.flags.writeable = False
+    return tuple(axes)
+
+
+def _rectilinear_dataset(
+    lat: Any, lon: Any, bounds: Optional[Tuple[Any, Any]], crs: str
 ) -> xr.Dataset:
     """
-    Internal helper to create rectilinear grids with consistent metadata.
+    Assemble a rectilinear grid dataset from its coordinate arrays.
 
     Parameters
     ----------
-    lat_range : tuple of float
-        (min_lat, max_lat).
-    lon_range : tuple of float
-        (min_lon, max_lon).
-    res_lat : float
-        Latitude resolution in degrees.
-    res_lon : float
-        Longitude resolution in degrees.
-    add_bounds : bool, default True
-        Whether to add cell boundary coordinates.
-    chunks : int or dict, optional
-        Chunk sizes for the resulting dask-backed dataset.
-    history_msg : str, optional
-        Message to add to the history attribute.
+    lat, lon : array-like
+        1D cell center coordinates.
+    bounds : tuple of array-like, optional
+        (lat_b, lon_b) CF-compliant (N, 2) cell bounds.
+    crs : str
+        CRS recorded in the dataset attributes.
 
     Returns
     -------
     xr.Dataset
-        The generated grid dataset.
+        The grid dataset, without history.
     """
-    if chunks is not None and da is not None:
-        # Convert chunks to integer if it's a dict for 1D arrays
-        lat_chunks = chunks.get("lat", -1) if isinstance(chunks, dict) else chunks
-        lon_chunks = chunks.get("lon", -1) if isinstance(chunks, dict) else chunks
-
-        lat = da.arange(
-            lat_range[0] + res_lat / 2, lat_range[1], res_lat, chunks=lat_chunks
-        )
-        lon = da.arange(
-            lon_range[0] + res_lon / 2, lon_range[1], res_lon, chunks=lon_chunks
-        )
-    else:
-        lat = np.arange(lat_range[0] + res_lat / 2, lat_range[1], res_lat)
-        lon = np.arange(lon_range[0] + res_lon / 2, lon_range[1], res_lon)
-
     ds = xr.Dataset(
         coords={
             "lat": (
@@ -90,44 +129,15 @@ def _create_rectilinear_grid(
         }
     )
 
-    if add_bounds:
-        # Use CF-compliant (N, 2) bounds.
-        if chunks is not None and da is not None:
-            lat_b_1d = da.arange(
-                lat_range[0], lat_range[1] + res_lat, res_lat, chunks=lat_chunks
-            )
-            lon_b_1d = da.arange(
-                lon_range[0], lon_range[1] + res_lon, res_lon, chunks=lon_chunks
-            )
-
-            # Handle potential floating point overshoot from da.arange
-            # In dask, we use slicing which is lazy
-            lat_b_1d = lat_b_1d[: lat.size + 1]
-            lon_b_1d = lon_b_1d[: lon.size + 1]
-
-            lat_b_2d = da.stack([lat_b_1d[:-1], lat_b_1d[1:]], axis=1)
-            lon_b_2d = da.stack([lon_b_1d[:-1], lon_b_1d[1:]], axis=1)
-        else:
-            lat_b_1d = np.arange(lat_range[0], lat_range[1] + res_lat, res_lat)
-            lon_b_1d = np.arange(lon_range[0], lon_range[1] + res_lon, res_lon)
-
-            # Handle potential floating point overshoot from np.arange
-            if len(lat_b_1d) > len(lat) + 1:
-                lat_b_1d = lat_b_1d[: len(lat) + 1]
-            if len(lon_b_1d) > len(lon) + 1:
-                lon_b_1d = lon_b_1d[: len(lon) + 1]
-
-            lat_b_2d = np.stack([lat_b_1d[:-1], lat_b_1d[1:]], axis=1)
-            lon_b_2d = np.stack([lon_b_1d[:-1], lon_b_1d[1:]], axis=1)
-
+    if bounds is not None:
         ds.coords["lat_b"] = (
             ["lat", "nv"],
-            lat_b_2d,
+            bounds[0],
             {"units": "degrees_north", "standard_name": "latitude_bounds"},
         )
         ds.coords["lon_b"] = (
             ["lon", "nv"],
-            lon_b_2d,
+            bounds[1],
             {"units": "degrees_east", "standard_name": "longitude_bounds"},
         )
 
@@ -136,6 +146,94 @@ def _create_rectilinear_grid(
 
     # Aero Protocol: Explicit CRS attribution
     ds.attrs["crs"] = crs
+    return ds
+
+
+@functools.lru_cache(maxsize=32)
+def _rectilinear_template(
+    lat_range: Tuple[float, float],
+    lon_range: Tuple[float, float],
+    res_lat: float,
+    res_lon: float,
+    add_bounds: bool,
+    crs: str,
+) -> xr.Dataset:
+    """
+    Build (and memoize) an eager rectilinear grid dataset.
+
+    The cached dataset must not be modified; callers take a deep copy.
+
+    Returns
+    -------
+    xr.Dataset
+        The grid dataset, without history.
+    """
+    axes = _rectilinear_axes(lat_range, lon_range, res_lat, res_lon, add_bounds)
+    bounds = axes[2:] if add_bounds else None
+    return _rectilinear_dataset(axes[0], axes[1], bounds, crs)
+
+
+def _create_rectilinear_grid(
+    lat_range: Tuple[float, float],
+    lon_range: Tuple[float, float],
+    res_lat: float,
+    res_lon: float,
+    add_bounds: bool = True,
+    chunks: Optional[Union[int, Dict[str, int]]] = None,
+    history_msg: str = "",
+    crs: str = "EPSG:4326",
+) -> xr.Dataset:
+    """
+    Internal helper to create rectilinear grids with consistent metadata.
+
+    Parameters
+    ----------
+    lat_range : tuple of float
+        (min_lat, max_lat).
+    lon_range : tuple of float
+        (min_lon, max_lon).
+    res_lat : float
+        Latitude resolution in degrees.
+    res_lon : float
+        Longitude resolution in degrees.
+    add_bounds : bool, default True
+        Whether to add cell boundary coordinates.
+    chunks : int or dict, optional
+        Chunk sizes for the resulting dask-backed dataset.
+    history_msg : str, optional
+        Message to add to the history attribute.
+
+    Returns
+    -------
+    xr.Dataset
+        The generated grid dataset.
+    """
+    if chunks is not None and da is not None:
+        # Convert chunks to integer if it's a dict for 1D arrays
+        lat_chunks = chunks.get("lat", -1) if isinstance(chunks, dict) else chunks
+        lon_chunks = chunks.get("lon", -1) if isinstance(chunks, dict) else chunks
+
+        lat, lat_b_1d = _cell_axis(*lat_range, res_lat, da.linspace, lat_chunks)
+        lon, lon_b_1d = _cell_axis(*lon_range, res_lon, da.linspace, lon_chunks)
+        bounds = None
+        if add_bounds:
+            # Use CF-compliant (N, 2) bounds.
+            bounds = (
+                da.stack([lat_b_1d[:-1], lat_b_1d[1:]], axis=1),
+                da.stack([lon_b_1d[:-1], lon_b_1d[1:]], axis=1),
+            )
+        ds = _rectilinear_dataset(lat, lon, bounds, crs)
+    else:
+        # Eager grids are memoized; each caller gets a deep copy with its own
+        # attrs and writable coordinate arrays
+        ds = _rectilinear_template(
+            tuple(map(float, lat_range)),
+            tuple(map(float, lon_range)),
+            float(res_lat),
+            float(res_lon),
+            add_bounds,
+            crs,
+        ).copy(deep=True)
 
     if history_msg:
         update_history(ds, history_msg)
@@ -314,8 +412,10 @@ def get_crs_info(obj: Union[xr.DataArray, xr.Dataset]) -> Optional[Any]:
         or obj.encoding.get("crs")
     )
 
-    # Try cf-xarray for robust grid mapping discovery
-    if crs_info is None or isinstance(crs_info, str):
+    # Try cf-xarray for robust grid mapping discovery. cf-xarray resolves grid
+    # mappings through 'grid_mapping' attributes only, so its (costly) lookup
+    # is skipped when there are none.
+    if (crs_info is None or isinstance(crs_info, str)) and _has_grid_mapping_attr(obj):
         try:
             # Use cf-xarray to find the grid mapping variable
             # Some versions use get_grid_mapping(), others use grid_mappings property
@@ -340,13 +440,61 @@ def get_crs_info(obj: Union[xr.DataArray, xr.Dataset]) -> Optional[Any]:
 
     if crs_info:
         try:
-            return pyproj.CRS(crs_info)
+            return _cached_crs(crs_info)
+        except TypeError:
+            # Unhashable CRS input (e.g. a dict of PROJ parameters)
+            try:
+                return pyproj.CRS(crs_info)
+            except Exception:
+                pass
         except Exception:
             pass
 
     return None
 
 
+def _has_grid_mapping_attr(obj: Union[xr.DataArray, xr.Dataset]) -> bool:
+    """
+    Check whether an object or its variables carry a 'grid_mapping' attribute.
+
+    Parameters
+    ----------
+    obj : xr.DataArray or xr.Dataset
+        The xarray object to inspect.
+
+    Returns
+    -------
+    bool
+        True if `obj`, its encoding, or any of its data variables (Dataset)
+        or coordinates (DataArray) has a 'grid_mapping' attribute.
+    """
+    if "grid_mapping" in obj.attrs or "grid_mapping" in obj.encoding:
+        return True
+    variables = obj.data_vars if isinstance(obj, xr.Dataset) else obj.coords
+    return any("grid_mapping" in v.attrs for v in variables.values())
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_crs(crs_info: Any) -> Any:
+    """
+    Build a pyproj.CRS, reusing it for repeated identical inputs.
+
+    Parsing a CRS (e.g. from WKT) queries the PROJ database and is costly in
+    plotting loops that inspect the same grid many times.
+
+    Parameters
+    ----------
+    crs_info : str or int
+        Any hashable input accepted by pyproj.CRS.
+
+    Returns
+    -------
+    pyproj.CRS
+        The parsed CRS.
+    """
+    return pyproj.CRS(crs_info)
+
+
 def _find_coord(
     obj: Union[xr.DataArray, xr.Dataset], key: str
 ) -> Optional[xr.DataArray]:
@@ -437,7 +585,8 @@ def update_history(
     xr.DataArray or xr.Dataset
         The updated xarray object.
     """
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # time.strftime formats the C struct directly, without a datetime object
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
     full_message = f"{timestamp}: {message}"
     if "history" in obj.attrs:
         obj.attrs["history"] = f"{full_message}\n" + obj.attrs["history"]
@@ -472,12 +621,38 @@ def _transform_coords(
     lat : np.ndarray
         Latitude coordinates.
     """
-    import pyproj
+    try:
+        transformer = _cached_transformer(crs_in, crs_out)
+    except TypeError:
+        # Unhashable CRS input (e.g. a dict of PROJ parameters)
+        import pyproj
 
-    transformer = pyproj.Transformer.from_crs(crs_in, crs_out, always_xy=True)
+        transformer = pyproj.Transformer.from_crs(crs_in, crs_out, always_xy=True)
     return transformer.transform(x_arr, y_arr)
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_transformer(crs_in: Any, crs_out: Any) -> Any:
+    """
+    Build an always_xy pyproj.Transformer, reusing it for identical CRS pairs.
+
+    Parameters
+    ----------
+    crs_in : Any
+        Hashable input CRS (pyproj.CRS, EPSG code, or string).
+    crs_out : Any
+        Hashable output CRS.
+
+    Returns
+    -------
+    pyproj.Transformer
+        The transformer from `crs_in` to `crs_out`.
+    """
+    import pyproj
+
+    return pyproj.Transformer.from_crs(crs_in, crs_out, always_xy=True)
+
+
 def create_grid_from_crs(
     crs: Union[str, int, Any],
     extent: Tuple[float, float, float, float],
@@ -593,32 +768,22 @@ def create_grid_from_crs(
         # Create CF-compliant curvilinear bounds (Y, X, 4)
         # This ensures bounds are sliced correctly with centers
 
+        # Neighbouring cells share corners, so transform the (ny + 1, nx + 1)
+        # vertex mesh once instead of four corners per cell.
         if chunks is not None and da is not None:
-            x_b_raw = da.stack(
-                [x - res_x / 2, x + res_x / 2, x + res_x / 2, x - res_x / 2]
-            )
-            y_b_raw = da.stack(
-                [y - res_y / 2, y - res_y / 2, y + res_y / 2, y + res_y / 2]
-            )
+            x_v = da.concatenate([x - res_x / 2, x[-1:] + res_x / 2])
+            y_v = da.concatenate([y - res_y / 2, y[-1:] + res_y / 2])
         else:
-            x_b_raw = np.stack(
-                [x - res_x / 2, x + res_x / 2, x + res_x / 2, x - res_x / 2]
-            )
-            y_b_raw = np.stack(
-                [y - res_y / 2, y - res_y / 2, y + res_y / 2, y + res_y / 2]
-            )
-
-        x_b_da = xr.DataArray(x_b_raw, dims=["nv", "x"], name="x_b")
-        y_b_da = xr.DataArray(y_b_raw, dims=["nv", "y"], name="y_b")
-
-        # Broadcast them to (nv, y, x)
-        yy_b_da, xx_b_da = xr.broadcast(y_b_da, x_b_da)
+            x_v = np.append(x - res_x / 2, x[-1] + res_x / 2)
+            y_v = np.append(y - res_y / 2, y[-1] + res_y / 2)
 
-        # Transform corners lazily
-        lon_b, lat_b = xr.apply_ufunc(
+        yy_v_da, xx_v_da = xr.broadcast(
+            xr.DataArray(y_v, dims=["y_v"]), xr.DataArray(x_v, dims=["x_v"])
+        )
+        lon_v, lat_v = xr.apply_ufunc(
             _transform_coords,
-            xx_b_da,
-            yy_b_da,
+            xx_v_da.transpose("y_v", "x_v"),
+            yy_v_da.transpose("y_v", "x_v"),
             kwargs={"crs_in": crs_obj},
             dask="parallelized",
             output_dtypes=[float, float],
@@ -626,9 +791,15 @@ def create_grid_from_crs(
             output_core_dims=[[], []],
         )
 
-        # Reshape to (y, x, nv) for CF compliance
-        lat_b = lat_b.transpose("y", "x", "nv")
-        lon_b = lon_b.transpose("y", "x", "nv")
+        def _cell_corners(v: Any) -> Any:
+            # Counter-clockwise from (x - dx/2, y - dy/2), shape (y, x, nv)
+            corners = [v[:-1, :-1], v[:-1, 1:], v[1:, 1:], v[1:, :-1]]
+            if hasattr(v, "dask"):
+                return da.stack(corners, axis=-1).rechunk(lat.data.chunks + (4,))
+            return np.stack(corners, axis=-1)
+
+        lat_b = _cell_corners(lat_v.data)
+        lon_b = _cell_corners(lon_v.data)
 
         # Add 1D projected bounds using backend-agnostic xarray operations
         x_b_da_1d = xr.concat(
@@ -643,8 +814,8 @@ def create_grid_from_crs(
         ds["x"].attrs["bounds"] = "x_b"
         ds["y"].attrs["bounds"] = "y_b"
 
-        ds.coords["lat_b"] = (["y", "x", "nv"], lat_b.data, {"units": "degrees_north"})
-        ds.coords["lon_b"] = (["y", "x", "nv"], lon_b.data, {"units": "degrees_east"})
+        ds.coords["lat_b"] = (["y", "x", "nv"], lat_b, {"units": "degrees_north"})
+        ds.coords["lon_b"] = (["y", "x", "nv"], lon_b, {"units": "degrees_east"})
 
         ds["lat"].attrs["bounds"] = "lat_b"
         ds["lon"].attrs["bounds"] = "lon_b"
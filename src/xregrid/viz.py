@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import importlib
 import warnings
 from typing import TYPE_CHECKING, Any, Optional
 
+import numpy as np
 import xarray as xr
 
-from xregrid.utils import get_crs_info, _find_coord
+from xregrid.utils import (
+    _cached_transformer,
+    _find_coord,
+    _has_grid_mapping_attr,
+    get_crs_info,
+)
 
 if TYPE_CHECKING:
     from xregrid.regridder import Regridder
@@ -26,20 +35,378 @@ except ImportError:
     pyproj = None
 
 try:
-    import hvplot.xarray  # noqa: F401
-    import holoviews as hv
+    import dask
 except ImportError:
-    hvplot = None
-    hv = None
-else:
+    dask = None
+
+# hvplot and holoviews are imported on the first interactive plot
+hvplot = None
+hv = None
+_hvplot_import_attempted = False
+
+# Regridders built by the comparison plots, keyed by a digest of both grids
+_COMPARISON_REGRIDDERS: dict = {}
+_MAX_COMPARISON_REGRIDDERS = 8
+
+# Spatial dimensions of plotted fields, keyed by their coordinate metadata
+_SPATIAL_DIMS_CACHE: dict = {}
+_MAX_SPATIAL_DIMS_CACHE = 128
+
+
+def _import_hvplot() -> None:
+    """
+    Import hvplot and holoviews on the first interactive plot.
+
+    Registering the hvplot accessors is slow, so `import xregrid.viz` does
+    not pay for it. Sets the module-level `hvplot` flag and `hv` module.
+    """
+    global hvplot, hv, _hvplot_import_attempted
+    if hvplot or _hvplot_import_attempted:
+        return
+    _hvplot_import_attempted = True
+    try:
+        importlib.import_module("hvplot.xarray")
+        hv = importlib.import_module("holoviews")
+    except ImportError:
+        return
     hvplot = True
 
 
+@functools.lru_cache(maxsize=32)
+def _cartopy_crs(name: str, **kwargs: Any) -> Any:
+    """
+    Build a Cartopy CRS, reusing it for repeated identical requests.
+
+    Cartopy CRS objects are immutable, and constructing them initializes
+    PROJ, which dominates the cost of repeated plotting calls.
+
+    Parameters
+    ----------
+    name : str
+        Name of the class in `cartopy.crs` (e.g. 'PlateCarree').
+    **kwargs : Any
+        Hashable keyword arguments for the class.
+
+    Returns
+    -------
+    cartopy.crs.CRS
+        The projection object.
+    """
+    return getattr(ccrs, name)(**kwargs)
+
+
+def _decimate_for_display(
+    da: xr.DataArray,
+    spatial_dims: set,
+    fig: Any,
+    cells_per_pixel: int = 4,
+) -> xr.DataArray:
+    """
+    Block-average a 2D field that has many more cells than display pixels.
+
+    Rendering cost in Matplotlib grows with the number of mesh cells, while
+    the figure can only show one value per pixel. Fields with more than
+    ``cells_per_pixel`` cells per figure pixel are coarsened by a common
+    stride along both spatial dimensions, which stays lazy for Dask arrays.
+    Integer and flag fields are subsampled at that stride instead of being
+    averaged.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        The field to plot.
+    spatial_dims : set of str
+        The spatial dimensions of the field.
+    fig : matplotlib.figure.Figure
+        The figure the field is drawn in.
+    cells_per_pixel : int, default 4
+        Number of cells per pixel above which the field is coarsened.
+
+    Returns
+    -------
+    xr.DataArray
+        The coarsened or subsampled field, or `da` itself if no coarsening
+        is needed.
+    """
+    dims = [d for d in da.dims if d in spatial_dims]
+    if len(dims) != 2:
+        return da
+    try:
+        width, height = np.asarray(fig.get_size_inches(), dtype=float) * fig.dpi
+    except (AttributeError, TypeError, ValueError):
+        # Not a sized Matplotlib figure (e.g. a stand-in axes object)
+        return da
+    budget = cells_per_pixel * width * height
+    if da.size <= budget:
+        return da
+    stride = int(np.ceil(np.sqrt(da.size / budget)))
+    if not np.issubdtype(da.dtype, np.floating) or (
+        "flag_values" in da.attrs or "flag_meanings" in da.attrs
+    ):
+        # Averaging would invent values for integer and categorical fields
+        return da.isel({d: slice(None, None, stride) for d in dims})
+    return da.coarsen(
+        {d: min(stride, da.sizes[d]) for d in dims}, boundary="trim"
+    ).mean()
+
+
+def _detect_transform(da: xr.DataArray) -> Any:
+    """
+    Pick the Cartopy transform matching the CRS metadata of a field.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        The field to plot.
+
+    Returns
+    -------
+    cartopy.crs.CRS
+        The transform for the field's coordinates; PlateCarree if no
+        supported CRS is found.
+    """
+    # Without CRS metadata there is nothing to detect (see get_crs_info)
+    if not ("crs" in da.attrs or "crs" in da.encoding or _has_grid_mapping_attr(da)):
+        return _cartopy_crs("PlateCarree")
+
+    proj_crs = get_crs_info(da)
+
+    if proj_crs:
+        try:
+            # Map pyproj CRS to Cartopy projections
+            if proj_crs.is_geographic:
+                return _cartopy_crs("PlateCarree")
+            elif proj_crs.is_projected:
+                params = proj_crs.to_dict()
+                # Attempt robust projection detection
+                # UTM detection
+                if proj_crs.utm_zone:
+                    return _cartopy_crs(
+                        "UTM",
+                        zone=int(proj_crs.utm_zone[:-1]),
+                        southern_hemisphere="S" in proj_crs.utm_zone,
+                    )
+                # Mercator
+                elif "merc" in params.get("proj", ""):
+                    return _cartopy_crs("Mercator")
+                # Lambert Conformal
+                elif "lcc" in params.get("proj", ""):
+                    return _cartopy_crs(
+                        "LambertConformal",
+                        central_longitude=params.get("lon_0", 0.0),
+                        central_latitude=params.get("lat_0", 0.0),
+                    )
+        except Exception:
+            pass
+
+    return _cartopy_crs("PlateCarree")
+
+
+def _spatial_dims(da: xr.DataArray) -> frozenset:
+    """
+    Identify the spatial dimensions of a field to plot.
+
+    Detection goes through cf-xarray's criteria, so results are memoized on
+    the metadata it depends on: the dimensions and the names, dimensions
+    and attributes of the coordinates.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        The field to plot.
+
+    Returns
+    -------
+    frozenset of str
+        The spatial dimensions; the last two dimensions if no latitude and
+        longitude coordinates are found.
+    """
+    key = (
+        da.dims,
+        repr(da.attrs.get("coordinates")),
+        tuple(
+            (name, c.dims, tuple((k, repr(v)) for k, v in c.attrs.items()))
+            for name, c in da.coords.items()
+        ),
+    )
+    spatial_dims = _SPATIAL_DIMS_CACHE.get(key)
+    if spatial_dims is not None:
+        return spatial_dims
+
+    try:
+        # Use enhanced discovery
+        lat_da = _find_coord(da, "latitude")
+        lon_da = _find_coord(da, "longitude")
+
+        if lat_da is not None and lon_da is not None:
+            spatial_dims = frozenset(lat_da.dims) | frozenset(lon_da.dims)
+        else:
+            # Fallback to cf-xarray directly
+            lat_dims = da.cf["latitude"].dims
+            lon_dims = da.cf["longitude"].dims
+            spatial_dims = frozenset(lat_dims) | frozenset(lon_dims)
+    except (KeyError, AttributeError, ImportError, ValueError):
+        # Fallback to assuming the last two dimensions are spatial
+        spatial_dims = frozenset(da.dims[-2:])
+
+    if len(_SPATIAL_DIMS_CACHE) >= _MAX_SPATIAL_DIMS_CACHE:
+        # Drop the oldest entry
+        _SPATIAL_DIMS_CACHE.pop(next(iter(_SPATIAL_DIMS_CACHE)))
+    _SPATIAL_DIMS_CACHE[key] = spatial_dims
+    return spatial_dims
+
+
+def _lonlat_mesh(da: xr.DataArray, spatial_dims: frozenset) -> Optional[tuple]:
+    """
+    Attach 2D longitude/latitude coordinates to a projected field.
+
+    Existing 2D latitude/longitude coordinates are reused. Otherwise the
+    1D projected coordinates are expanded to a mesh and converted with one
+    vectorized pyproj call.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        The 2D field in a projected CRS.
+    spatial_dims : frozenset of str
+        The spatial dimensions of `da`.
+
+    Returns
+    -------
+    tuple or None
+        The field with 2D coordinates and the names of its longitude and
+        latitude coordinates, or None if they cannot be derived.
+    """
+    lat = _find_coord(da, "latitude")
+    lon = _find_coord(da, "longitude")
+    if lat is not None and lon is not None and lat.ndim == lon.ndim == 2:
+        return da, lon.name, lat.name
+
+    crs = get_crs_info(da)
+    dims = [d for d in da.dims if d in spatial_dims]
+    if len(dims) != 2:
+        return None
+    y_dim, x_dim = dims
+    if (
+        crs is None
+        or "lon" in da.coords
+        or "lat" in da.coords
+        or x_dim not in da.coords
+        or y_dim not in da.coords
+    ):
+        return None
+
+    xx, yy = np.meshgrid(da[x_dim].values, da[y_dim].values)
+    lon_2d, lat_2d = _cached_transformer(crs, "EPSG:4326").transform(xx, yy)
+    da = da.assign_coords(
+        lon=((y_dim, x_dim), lon_2d, {"units": "degrees_east"}),
+        lat=((y_dim, x_dim), lat_2d, {"units": "degrees_north"}),
+    )
+    return da, "lon", "lat"
+
+
+def _plot_mesh(da: xr.DataArray, ax: Any, kwargs: dict) -> Any:
+    """
+    Draw a field with xarray's pcolormesh, bypassing `da.plot()` dispatch.
+
+    `da.plot()` resolves to pcolormesh for 2D fields (plus facet dimensions)
+    without size-1 dimensions; other fields keep the generic dispatch.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        The field to plot.
+    ax : matplotlib.axes.Axes, optional
+        The axes to plot on.
+    kwargs : dict
+        Additional arguments for the xarray plotting function.
+
+    Returns
+    -------
+    Any
+        The plot object (e.g., matplotlib QuadMesh or FacetGrid).
+    """
+    n_facets = ("col" in kwargs) + ("row" in kwargs)
+    if da.ndim == 2 + n_facets and 1 not in da.shape:
+        return da.plot.pcolormesh(ax=ax, **kwargs)
+    return da.plot(ax=ax, **kwargs)
+
+
+def _rasterize_mesh(im: Any, kwargs: dict) -> Any:
+    """
+    Rasterize a plotted mesh so vector output (PDF/SVG) stays small.
+
+    Only the mesh artist is rasterized; axes, labels and coastlines remain
+    vector graphics. An explicit `rasterized` argument is respected.
+
+    Parameters
+    ----------
+    im : Any
+        The object returned by da.plot().
+    kwargs : dict
+        The arguments passed to da.plot().
+
+    Returns
+    -------
+    Any
+        `im`, unchanged apart from its rasterization flag.
+    """
+    if "rasterized" not in kwargs and hasattr(im, "set_rasterized"):
+        im.set_rasterized(True)
+    return im
+
+
+def _plot_fast_aspect(
+    da: xr.DataArray, ax: Any, title: Optional[str], **kwargs: Any
+) -> Any:
+    """
+    Plot a geographic field on plain axes with a latitude-corrected aspect.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        The 2D field to plot.
+    ax : matplotlib.axes.Axes, optional
+        The axes to plot on. A new plain axes is created if None.
+    title : str, optional
+        The plot title.
+    **kwargs : Any
+        Additional arguments passed to da.plot().
+
+    Returns
+    -------
+    Any
+        The plot object, or None if the field has no latitude/longitude
+        coordinates or carries a projected CRS.
+    """
+    lat = _find_coord(da, "latitude")
+    lon = _find_coord(da, "longitude")
+    crs = get_crs_info(da)
+    if lat is None or lon is None or (crs is not None and crs.is_projected):
+        return None
+
+    if ax is None:
+        ax = plt.axes()
+    kwargs.setdefault("x", lon.name)
+    kwargs.setdefault("y", lat.name)
+
+    im = _rasterize_mesh(_plot_mesh(da, ax, kwargs), kwargs)
+    lat_center = float(lat.mean())
+    ax.set_aspect(1.0 / np.cos(np.deg2rad(lat_center)))
+
+    if title is None:
+        title = da.name if da.name else "Static Map"
+    ax.set_title(title)
+    return im
+
+
 def plot_static(
     da: xr.DataArray,
     projection: Any = None,
     transform: Any = None,
     title: Optional[str] = None,
+    decimate: bool = True,
+    fast_aspect: bool = False,
     **kwargs: Any,
 ) -> Any:
     """
@@ -55,6 +422,16 @@ def plot_static(
         The transform to use for the plot call. Defaults to ccrs.PlateCarree() if cartopy is available.
     title : str, optional
         The plot title.
+    decimate : bool, default True
+        Block-average grids with far more cells than the figure has pixels
+        before plotting; integer and flag fields are subsampled instead (see
+        `_decimate_for_display`).
+    fast_aspect : bool, default False
+        For geographic fields without an explicit projection or transform,
+        plot on plain Matplotlib axes with the aspect ratio set to
+        1 / cos(mean latitude) instead of on a Cartopy GeoAxes. This skips
+        the per-vertex coordinate transform and is a good approximation for
+        small (e.g. country-scale) extents. No coastlines are drawn.
     **kwargs : Any
         Additional arguments passed to da.plot().
 
@@ -83,21 +460,7 @@ def plot_static(
     # We do this early so it applies even if cartopy is missing.
 
     # Identify spatial dimensions using cf-xarray or fallbacks for robust slicing
-    try:
-        # Use enhanced discovery
-        lat_da = _find_coord(da, "latitude")
-        lon_da = _find_coord(da, "longitude")
-
-        if lat_da is not None and lon_da is not None:
-            spatial_dims = set(lat_da.dims) | set(lon_da.dims)
-        else:
-            # Fallback to cf-xarray directly
-            lat_dims = da.cf["latitude"].dims
-            lon_dims = da.cf["longitude"].dims
-            spatial_dims = set(lat_dims) | set(lon_dims)
-    except (KeyError, AttributeError, ImportError, ValueError):
-        # Fallback to assuming the last two dimensions are spatial
-        spatial_dims = set(da.dims[-2:])
+    spatial_dims = _spatial_dims(da)
 
     # Identify dimensions used for faceting
     facet_dims = {kwargs.get("col"), kwargs.get("row")} - {None}
@@ -115,47 +478,36 @@ def plot_static(
         )
         da = da.isel(first_slice)
 
+    if decimate and not is_faceted:
+        fig = ax.figure if ax is not None else plt.gcf()
+        da = _decimate_for_display(da, spatial_dims, fig)
+
+    if fast_aspect and projection is None and transform is None and not is_faceted:
+        im = _plot_fast_aspect(da, ax, title, **kwargs)
+        if im is not None:
+            return im
+
     if ccrs is None:
         # Fallback to standard matplotlib if cartopy is missing
         if ax is None:
             ax = plt.gca()
-        im = da.plot(ax=ax, **kwargs)
+        im = _rasterize_mesh(_plot_mesh(da, ax, kwargs), kwargs)
         if title:
             ax.set_title(title)
         return im
 
-    if transform is None and ccrs is not None:
-        proj_crs = get_crs_info(da)
-
-        if proj_crs:
-            try:
-                # Map pyproj CRS to Cartopy projections
-                if proj_crs.is_geographic:
-                    transform = ccrs.PlateCarree()
-                elif proj_crs.is_projected:
-                    # Attempt robust projection detection
-                    # UTM detection
-                    if proj_crs.utm_zone:
-                        transform = ccrs.UTM(
-                            zone=int(proj_crs.utm_zone[:-1]),
-                            southern_hemisphere="S" in proj_crs.utm_zone,
-                        )
-                    # Mercator
-                    elif "merc" in proj_crs.to_dict().get("proj", ""):
-                        transform = ccrs.Mercator()
-                    # Lambert Conformal
-                    elif "lcc" in proj_crs.to_dict().get("proj", ""):
-                        transform = ccrs.LambertConformal(
-                            central_longitude=proj_crs.to_dict().get("lon_0", 0.0),
-                            central_latitude=proj_crs.to_dict().get("lat_0", 0.0),
-                        )
-            except Exception:
-                pass
+    if transform is None:
+        transform = _detect_transform(da)
+        if isinstance(transform, ccrs.UTM) and "x" not in kwargs and "y" not in kwargs:
+            # Plot UTM fields on precomputed lon/lat vertices instead of
+            # transforming the mesh through Cartopy
+            lonlat = _lonlat_mesh(da, spatial_dims)
+            if lonlat is not None:
+                da, kwargs["x"], kwargs["y"] = lonlat
+                transform = _cartopy_crs("PlateCarree")
 
     if projection is None:
-        projection = ccrs.PlateCarree()
-    if transform is None:
-        transform = ccrs.PlateCarree()
+        projection = _cartopy_crs("PlateCarree")
 
     if ax is not None:
         if is_faceted:
@@ -165,13 +517,7 @@ def plot_static(
             ax = None
         else:
             # Ensure the existing axes is a GeoAxes if we are using cartopy
-            is_geoaxes = False
-            try:
-                import cartopy.mpl.geoaxes as geoaxes
-
-                is_geoaxes = isinstance(ax, geoaxes.GeoAxes)
-            except ImportError:
-                is_geoaxes = hasattr(ax, "projection")
+            is_geoaxes = hasattr(ax, "projection") and hasattr(ax, "coastlines")
 
             if not is_geoaxes:
                 warnings.warn(
@@ -183,20 +529,16 @@ def plot_static(
     if ax is None and not is_faceted:
         # Strictly enforce projection in axes creation
         if projection is None and ccrs is not None:
-            projection = ccrs.PlateCarree()
+            projection = _cartopy_crs("PlateCarree")
         ax = plt.axes(projection=projection)
 
-    # Enforce transform for geospatial accuracy
-    if transform is None and ccrs is not None:
-        transform = ccrs.PlateCarree()
-
     if "transform" not in kwargs:
         kwargs["transform"] = transform
 
     if is_faceted and "subplot_kws" not in kwargs:
         kwargs["subplot_kws"] = {"projection": projection}
 
-    im = da.plot(ax=ax, **kwargs)
+    im = _rasterize_mesh(_plot_mesh(da, ax, kwargs), kwargs)
 
     if is_faceted:
         # im is a FacetGrid
@@ -286,6 +628,7 @@ def plot_interactive(
     ImportError
         If HvPlot is not installed.
     """
+    _import_hvplot()
     if not hvplot:
         raise ImportError(
             "HvPlot is required for plot_interactive. "
@@ -338,20 +681,21 @@ def plot_diagnostics(
         target_crs = get_crs_info(regridder.target_grid_ds)
         if target_crs:
             if target_crs.is_geographic:
-                projection = ccrs.PlateCarree()
+                projection = _cartopy_crs("PlateCarree")
             elif target_crs.is_projected:
                 # Basic mapping to common projections
                 if target_crs.utm_zone:
-                    projection = ccrs.UTM(
+                    projection = _cartopy_crs(
+                        "UTM",
                         zone=int(target_crs.utm_zone[:-1]),
                         southern_hemisphere="S" in target_crs.utm_zone,
                     )
                 elif "merc" in target_crs.to_dict().get("proj", ""):
-                    projection = ccrs.Mercator()
+                    projection = _cartopy_crs("Mercator")
                 else:
-                    projection = ccrs.PlateCarree()
+                    projection = _cartopy_crs("PlateCarree")
         else:
-            projection = ccrs.PlateCarree()
+            projection = _cartopy_crs("PlateCarree")
 
     ds_diag = regridder.diagnostics()
 
@@ -359,6 +703,7 @@ def plot_diagnostics(
         1,
         2,
         figsize=(12, 5),
+        layout="constrained",
         subplot_kw={"projection": projection},
     )
 
@@ -379,7 +724,6 @@ def plot_diagnostics(
     )
 
     fig.suptitle(f"Regridder Diagnostics ({regridder.method})", fontsize=16)
-    plt.tight_layout()
 
     return fig
 
@@ -417,6 +761,7 @@ def plot_diagnostics_interactive(
     ImportError
         If HvPlot or HoloViews is not installed.
     """
+    _import_hvplot()
     if not hvplot or hv is None:
         raise ImportError(
             "HvPlot and HoloViews are required for plot_diagnostics_interactive. "
@@ -445,6 +790,104 @@ def plot_diagnostics_interactive(
     return layout
 
 
+def _comparison_regridder(
+    da_src: xr.DataArray, da_tgt: xr.DataArray
+) -> Optional["Regridder"]:
+    """
+    Get a bilinear Regridder from the grid of `da_src` to that of `da_tgt`.
+
+    Regridders are kept in memory per pair of grids, so repeated comparison
+    plots on the same grids reuse the weights. The most recent eight are
+    kept until the process exits or `clear_comparison_cache` is called.
+
+    Parameters
+    ----------
+    da_src, da_tgt : xr.DataArray
+        The source and target fields.
+
+    Returns
+    -------
+    Regridder or None
+        The regridder, or None if weights cannot be generated (e.g. ESMPy is
+        not installed or the grids have no recognizable coordinates).
+    """
+    from xregrid.grid import _update_grid_digest
+    from xregrid.regridder import Regridder
+
+    src_grid = da_src.coords.to_dataset()
+    tgt_grid = da_tgt.coords.to_dataset()
+    try:
+        digest = hashlib.blake2b(digest_size=16)
+        _update_grid_digest(digest, src_grid)
+        _update_grid_digest(digest, tgt_grid)
+        key = digest.hexdigest()
+        if key not in _COMPARISON_REGRIDDERS:
+            regridder = Regridder(src_grid, tgt_grid, method="bilinear")
+            if len(_COMPARISON_REGRIDDERS) >= _MAX_COMPARISON_REGRIDDERS:
+                # Drop the oldest entry
+                _COMPARISON_REGRIDDERS.pop(next(iter(_COMPARISON_REGRIDDERS)))
+            _COMPARISON_REGRIDDERS[key] = regridder
+    except Exception:
+        # No ESMPy, no recognizable coordinates, or weight generation failed;
+        # the caller falls back to interp_like
+        return None
+    return _COMPARISON_REGRIDDERS[key]
+
+
+def clear_comparison_cache() -> None:
+    """
+    Release the Regridders kept by the comparison plots.
+
+    Up to eight Regridders, including their weights, stay in memory for the
+    life of the process so that repeated comparisons on the same grids are
+    fast. Call this to free them.
+    """
+    _COMPARISON_REGRIDDERS.clear()
+
+
+def _shared_color_limits(
+    da_src: xr.DataArray, da_tgt: xr.DataArray, kwargs: dict
+) -> dict:
+    """
+    Compute common color limits for the source and target panels.
+
+    The four reductions are evaluated in a single `dask.compute` call, so
+    lazy inputs are only read once.
+
+    Parameters
+    ----------
+    da_src : xr.DataArray
+        The source field.
+    da_tgt : xr.DataArray
+        The target field.
+    kwargs : dict
+        The plotting arguments given by the user.
+
+    Returns
+    -------
+    dict
+        `vmin` and `vmax` to pass to both panels; empty if the user set the
+        color scaling, a field has more than two dimensions (only a slice is
+        plotted) or the limits are not finite.
+    """
+    if {"vmin", "vmax", "robust", "levels", "norm"} & kwargs.keys():
+        return {}
+    if da_src.ndim > 2 or da_tgt.ndim > 2:
+        return {}
+
+    limits = (da_src.min(), da_src.max(), da_tgt.min(), da_tgt.max())
+    if dask is not None:
+        limits = dask.compute(*limits)
+    try:
+        lo, hi, lo_tgt, hi_tgt = (float(v) for v in limits)
+    except (TypeError, ValueError):
+        return {}
+    vmin, vmax = np.fmin(lo, lo_tgt), np.fmax(hi, hi_tgt)
+    if not (np.isfinite(vmin) and np.isfinite(vmax)):
+        return {}
+    return {"vmin": float(vmin), "vmax": float(vmax)}
+
+
 def plot_comparison(
     da_src: xr.DataArray,
     da_tgt: xr.DataArray,
@@ -468,6 +911,9 @@ def plot_comparison(
     regridder : Regridder, optional
         The regridder used to transform da_src to da_tgt.
         If provided, it will be used to calculate the difference plot correctly.
+        Otherwise a bilinear Regridder between the two grids is built (and
+        kept for later calls, see `clear_comparison_cache`), falling back to
+        linear interpolation if the weights cannot be generated.
     projection : Any, optional
         The projection for the axes.
     transform : Any, optional
@@ -495,25 +941,35 @@ def plot_comparison(
         raise ImportError("Matplotlib is required for plot_comparison.")
 
     if projection is None and ccrs is not None:
-        projection = ccrs.PlateCarree()
+        projection = _cartopy_crs("PlateCarree")
 
     # Enforce projection on all subplots for comparison consistency
     fig, axes = plt.subplots(
         1,
         3,
         figsize=(18, 5),
+        layout="constrained",
         subplot_kw={"projection": projection},
     )
 
+    # Resolve the transforms once per grid; the difference is on the target grid
+    src_transform = tgt_transform = transform
+    if transform is None and ccrs is not None:
+        src_transform = _detect_transform(da_src)
+        tgt_transform = _detect_transform(da_tgt)
+
+    # Put both data panels on one color scale
+    data_kwargs = {**_shared_color_limits(da_src, da_tgt, kwargs), **kwargs}
+
     # 1. Source Plot
     plot_static(
         da_src,
         ax=axes[0],
         projection=projection,
-        transform=transform,
+        transform=src_transform,
         cmap=cmap,
         title="Source Grid",
-        **kwargs,
+        **data_kwargs,
     )
 
     # 2. Target Plot
@@ -521,15 +977,17 @@ def plot_comparison(
         da_tgt,
         ax=axes[1],
         projection=projection,
-        transform=transform,
+        transform=tgt_transform,
         cmap=cmap,
         title="Target Grid",
-        **kwargs,
+        **data_kwargs,
     )
 
     # 3. Difference Plot
-    # Use Regridder if provided for exact difference, otherwise fallback to interp_like
+    # Use a Regridder for an exact difference, otherwise fallback to interp_like
     try:
+        if regridder is None:
+            regridder = _comparison_regridder(da_src, da_tgt)
         if regridder is not None:
             da_src_interp = regridder(da_src)
         else:
@@ -540,7 +998,7 @@ def plot_comparison(
             diff,
             ax=axes[2],
             projection=projection,
-            transform=transform,
+            transform=tgt_transform,
             cmap=diff_cmap,
             title="Difference (Tgt - Src_interp)",
             **kwargs,
@@ -559,7 +1017,6 @@ def plot_comparison(
     if title:
         fig.suptitle(title, fontsize=16)
 
-    plt.tight_layout()
     return fig
 
 
@@ -587,6 +1044,9 @@ def plot_comparison_interactive(
     regridder : Regridder, optional
         The regridder used to transform da_src to da_tgt.
         If provided, it will be used to calculate the difference plot correctly.
+        Otherwise a bilinear Regridder between the two grids is built (and
+        kept for later calls, see `clear_comparison_cache`), falling back to
+        linear interpolation if the weights cannot be generated.
     rasterize : bool, default True
         Whether to rasterize the grid for large datasets.
     cmap : str, default 'viridis'
@@ -608,6 +1068,7 @@ def plot_comparison_interactive(
     ImportError
         If HvPlot or HoloViews is not installed.
     """
+    _import_hvplot()
     if not hvplot or hv is None:
         raise ImportError(
             "HvPlot and HoloViews are required for plot_comparison_interactive. "
@@ -622,6 +1083,8 @@ def plot_comparison_interactive(
 
     # 3. Difference Plot
     try:
+        if regridder is None:
+            regridder = _comparison_regridder(da_src, da_tgt)
         if regridder is not None:
             da_src_interp = regridder(da_src)
         else:
@@ -1,5 +1,7 @@
+import hashlib
 import sys
 import numpy as np
+import pytest
 
 
 def setup_esmpy_mock():
@@ -219,3 +221,120 @@ except (ImportError, Exception) as e:
     HAS_REAL_ESMF = False
     print(f"\n--- Real ESMF NOT detected in conftest.py: {e} ---")
     setup_esmpy_mock()
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "distributed: needs a dask.distributed cluster "
+        "(deselect with '-m \"not distributed\"')",
+    )
+
+
+# Session-wide grids and regridders. Building weights dominates the runtime of
+# small tests, so identical grids/regridders are built once and shared; tests
+# must not mutate them.
+@pytest.fixture(scope="session")
+def weights_dir(tmp_path_factory):
+    """Weights cache shared by the tests of one session."""
+    return str(tmp_path_factory.mktemp("weights"))
+
+
+@pytest.fixture(scope="session")
+def make_regridder(weights_dir):
+    """Build Regridders whose weights are reused from `weights_dir`."""
+    from xregrid import Regridder
+
+    def _make(src, tgt, method="bilinear", **kwargs):
+        return Regridder(src, tgt, method=method, cache_dir=weights_dir, **kwargs)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def regridder_factory(make_regridder):
+    """
+    Build Regridders once per session and share them between tests.
+
+    Instances are keyed on a digest of the source and target coordinates
+    and on the keyword arguments, so tests that build the same regridder
+    from equal grids get the same object. Shared instances must not be
+    mutated by the tests.
+    """
+    from xregrid.grid import _update_grid_digest
+
+    cache = {}
+
+    def _get(src, tgt, method="bilinear", **kwargs):
+        digest = hashlib.blake2b(digest_size=16)
+        for ds in (src, tgt):
+            _update_grid_digest(digest, ds, bounds=method == "conservative")
+        mask_var = kwargs.get("mask_var")
+        if mask_var is not None and mask_var in src:
+            digest.update(np.ascontiguousarray(src[mask_var].values).view(np.uint8))
+        key = (digest.hexdigest(), method, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = make_regridder(src, tgt, method=method, **kwargs)
+        return cache[key]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def grid_5():
+    from xregrid import create_global_grid
+
+    return create_global_grid(5, 5)
+
+
+@pytest.fixture(scope="session")
+def grid_10():
+    from xregrid import create_global_grid
+
+    return create_global_grid(10, 10)
+
+
+@pytest.fixture(scope="session")
+def grid_15():
+    from xregrid import create_global_grid
+
+    return create_global_grid(15, 15)
+
+
+@pytest.fixture(scope="session")
+def grid_20():
+    from xregrid import create_global_grid
+
+    return create_global_grid(20, 20)
+
+
+@pytest.fixture(scope="session")
+def grid_30():
+    from xregrid import create_global_grid
+
+    return create_global_grid(30, 30)
+
+
+@pytest.fixture(scope="session")
+def regridder_10_5_bilinear(grid_10, grid_5, make_regridder):
+    return make_regridder(grid_10, grid_5, method="bilinear")
+
+
+@pytest.fixture(scope="session")
+def regridder_30_15_bilinear(grid_30, grid_15, make_regridder):
+    return make_regridder(grid_30, grid_15, method="bilinear")
+
+
+@pytest.fixture(scope="session")
+def rand_arrays():
+    """
+    Deterministic uniform [0, 1) test data for the common grid shapes.
+
+    The arrays are shared by all tests and therefore read-only.
+    """
+    rng = np.random.default_rng(0)
+    shapes = [(6, 12), (9, 18), (10, 20), (18, 36), (36, 72), (5, 18, 36)]
+    arrays = {shape: rng.random(shape) for shape in shapes}
+    for arr in arrays.values():
+        arr.setflags(write=False)
+    return arrays
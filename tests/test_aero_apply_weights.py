@@ -73,9 +73,7 @@ def test_apply_weights_core_dask_integration():
     assert res.shape == (4, 1, 1)
 
     # Verify values
-    for i in range(4):
-        expected = np.mean(data[i])
-        np.testing.assert_allclose(res.values[i, 0, 0], expected)
+    np.testing.assert_allclose(res.values[:, 0, 0], data.mean(axis=(1, 2)))
 
 
 if __name__ == "__main__":
@@ -1,11 +1,11 @@
 import numpy as np
 import xarray as xr
 import dask.array as da
-from xregrid import Regridder, create_global_grid
+from xregrid import Regridder
 from xregrid.viz import plot_comparison
 
 
-def test_auto_bounds_conservative_numpy_dask():
+def test_auto_bounds_conservative_numpy_dask(grid_20, rand_arrays):
     """Verify auto-bounds generation for conservative regridding on both NumPy and Dask."""
     # Create a grid WITHOUT bounds but with standard names
     lat = np.linspace(-85, 85, 10)
@@ -17,12 +17,12 @@ def test_auto_bounds_conservative_numpy_dask():
     ds_src.lon.attrs["units"] = "degrees_east"
 
     # Target grid with bounds
-    ds_tgt = create_global_grid(20, 20)
+    ds_tgt = grid_20
 
     # 1. Eager path
     regridder_eager = Regridder(ds_src, ds_tgt, method="conservative")
     da_src_eager = xr.DataArray(
-        np.random.rand(10, 20), dims=("lat", "lon"), coords=ds_src.coords
+        rand_arrays[(10, 20)], dims=("lat", "lon"), coords=ds_src.coords
     )
     res_eager = regridder_eager(da_src_eager)
 
@@ -35,11 +35,13 @@ def test_auto_bounds_conservative_numpy_dask():
     assert "Automatically generated" in res_eager.attrs["history"]
 
 
-def test_plot_comparison_smoke():
+def test_plot_comparison_smoke(grid_30, monkeypatch, rand_arrays):
     """Smoke test for plot_comparison utility."""
-    ds = create_global_grid(30, 30)
+    # Plain Matplotlib axes: GeoAxes setup is not what this test checks
+    monkeypatch.setattr("xregrid.viz.ccrs", None)
+    ds = grid_30
     da_coords = {c: ds.coords[c] for c in ["lat", "lon"]}
-    da = xr.DataArray(np.random.rand(6, 12), dims=("lat", "lon"), coords=da_coords)
+    da = xr.DataArray(rand_arrays[(6, 12)], dims=("lat", "lon"), coords=da_coords)
 
     import matplotlib.pyplot as plt
 
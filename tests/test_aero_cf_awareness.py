@@ -1,25 +1,24 @@
 import numpy as np
 import pytest
 import xarray as xr
-from xregrid import Regridder, create_global_grid
 
 
-def test_cf_aware_dimension_mapping():
+def test_cf_aware_dimension_mapping(
+    grid_10, grid_5, regridder_10_5_bilinear, rand_arrays
+):
     """Verify that Regridder handles non-standard dimension names via CF-awareness."""
     # 1. Source grid with standard 'lat'/'lon'
-    src_res = 10.0
-    src_grid = create_global_grid(res_lat=src_res, res_lon=src_res)
+    src_grid = grid_10
 
     # 2. Target grid
-    tgt_res = 5.0
-    tgt_grid = create_global_grid(res_lat=tgt_res, res_lon=tgt_res)
+    tgt_grid = grid_5
 
-    # 3. Initialize Regridder
-    regridder = Regridder(src_grid, tgt_grid, method="bilinear")
+    # 3. Regridder between them
+    regridder = regridder_10_5_bilinear
 
     # 4. Input DataArray with different names: 'latitude' and 'longitude'
     # but marked with proper CF attributes
-    data = np.random.rand(18, 36)
+    data = rand_arrays[(18, 36)]
     da = xr.DataArray(
         data,
         dims=("latitude", "longitude"),
@@ -56,17 +55,15 @@ def test_cf_aware_dimension_mapping():
     np.testing.assert_allclose(res_eager.lon, tgt_grid.lon)
 
 
-def test_dataset_cf_awareness():
+def test_dataset_cf_awareness(grid_20, grid_10, make_regridder, rand_arrays):
     """Verify CF-aware regridding for multiple variables in a Dataset."""
-    src_grid = create_global_grid(20, 20)
-    tgt_grid = create_global_grid(10, 10)
-
-    regridder = Regridder(src_grid, tgt_grid)
+    src_grid = grid_20
+    regridder = make_regridder(grid_20, grid_10)
 
     # Dataset with mixed naming
     ds = xr.Dataset(
         data_vars={
-            "temp": (("latitude", "longitude"), np.random.rand(9, 18)),
+            "temp": (("latitude", "longitude"), rand_arrays[(9, 18)]),
             "scalar": 42.0,
         },
         coords={
@@ -1,24 +1,22 @@
-import numpy as np
 import pytest
 import xarray as xr
 import dask.array as da
-from xregrid import Regridder, create_global_grid
 
 
-def test_auxiliary_coordinate_preservation():
+def test_auxiliary_coordinate_preservation(
+    grid_10, regridder_10_5_bilinear, rand_arrays
+):
     """
     Verify that auxiliary spatial coordinates are preserved and regridded.
     Follows Aero Protocol: Eager (NumPy) and Lazy (Dask) verification.
     """
-    # Create grids
-    src_grid = create_global_grid(10, 10)  # 18x36
-    tgt_grid = create_global_grid(5, 5)  # 36x72
-
-    regridder = Regridder(src_grid, tgt_grid, method="bilinear")
+    # 18x36 -> 36x72
+    src_grid = grid_10
+    regridder = regridder_10_5_bilinear
 
     # 1. Eager (NumPy) DataArray Test
-    data = np.random.rand(18, 36)
-    alt = np.random.rand(18, 36)
+    data = rand_arrays[(18, 36)]
+    alt = rand_arrays[(18, 36)]
 
     da_eager = xr.DataArray(
         data,
@@ -50,21 +48,21 @@ def test_auxiliary_coordinate_preservation():
     xr.testing.assert_allclose(res_eager.altitude, res_lazy_comp.altitude)
 
 
-def test_auxiliary_coordinate_preservation_dataset():
+def test_auxiliary_coordinate_preservation_dataset(
+    grid_10, regridder_10_5_bilinear, rand_arrays
+):
     """Verify auxiliary coordinates are preserved in Datasets."""
-    src_grid = create_global_grid(10, 10)
-    tgt_grid = create_global_grid(5, 5)
-
-    regridder = Regridder(src_grid, tgt_grid, method="bilinear")
+    src_grid = grid_10
+    regridder = regridder_10_5_bilinear
 
     ds = xr.Dataset(
         data_vars={
-            "temp": (("lat", "lon"), np.random.rand(18, 36)),
+            "temp": (("lat", "lon"), rand_arrays[(18, 36)]),
         },
         coords={
             "lat": src_grid.lat,
             "lon": src_grid.lon,
-            "sensor_angle": (("lat", "lon"), np.random.rand(18, 36)),
+            "sensor_angle": (("lat", "lon"), rand_arrays[(18, 36)]),
             "static_metadata": "fixed_value",
         },
     )
@@ -78,21 +76,22 @@ def test_auxiliary_coordinate_preservation_dataset():
     assert res_ds.temp.shape == (36, 72)
 
 
-def test_mutual_auxiliary_coordinate_recursion():
+def test_mutual_auxiliary_coordinate_recursion(
+    grid_10, regridder_10_5_bilinear, rand_arrays
+):
     """Verify that mutual dependencies between coordinates don't cause infinite recursion."""
-    src_grid = create_global_grid(10, 10)
-    tgt_grid = create_global_grid(5, 5)
-    regridder = Regridder(src_grid, tgt_grid)
+    src_grid = grid_10
+    regridder = regridder_10_5_bilinear
 
     # Create mutual auxiliary coordinates
     lon_aux = xr.DataArray(
-        np.random.rand(18, 36),
+        rand_arrays[(18, 36)],
         dims=("lat", "lon"),
         coords={"lat": src_grid.lat, "lon": src_grid.lon},
         name="lon_aux",
     )
     lat_aux = xr.DataArray(
-        np.random.rand(18, 36),
+        rand_arrays[(18, 36)],
         dims=("lat", "lon"),
         coords={"lat": src_grid.lat, "lon": src_grid.lon},
         name="lat_aux",
@@ -103,7 +102,7 @@ def test_mutual_auxiliary_coordinate_recursion():
     lat_aux = lat_aux.assign_coords(lon_aux=lon_aux)
 
     da = xr.DataArray(
-        np.random.rand(18, 36),
+        rand_arrays[(18, 36)],
         dims=("lat", "lon"),
         coords={
             "lat": src_grid.lat,
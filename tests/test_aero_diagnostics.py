@@ -1,19 +1,10 @@
-import numpy as np
 import pytest
 import xarray as xr
-from xregrid import Regridder, create_global_grid
 
 
-def test_quality_report_metrics():
+def test_quality_report_metrics(regridder_10_5_bilinear):
     """Verify that quality_report returns expected keys and types."""
-    src_res = 10
-    tgt_res = 5
-    src_grid = create_global_grid(src_res, src_res)
-    tgt_grid = create_global_grid(tgt_res, tgt_res)
-
-    regridder = Regridder(src_grid, tgt_grid, method="bilinear")
-
-    report = regridder.quality_report()
+    report = regridder_10_5_bilinear.quality_report()
 
     assert isinstance(report, dict)
     expected_keys = {
@@ -35,11 +26,9 @@ def test_quality_report_metrics():
     assert report["n_dst"] == 36 * 72
 
 
-def test_weights_to_xarray_export():
+def test_weights_to_xarray_export(grid_10, make_regridder):
     """Verify that weights_to_xarray returns a valid xarray Dataset."""
-    src_grid = create_global_grid(10, 10)
-    tgt_grid = create_global_grid(10, 10)
-    regridder = Regridder(src_grid, tgt_grid, method="bilinear")
+    regridder = make_regridder(grid_10, grid_10, method="bilinear")
 
     ds_weights = regridder.weights_to_xarray()
 
@@ -52,29 +41,26 @@ def test_weights_to_xarray_export():
     assert ds_weights.attrs["n_dst"] == 18 * 36
 
 
-def test_repr_transparency():
+def test_repr_transparency(grid_30, make_regridder):
     """Verify that __repr__ contains quality information."""
-    src_grid = create_global_grid(30, 30)
-    tgt_grid = create_global_grid(30, 30)
-    regridder = Regridder(src_grid, tgt_grid)
+    regridder = make_regridder(grid_30, grid_30)
 
     repr_str = repr(regridder)
     assert "Regridder" in repr_str
     assert "unmapped=" in repr_str
 
 
-def test_aero_identity_with_diagnostics():
+def test_aero_identity_with_diagnostics(grid_30, regridder_30_15_bilinear, rand_arrays):
     """
     Aero Protocol: Verify that regridding results are identical for Eager and Lazy data,
     and that diagnostics remain consistent.
     """
     # Small grid for fast testing
-    src_grid = create_global_grid(30, 30)
-    tgt_grid = create_global_grid(15, 15)
-    regridder = Regridder(src_grid, tgt_grid, method="bilinear")
+    src_grid = grid_30
+    regridder = regridder_30_15_bilinear
 
     # 1. Eager Data
-    data = np.random.rand(6, 12)
+    data = rand_arrays[(6, 12)]
     da_eager = xr.DataArray(
         data,
         dims=("lat", "lon"),
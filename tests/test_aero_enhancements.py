@@ -2,13 +2,12 @@ import os
 import numpy as np
 import pytest
 import xarray as xr
-from xregrid import Regridder, create_global_grid, load_esmf_file
+from xregrid import Regridder, load_esmf_file
 
 
-def test_extrap_method_persistence():
+def test_extrap_method_persistence(grid_30, grid_10):
     """Verify that extrap_method is correctly stored and persisted."""
-    src = create_global_grid(30, 30)
-    tgt = create_global_grid(10, 10)
+    src, tgt = grid_30, grid_10
 
     # 1. Test weight generation with extrap_method
     regridder = Regridder(
@@ -43,13 +42,12 @@ def test_extrap_method_persistence():
         )
 
 
-def test_coordinate_preservation():
+def test_coordinate_preservation(grid_30, grid_10, make_regridder, rand_arrays):
     """Verify that non-spatial coordinates are preserved in Dataset regridding."""
-    src = create_global_grid(30, 30)
-    tgt = create_global_grid(10, 10)
+    src, tgt = grid_30, grid_10
 
     ds_in = xr.Dataset(
-        {"temp": (["lat", "lon"], np.random.rand(6, 12))},
+        {"temp": (["lat", "lon"], rand_arrays[(6, 12)])},
         coords={
             "lat": src.lat,
             "lon": src.lon,
@@ -58,7 +56,7 @@ def test_coordinate_preservation():
         },
     )
 
-    regridder = Regridder(src, tgt)
+    regridder = make_regridder(src, tgt)
     ds_out = regridder(ds_in)
 
     assert "scalar_coord" in ds_out.coords
@@ -67,7 +65,7 @@ def test_coordinate_preservation():
     assert ds_out.time.values[0] == np.datetime64("2020-01-01")
 
 
-def test_plot_static_nd_warning():
+def test_plot_static_nd_warning(rand_arrays):
     """Verify that plot_static handles N-D arrays with a warning."""
     try:
         import matplotlib.pyplot as plt
@@ -75,7 +73,7 @@ def test_plot_static_nd_warning():
         pytest.skip("matplotlib not installed")
 
     da = xr.DataArray(
-        np.random.rand(5, 18, 36),
+        rand_arrays[(5, 18, 36)],
         dims=("time", "lat", "lon"),
         coords={"lat": np.linspace(-90, 90, 18), "lon": np.linspace(0, 360, 36)},
     )
@@ -87,14 +85,13 @@ def test_plot_static_nd_warning():
     plt.close("all")
 
 
-def test_eager_lazy_identity_extrap():
+def test_eager_lazy_identity_extrap(grid_30, grid_15, make_regridder, rand_arrays):
     """Aero Protocol Double-Check: Verify eager and lazy results are identical."""
-    src = create_global_grid(30, 30)
-    tgt = create_global_grid(15, 15)
+    src, tgt = grid_30, grid_15
 
-    regridder = Regridder(src, tgt, extrap_method="nearest_s2d")
+    regridder = make_regridder(src, tgt, extrap_method="nearest_s2d")
 
-    data = np.random.rand(6, 12)
+    data = rand_arrays[(6, 12)]
     da_eager = xr.DataArray(
         data, dims=("lat", "lon"), coords={"lat": src.lat, "lon": src.lon}
     )
@@ -146,12 +143,9 @@ def test_load_esmf_file_scrip(tmp_path):
     assert "renamed standard variables" in ds_loaded.attrs["history"]
 
 
-def test_quality_report_dataset():
+def test_quality_report_dataset(grid_30, grid_20, make_regridder):
     """Verify Regridder.quality_report supports format='dataset'."""
-    src_grid = create_global_grid(30, 30)
-    tgt_grid = create_global_grid(20, 20)
-
-    regridder = Regridder(src_grid, tgt_grid, method="bilinear")
+    regridder = make_regridder(grid_30, grid_20, method="bilinear")
 
     report_ds = regridder.quality_report(format="dataset")
 
@@ -163,17 +157,17 @@ def test_quality_report_dataset():
     assert "history" in report_ds.attrs
 
 
-def test_regrid_recursion_safety_double_check():
+def test_regrid_recursion_safety_double_check(
+    grid_10, grid_20, make_regridder, rand_arrays
+):
     """Aero Protocol Double-Check: Verify recursion safety and backend identity."""
-    src_grid = create_global_grid(10, 10)
-    tgt_grid = create_global_grid(20, 20)
-
-    regridder = Regridder(src_grid, tgt_grid)
+    src_grid = grid_10
+    regridder = make_regridder(grid_10, grid_20)
 
     # Create an unnamed DataArray with an auxiliary coordinate
-    data = np.random.rand(18, 36).astype(np.float32)
+    data = rand_arrays[(18, 36)].astype(np.float32)
     aux_coord = xr.DataArray(
-        np.random.rand(18, 36).astype(np.float32), dims=("lat", "lon"), name="aux"
+        rand_arrays[(18, 36)].astype(np.float32), dims=("lat", "lon"), name="aux"
     )
 
     da_eager = xr.DataArray(
@@ -201,5 +195,54 @@ def test_regrid_recursion_safety_double_check():
     assert res_eager.aux.shape == (9, 18)
 
 
+def test_aux_coords_regridded_in_one_pass(
+    grid_10, grid_20, make_regridder, rand_arrays
+):
+    """
+    Aero Protocol: eager auxiliary coordinates share one weight application
+    and are not regridded again as coordinates of each other.
+    Double-Check Test: NumPy vs Dask backends.
+    """
+    from unittest.mock import patch
+
+    import xregrid.regridder as regridder_mod
+
+    regridder = make_regridder(grid_10, grid_20)
+    field = rand_arrays[(18, 36)]
+    coords = {"lat": grid_10.lat, "lon": grid_10.lon}
+    for i, name in enumerate(["aux_a", "aux_b", "aux_c"]):
+        coords[name] = (("lat", "lon"), field + i)
+    da_eager = xr.DataArray(
+        rand_arrays[(5, 18, 36)], dims=("time", "lat", "lon"), coords=coords
+    )
+    ds_eager = xr.Dataset({"t": da_eager, "q": 2 * da_eager})
+
+    apply_core = regridder_mod._apply_weights_core
+    with patch.object(
+        regridder_mod, "_apply_weights_core", side_effect=apply_core
+    ) as spy:
+        res_eager = regridder(da_eager)
+        # One batched call for the three coordinates, one for the data
+        assert spy.call_count == 2
+        spy.reset_mock()
+        res_ds_eager = regridder(ds_eager)
+        assert spy.call_count == 1
+
+    res_lazy = regridder(da_eager.chunk({"time": 1})).compute()
+    res_ds_lazy = regridder(ds_eager.chunk({"time": 1})).compute()
+    for name in ["aux_a", "aux_b", "aux_c"]:
+        assert res_eager[name].dims == ("lat", "lon")
+    expected_b = regridder(
+        xr.DataArray(
+            field + 1,
+            dims=("lat", "lon"),
+            coords={"lat": grid_10.lat, "lon": grid_10.lon},
+        )
+    )
+    np.testing.assert_allclose(res_eager.aux_b.values, expected_b.values)
+    xr.testing.assert_allclose(res_eager, res_lazy)
+    xr.testing.assert_allclose(res_ds_eager, res_ds_lazy)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
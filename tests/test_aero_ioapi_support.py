@@ -48,6 +48,45 @@ def test_create_grid_from_ioapi_lcc():
     xr.testing.assert_allclose(ds_eager, ds_lazy_comp)
 
 
+def test_create_grid_from_ioapi_corners_match_cell_transform():
+    """
+    Aero Protocol: corners gathered from the shared vertex mesh equal the
+    per-cell corner transform, and stay lazy on the Dask backend.
+    """
+    import pyproj
+
+    metadata = {
+        "GDTYP": 2,
+        "P_ALP": 33.0,
+        "P_BET": 45.0,
+        "P_GAM": -97.0,
+        "XCENT": -97.0,
+        "YCENT": 40.0,
+        "XORIG": -60000.0,
+        "YORIG": -36000.0,
+        "XCELL": 12000.0,
+        "YCELL": 12000.0,
+        "NCOLS": 10,
+        "NROWS": 6,
+    }
+    ds_eager = create_grid_from_ioapi(metadata)
+    ds_lazy = create_grid_from_ioapi(metadata, chunks={"x": 4, "y": 4})
+    assert hasattr(ds_lazy.lat_b.data, "dask")
+    assert ds_lazy.lat_b.chunks[:2] == ds_lazy.lat.chunks
+
+    x_b, y_b = ds_eager.x_b.values, ds_eager.y_b.values
+    xx = np.stack([x_b[None, :, 0], x_b[None, :, 1], x_b[None, :, 1], x_b[None, :, 0]])
+    yy = np.stack([y_b[:, None, 0], y_b[:, None, 0], y_b[:, None, 1], y_b[:, None, 1]])
+    xx, yy = np.broadcast_arrays(xx, yy)
+    transformer = pyproj.Transformer.from_crs(
+        pyproj.CRS(ds_eager.attrs["crs"]), "EPSG:4326", always_xy=True
+    )
+    lon_b, lat_b = transformer.transform(xx, yy)
+    np.testing.assert_allclose(ds_eager.lon_b.values, np.moveaxis(lon_b, 0, -1))
+    np.testing.assert_allclose(ds_eager.lat_b.values, np.moveaxis(lat_b, 0, -1))
+    xr.testing.assert_allclose(ds_eager, ds_lazy.compute())
+
+
 def test_create_grid_from_ioapi_all_gdtyp():
     """Verify that all supported IOAPI GDTYP values can generate a grid."""
     base_metadata = {
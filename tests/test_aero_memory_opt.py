@@ -1,25 +1,25 @@
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 import xarray as xr
+
 from xregrid import Regridder, create_global_grid
 
 
-def test_memory_opt_identity():
+def test_memory_opt_identity(grid_10, grid_20, regridder_factory):
     """
     Verify that memory-optimized paths produce identical results to the previous implementation.
     Aero Protocol: Eager (NumPy) vs Lazy (Dask) identity.
     """
-    res_src = 10.0
-    res_tgt = 20.0
-    src_grid = create_global_grid(res_src, res_src)
-    tgt_grid = create_global_grid(res_tgt, res_tgt)
+    src_grid = grid_10
 
     ntime = 2
     nlat = src_grid.lat.size
     nlon = src_grid.lon.size
 
     # Create data with some NaNs
-    data = np.random.rand(ntime, nlat, nlon).astype(np.float32)
+    data = np.random.default_rng(0).random((ntime, nlat, nlon), dtype=np.float32)
     data[:, 0, 0] = np.nan
 
     da_src = xr.DataArray(
@@ -30,7 +30,7 @@ def test_memory_opt_identity():
     )
 
     # 1. Eager path
-    regridder = Regridder(src_grid, tgt_grid, method="bilinear", skipna=True)
+    regridder = regridder_factory(grid_10, grid_20, skipna=True)
     da_eager = regridder(da_src)
 
     # 2. Lazy path
@@ -47,7 +47,7 @@ def test_memory_opt_identity():
 
 
 def test_repr_lazy_optimization():
-    """Verify that __repr__ is lazy for large grids."""
+    """Verify that __repr__ reports quality without building diagnostics."""
     res_src = 10.0
     res_tgt = 20.0
     src_grid = create_global_grid(res_src, res_src)
@@ -60,18 +60,20 @@ def test_repr_lazy_optimization():
     assert "unmapped=" in repr_str
     assert "quality=deferred" not in repr_str
 
-    # Manually mock a large target shape to trigger lazy repr
+    # Large grids: the report comes from cached O(nnz) row sums, so it is no
+    # longer deferred, and the target-grid diagnostics are never built
     regridder._shape_target = (1000, 1001)  # > 1,000,000 pixels
-    repr_str_large = repr(regridder)
-    assert "quality=deferred" in repr_str_large
-    assert "unmapped=" not in repr_str_large
+    with patch.object(Regridder, "diagnostics", side_effect=AssertionError):
+        repr_str_large = repr(regridder)
+    assert "unmapped=" in repr_str_large
 
 
 def test_matmul_backend_agnostic():
     """Basic test for _matmul helper."""
-    from xregrid.xregrid import _matmul
     from scipy.sparse import csr_matrix
 
+    from xregrid.xregrid import _matmul
+
     matrix = csr_matrix([[1, 0], [0, 2]])
     data = np.array([[10, 20], [30, 40]])
 
@@ -85,5 +87,322 @@ def test_matmul_backend_agnostic():
     np.testing.assert_array_equal(result, expected)
 
 
+def test_matmul_numba_matches_scipy():
+    """
+    Verify that the Numba CSR kernel matches the SciPy product.
+    Aero Protocol: Eager (NumPy) vs Lazy (Dask) identity.
+    """
+    pytest.importorskip("numba")
+    from scipy.sparse import random as sparse_random
+
+    from xregrid.core import _apply_weights_core, _can_use_numba, _matmul
+
+    rng = np.random.default_rng(42)
+    matrix = sparse_random(30, 50, density=0.1, format="csr", random_state=42)
+    data = rng.random((3, 50))
+    data[1, 5] = np.nan
+
+    assert _can_use_numba(matrix, data)
+    # Single slice (SpMV) and batched (SpMM) kernels
+    np.testing.assert_allclose(_matmul(matrix, data[:1]), (matrix @ data[:1].T).T)
+    result = _matmul(matrix, data)
+    expected = (matrix @ data.T).T
+    np.testing.assert_allclose(result, expected)
+
+    # Eager vs Lazy through the core apply function
+    da_src = xr.DataArray(data.reshape(3, 5, 10), dims=("time", "y", "x"))
+    kwargs = {
+        "weights_matrix": matrix,
+        "dims_source": ("y", "x"),
+        "shape_target": (30,),
+    }
+
+    def _apply(da):
+        return xr.apply_ufunc(
+            _apply_weights_core,
+            da,
+            kwargs=kwargs,
+            input_core_dims=[["y", "x"]],
+            output_core_dims=[["cell"]],
+            dask="parallelized",
+            output_dtypes=[da.dtype],
+            dask_gufunc_kwargs={"output_sizes": {"cell": 30}},
+        )
+
+    res_eager = _apply(da_src)
+    res_lazy = _apply(da_src.chunk({"time": 1}))
+    assert hasattr(res_lazy.data, "dask")
+    xr.testing.assert_allclose(res_eager, res_lazy.compute())
+    np.testing.assert_allclose(res_eager.values, expected)
+
+
+def test_matmul_numba_ell_path():
+    """Verify the fixed-width (ELLPACK) kernels against SciPy."""
+    numba = pytest.importorskip("numba")
+    from scipy.sparse import csr_matrix
+
+    from xregrid.core import (
+        _ELL_BATCHED_MIN_SLICES,
+        _TIME_PARALLEL_MIN_SLICES,
+        _ell_layout,
+        _matmul,
+    )
+
+    rng = np.random.default_rng(1)
+    n_dst, n_src, width = 20, 40, 4
+    rows = np.repeat(np.arange(n_dst), width)
+    cols = np.concatenate(
+        [rng.choice(n_src, width, replace=False) for _ in range(n_dst)]
+    )
+    matrix = csr_matrix((rng.random(n_dst * width), (rows, cols)), shape=(n_dst, n_src))
+
+    col_ell, _, _ = _ell_layout(matrix)
+    assert col_ell.shape == (n_dst, width)
+    # Constant row length: the CSR arrays are reused without copying
+    assert np.shares_memory(col_ell, matrix.indices)
+    assert _ell_layout(matrix)[0] is col_ell
+
+    # Short and empty rows are padded; the padding is never read
+    matrix_irregular = matrix.tolil()
+    matrix_irregular[0, :] = 0
+    matrix_irregular[1, cols[width + 1]] = 0
+    matrix_irregular = matrix_irregular.tocsr()
+    assert _ell_layout(matrix_irregular)[0].shape == (n_dst, width)
+
+    n_slices = (
+        1,
+        2,
+        _ELL_BATCHED_MIN_SLICES,
+        _TIME_PARALLEL_MIN_SLICES * numba.get_num_threads(),
+    )
+    for m in (matrix, matrix_irregular):
+        for n_other in n_slices:
+            data = rng.random((n_other, n_src), dtype=np.float32)
+            data[:, cols[:width]] = np.inf
+            with np.errstate(invalid="ignore"):
+                expected = (m @ data.T).T
+            np.testing.assert_allclose(_matmul(m, data), expected, rtol=1e-6)
+
+    # Long rows fall back to the CSR kernels
+    assert _ell_layout(csr_matrix(np.ones((2, 40)))) is None
+
+
+def test_matmul_numba_time_parallel():
+    """Verify the slice-parallel kernel used for many non-spatial slices."""
+    numba = pytest.importorskip("numba")
+    from scipy.sparse import random as sparse_random
+
+    from xregrid.core import _TIME_PARALLEL_MIN_SLICES, _matmul
+
+    matrix = sparse_random(30, 50, density=0.1, format="csr", random_state=0)
+    n_other = _TIME_PARALLEL_MIN_SLICES * numba.get_num_threads() + 1
+    data = np.random.default_rng(4).random((n_other, 50))
+    expected = (matrix @ data.T).T
+
+    np.testing.assert_allclose(_matmul(matrix, data), expected, rtol=1e-12)
+
+    # The kernel writes straight into a matching output buffer
+    out = np.empty((n_other, 30))
+    assert _matmul(matrix, data, out=out) is out
+    np.testing.assert_allclose(out, expected, rtol=1e-12)
+
+
+def test_matmul_selection_matrix_gather():
+    """Verify that selection matrices are applied as an exact index gather."""
+    from scipy.sparse import csr_matrix
+
+    from xregrid.core import _gather_layout, _matmul
+
+    rng = np.random.default_rng(5)
+    n_dst, n_src = 30, 50
+    cols = rng.choice(n_src, n_dst, replace=False)
+    matrix = csr_matrix(
+        (np.ones(n_dst, dtype=np.float32), cols, np.arange(n_dst + 1)),
+        shape=(n_dst, n_src),
+    )
+    assert _gather_layout(matrix) is _gather_layout(matrix)
+
+    data = rng.random((3, n_src))
+    data[0, cols[0]] = np.nan
+    out = np.empty((3, n_dst))
+    assert _matmul(matrix, data, out=out) is out
+    np.testing.assert_array_equal(out, data[:, cols])
+    assert _matmul(matrix, data.astype(np.float32)).dtype == np.float32
+
+    # Other weights, empty rows or several weights per row use the SpMM
+    scaled = matrix * 2.0
+    assert _gather_layout(scaled) is None
+    assert _gather_layout(csr_matrix((n_dst, n_src))) is None
+    assert _gather_layout(csr_matrix(np.ones((2, 3)))) is None
+    np.testing.assert_allclose(_matmul(scaled, data), 2 * data[:, cols])
+
+
+@pytest.mark.parametrize("n_other", [3, 6])
+def test_apply_weights_skipna_fused(n_other):
+    """Verify the fused NaN-skipping kernel for masks that vary between slices."""
+    pytest.importorskip("numba")
+    from scipy.sparse import random as sparse_random
+
+    from xregrid.core import _apply_weights_core
+
+    matrix = sparse_random(30, 48, density=0.2, format="csr", random_state=1)
+    total_weights = np.asarray(matrix.sum(axis=1)).ravel()
+    rng = np.random.default_rng(5)
+    data = rng.random((n_other, 6, 8))
+    data[rng.random(data.shape) < 0.3] = np.nan
+    data[1, :, :4] = np.nan
+
+    valid = ~np.isnan(data.reshape(n_other, -1))
+    sums = (matrix @ np.where(valid, data.reshape(n_other, -1), 0.0).T).T
+    weights_sum = (matrix @ valid.T.astype(float)).T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = sums / weights_sum
+    expected[weights_sum / total_weights < 0.5 - 1e-6] = np.nan
+
+    result = _apply_weights_core(
+        data,
+        matrix,
+        ("y", "x"),
+        (30,),
+        skipna=True,
+        total_weights=total_weights,
+        na_thres=0.5,
+    )
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+def test_nnz_row_bounds_balanced():
+    """Verify NNZ-balanced row partitioning on a skewed matrix."""
+    from scipy.sparse import csr_matrix
+
+    from xregrid.core import _matmul, _nnz_row_bounds, _row_bounds
+
+    rng = np.random.default_rng(3)
+    # One dense row, some empty rows and many light rows
+    dense = np.zeros((50, 200))
+    dense[0, :] = rng.random(200)
+    dense[10:, :2] = rng.random((40, 2))
+    matrix = csr_matrix(dense)
+
+    bounds = _nnz_row_bounds(matrix.indptr, 4)
+    assert bounds[0] == 0 and bounds[-1] == matrix.shape[0]
+    assert np.all(np.diff(bounds) >= 0)
+    # The heavy first row gets a range of its own
+    assert bounds[1] == 1
+    # The partition is computed once per matrix
+    np.testing.assert_array_equal(_row_bounds(matrix, 4), bounds)
+    assert _row_bounds(matrix, 4) is _row_bounds(matrix, 4)
+
+    data = rng.random((2, 200))
+    np.testing.assert_allclose(_matmul(matrix, data), (matrix @ data.T).T)
+    np.testing.assert_allclose(_matmul(matrix, data[:1]), (matrix @ data[:1].T).T)
+
+
+def test_apply_weights_core_gpu_weights():
+    """Verify device-resident (CuPy) weights against the CPU result."""
+    pytest.importorskip("cupy")
+    from scipy.sparse import csr_matrix
+
+    from xregrid.core import _apply_weights_core, _weights_to_gpu
+
+    rng = np.random.default_rng(2)
+    weights = csr_matrix(rng.random((6, 12)) * (rng.random((6, 12)) > 0.5))
+    data = rng.random((3, 3, 4))
+
+    res_cpu = _apply_weights_core(data, weights, ("y", "x"), (6,))
+    res_gpu = _apply_weights_core(data, _weights_to_gpu(weights), ("y", "x"), (6,))
+
+    assert isinstance(res_gpu, np.ndarray)
+    np.testing.assert_allclose(res_gpu, res_cpu)
+
+
+def test_apply_weights_float16_storage():
+    """Verify that half-precision data is accumulated in float32 and stays float16."""
+    from scipy.sparse import csr_matrix
+
+    from xregrid.core import _apply_weights_core
+
+    rng = np.random.default_rng(0)
+    weights = csr_matrix(rng.random((6, 12)) * (rng.random((6, 12)) > 0.5))
+    data = rng.random((2, 3, 4)).astype(np.float16)
+
+    result = _apply_weights_core(data, weights, ("y", "x"), (6,))
+    expected = (weights @ data.reshape(2, 12).astype(np.float32).T).T
+
+    assert result.dtype == np.float16
+    np.testing.assert_allclose(result, expected, rtol=1e-3)
+
+
+def test_row_weight_sums_and_quality_report():
+    """Verify the cached row sums and that both report formats agree."""
+    from scipy.sparse import csr_matrix
+
+    from xregrid.core import _row_weight_sums
+
+    dense = np.random.default_rng(6).random((5, 7))
+    dense[[0, 3]] = 0.0  # rows without weights
+    matrix = csr_matrix(dense)
+    sums = _row_weight_sums(matrix)
+    np.testing.assert_allclose(sums, dense.sum(axis=1))
+    assert _row_weight_sums(matrix) is sums
+    assert not _row_weight_sums(csr_matrix((3, 4))).any()
+
+    regridder = Regridder(
+        create_global_grid(30, 30), create_global_grid(20, 20), method="bilinear"
+    )
+    report = regridder.quality_report()
+    report_ds = regridder.quality_report(format="dataset")
+    for key in (
+        "unmapped_count",
+        "weight_sum_min",
+        "weight_sum_max",
+        "weight_sum_mean",
+    ):
+        np.testing.assert_allclose(report[key], float(report_ds[key]))
+
+
+def test_numba_kernels_release_gil():
+    """The weight kernels release the GIL for Dask's threaded scheduler."""
+    pytest.importorskip("numba")
+    from xregrid import core
+
+    kernels = [
+        getattr(core, name)
+        for name in dir(core)
+        if name.startswith("_apply_weights_numba")
+    ]
+    assert kernels
+    for kernel in kernels:
+        assert kernel.targetoptions.get("nogil") is True, kernel.__name__
+
+
+def test_weights_sorted_indices(grid_10, grid_20, regridder_factory):
+    """Verify that generated weights have sorted column indices per row."""
+    regridder = regridder_factory(grid_10, grid_20)
+    assert regridder.weights.has_sorted_indices
+    # Small grids fit in 32-bit CSR indices
+    assert regridder.weights.indices.dtype == np.int32
+    assert regridder.weights.indptr.dtype == np.int32
+
+
+def test_weights_dtype_storage(grid_10, grid_20, regridder_factory):
+    """Verify double-precision weight storage by default and the float32 opt-in."""
+    regridder = regridder_factory(grid_10, grid_20)
+    assert regridder.weights.dtype == np.float64
+
+    regridder32 = regridder_factory(grid_10, grid_20, weights_dtype=np.float32)
+    assert regridder32.weights.dtype == np.float32
+
+    # float64 data keeps float64 results with either weight precision
+    da = xr.DataArray(
+        np.random.default_rng(0).random((2, 18, 36)),
+        dims=("time", "lat", "lon"),
+        coords={"lat": grid_10.lat, "lon": grid_10.lon},
+    )
+    res32 = regridder32(da)
+    assert res32.dtype == np.float64
+    np.testing.assert_allclose(res32, regridder(da), rtol=1e-6)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
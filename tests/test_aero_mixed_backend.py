@@ -42,9 +42,9 @@ def test_mixed_backend_dataset_regrid():
             regridder = Regridder(ds_src, ds_tgt, method="bilinear", parallel=True)
 
             # Ensure weights are indeed remote
-            assert hasattr(
-                regridder._weights_matrix, "key"
-            ), "Weights should be Dask Futures"
+            assert hasattr(regridder._weights_matrix, "key"), (
+                "Weights should be Dask Futures"
+            )
 
             # 4. Regrid!
             # Before the fix, this would crash when processing "var_eager"
@@ -55,12 +55,12 @@ def test_mixed_backend_dataset_regrid():
             assert "var_lazy" in ds_out
 
             # Check backends are preserved
-            assert not hasattr(
-                ds_out.var_eager.data, "dask"
-            ), "var_eager should remain NumPy-backed"
-            assert hasattr(
-                ds_out.var_lazy.data, "dask"
-            ), "var_lazy should remain Dask-backed"
+            assert not hasattr(ds_out.var_eager.data, "dask"), (
+                "var_eager should remain NumPy-backed"
+            )
+            assert hasattr(ds_out.var_lazy.data, "dask"), (
+                "var_lazy should remain Dask-backed"
+            )
 
             # Check shape
             expected_shape_tgt = (ds_tgt.sizes["lat"], ds_tgt.sizes["lon"])
@@ -76,3 +76,43 @@ def test_mixed_backend_dataset_regrid():
             assert "Regridded" in ds_out.attrs["history"]
             assert "var_eager" in ds_out.data_vars
             assert "var_lazy" in ds_out.data_vars
+
+
+def test_dataset_eager_variables_batched():
+    """
+    Aero Protocol: eager variables of a Dataset share one weight application.
+    Double-Check Test: NumPy vs Dask backends and per-variable results.
+    """
+    from unittest.mock import patch
+
+    import xregrid.regridder as regridder_module
+
+    ds_src = create_global_grid(10.0, 10.0)
+    ds_tgt = create_regional_grid((20, 40), (40, 60), 10.0, 10.0)
+    regridder = Regridder(ds_src, ds_tgt)
+
+    rng = np.random.default_rng(0)
+    n_lat, n_lon = ds_src.sizes["lat"], ds_src.sizes["lon"]
+    ds_input = xr.Dataset(
+        {
+            "salt": (["time", "lev", "lat", "lon"], rng.random((2, 3, n_lat, n_lon))),
+            "zeta": (["time", "lat", "lon"], rng.random((2, n_lat, n_lon))),
+            "flipped": (["lon", "lat"], rng.random((n_lon, n_lat))),
+            "single": (["lat", "lon"], rng.random((n_lat, n_lon), dtype=np.float32)),
+        },
+        coords=ds_src.coords,
+    )
+
+    with patch.object(
+        regridder_module,
+        "_apply_weights_core",
+        wraps=regridder_module._apply_weights_core,
+    ) as mock_apply:
+        res_eager = regridder(ds_input)
+    # One call for the three float64 variables, one for the float32 variable
+    assert mock_apply.call_count == 2
+
+    for name, var in ds_input.data_vars.items():
+        xr.testing.assert_allclose(res_eager[name], regridder(var))
+    res_lazy = regridder(ds_input.chunk({"time": 1}))
+    xr.testing.assert_allclose(res_eager, res_lazy.compute())
@@ -0,0 +1,202 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+from xregrid import Regridder
+
+pytest.importorskip("numba")
+
+
+def _unit_xyz(lat, lon):
+    lat, lon = np.deg2rad(lat), np.deg2rad(lon)
+    return np.stack(
+        [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=1
+    )
+
+
+def _brute_force_nearest(src_lat, src_lon, tgt_lat, tgt_lon, valid=None):
+    dist = (
+        (_unit_xyz(tgt_lat, tgt_lon)[:, None, :] - _unit_xyz(src_lat, src_lon)) ** 2
+    ).sum(axis=-1)
+    if valid is not None:
+        dist[:, ~valid] = np.inf
+    return dist.argmin(axis=1)
+
+
+@pytest.mark.parametrize("regional", [False, True])
+def test_bucket_index_matches_brute_force(regional):
+    """The bucket index returns the exact great-circle nearest site."""
+    from xregrid.nearest import _NearestS2DBucketIndex
+
+    rng = np.random.default_rng(0)
+    if regional:
+        # Regional cloud across the dateline
+        src_lat = rng.uniform(40, 60, 800)
+        src_lon = rng.uniform(170, 200, 800)
+    else:
+        src_lat = np.rad2deg(np.arcsin(rng.uniform(-1, 1, 800)))
+        src_lon = rng.uniform(-180, 180, 800)
+    tgt_lat = np.r_[90.0, -90.0, rng.uniform(-90, 90, 300)]
+    tgt_lon = np.r_[0.0, 0.0, rng.uniform(0, 360, 300)]
+    valid = rng.random(800) > 0.3
+
+    index = _NearestS2DBucketIndex(src_lat, src_lon, valid=valid)
+    np.testing.assert_array_equal(
+        index.query(tgt_lat, tgt_lon),
+        _brute_force_nearest(src_lat, src_lon, tgt_lat, tgt_lon, valid),
+    )
+
+
+def test_regridder_nearest_s2d_bucket_index():
+    """
+    Aero Protocol: nearest_s2d from a point cloud bypasses ESMF.
+    Double-Check Test: NumPy vs Dask backends.
+    """
+    rng = np.random.default_rng(1)
+    n_src = 500
+    src_lat = np.rad2deg(np.arcsin(rng.uniform(-1, 1, n_src)))
+    src_lon = rng.uniform(0, 360, n_src)
+    mask = (rng.random(n_src) > 0.2).astype(np.int32)
+    src_grid = xr.Dataset(
+        {"mask": ("n_pts", mask)},
+        coords={"lat": ("n_pts", src_lat), "lon": ("n_pts", src_lon)},
+    )
+    tgt_grid = xr.Dataset(
+        coords={"lat": np.arange(-85.0, 90.0, 10.0), "lon": np.arange(0, 360.0, 20)}
+    )
+
+    regridder = Regridder(
+        src_grid, tgt_grid, method="nearest_s2d", mask_var="mask", nearest_index=True
+    )
+
+    tgt_lon, tgt_lat = np.meshgrid(tgt_grid.lon.values, tgt_grid.lat.values)
+    expected = _brute_force_nearest(
+        src_lat, src_lon, tgt_lat.ravel(), tgt_lon.ravel(), mask.astype(bool)
+    )
+    weights = regridder.weights
+    assert weights.shape == (tgt_lat.size, n_src)
+    np.testing.assert_array_equal(weights.indices, expected)
+    np.testing.assert_array_equal(weights.data, 1.0)
+
+    da = xr.DataArray(
+        rng.random((2, n_src)),
+        dims=("time", "n_pts"),
+        coords={"lat": ("n_pts", src_lat), "lon": ("n_pts", src_lon)},
+    )
+    res_eager = regridder(da)
+    res_lazy = regridder(da.chunk({"time": 1}))
+    np.testing.assert_allclose(
+        res_eager.values.reshape(2, -1), da.values[:, expected], rtol=1e-12
+    )
+    xr.testing.assert_allclose(res_eager, res_lazy.compute())
+
+    # ESMF stays the default
+    default = Regridder(src_grid, tgt_grid, method="nearest_s2d", mask_var="mask")
+    assert default.nearest_index is False
+    assert default._nn_index is None
+
+
+def test_tree_index_matches_brute_force():
+    """The KD-tree index agrees with the bucket index and brute force."""
+    from xregrid.nearest import _NearestS2DBucketIndex, _NearestS2DTreeIndex
+
+    rng = np.random.default_rng(2)
+    src_lat = np.rad2deg(np.arcsin(rng.uniform(-1, 1, 600)))
+    src_lon = rng.uniform(0, 360, 600)
+    tgt_lat = np.r_[np.nan, rng.uniform(-90, 90, 200)]
+    tgt_lon = np.r_[0.0, rng.uniform(-180, 180, 200)]
+
+    tree = _NearestS2DTreeIndex(src_lat, src_lon)
+    result = tree.query(tgt_lat, tgt_lon)
+    assert result[0] == -1
+    np.testing.assert_array_equal(
+        result[1:], _brute_force_nearest(src_lat, src_lon, tgt_lat[1:], tgt_lon[1:])
+    )
+    np.testing.assert_array_equal(
+        result, _NearestS2DBucketIndex(src_lat, src_lon).query(tgt_lat, tgt_lon)
+    )
+
+
+def test_regridder_nearest_s2d_curvilinear_tree():
+    """
+    Aero Protocol: nearest_s2d from a curvilinear source uses a cached KD-tree.
+    Double-Check Test: NumPy vs Dask backends.
+    """
+    eta, xi = np.meshgrid(np.arange(20.0), np.arange(30.0), indexing="ij")
+    src_lat = 30 + 0.5 * eta + 0.1 * xi
+    src_lon = 200 + 0.5 * xi - 0.1 * eta
+    src_grid = xr.Dataset(
+        coords={
+            "lat": (("eta_rho", "xi_rho"), src_lat),
+            "lon": (("eta_rho", "xi_rho"), src_lon),
+        }
+    )
+    tgt_grid = xr.Dataset(
+        coords={"lat": np.arange(32.0, 40.0, 1.5), "lon": np.arange(202.0, 214.0, 2.0)}
+    )
+
+    regridder = Regridder(
+        src_grid, tgt_grid, method="nearest_s2d", periodic=True, nearest_index=True
+    )
+    assert regridder._nn_index is not None
+
+    tgt_lon, tgt_lat = np.meshgrid(tgt_grid.lon.values, tgt_grid.lat.values)
+    expected = _brute_force_nearest(
+        src_lat.ravel(), src_lon.ravel(), tgt_lat.ravel(), tgt_lon.ravel()
+    )
+    np.testing.assert_array_equal(regridder.weights.indices, expected)
+
+    da = xr.DataArray(
+        np.random.default_rng(3).random((3, 20, 30)),
+        dims=("ocean_time", "eta_rho", "xi_rho"),
+        coords=src_grid.coords,
+    )
+    res_eager = regridder(da)
+    res_lazy = regridder(da.chunk({"ocean_time": 1}))
+    np.testing.assert_allclose(
+        res_eager.values.reshape(3, -1), da.values.reshape(3, -1)[:, expected]
+    )
+    xr.testing.assert_allclose(res_eager, res_lazy.compute())
+
+
+def test_regridder_nearest_s2d_planar_prime_meridian():
+    """
+    Aero Protocol: regional planar lookups use the raw longitudes, like ESMF CART.
+    Double-Check Test: NumPy vs Dask backends.
+    """
+    from xregrid.nearest import _NearestS2DTreeIndex
+
+    # No artificial seam at 0 degrees
+    index = _NearestS2DTreeIndex(
+        np.zeros(3), np.array([-1.0, 0.5, 4.0]), spherical=False
+    )
+    np.testing.assert_array_equal(index.query([0.0, 0.0], [-0.1, 3.0]), [1, 2])
+
+    src_grid = xr.Dataset(
+        coords={"lat": np.arange(40.0, 46.0), "lon": np.arange(-5.0, 6.0)}
+    )
+    tgt_grid = xr.Dataset(
+        coords={"lat": np.array([41.2, 43.7]), "lon": np.array([-0.4, -0.1, 0.3])}
+    )
+    regridder = Regridder(src_grid, tgt_grid, method="nearest_s2d", nearest_index=True)
+    assert not regridder._nn_index.spherical
+
+    tgt_lon, tgt_lat = np.meshgrid(tgt_grid.lon.values, tgt_grid.lat.values)
+    # Source column of lon 0.0 and nearest source rows
+    expected = np.ravel_multi_index(
+        (np.round(tgt_lat.ravel() - 40.0).astype(int), np.full(tgt_lat.size, 5)),
+        (6, 11),
+    )
+    np.testing.assert_array_equal(regridder.weights.indices, expected)
+
+    da = xr.DataArray(
+        np.random.default_rng(4).random((2, 6, 11)),
+        dims=("time", "lat", "lon"),
+        coords=src_grid.coords,
+    )
+    res_eager = regridder(da)
+    res_lazy = regridder(da.chunk({"time": 1}))
+    np.testing.assert_allclose(
+        res_eager.values.reshape(2, -1), da.values.reshape(2, -1)[:, expected]
+    )
+    xr.testing.assert_allclose(res_eager, res_lazy.compute())
@@ -64,6 +64,35 @@ def test_no_hidden_compute_on_weight_load():
         os.remove(filename)
 
 
+def test_no_hidden_compute_on_curvilinear_weight_load(tmp_path):
+    """Reloading weights checks 2D dask coordinates by shape only."""
+    from dask.callbacks import Callback
+
+    lon, lat = np.meshgrid(np.linspace(0, 350, 36), np.linspace(-60, 60, 20))
+    attrs_lat = {"units": "degrees_north", "standard_name": "latitude"}
+    attrs_lon = {"units": "degrees_east", "standard_name": "longitude"}
+    src_grid = xr.Dataset(
+        coords={
+            "lat": (("y", "x"), da.from_array(lat, chunks=(5, 36)), attrs_lat),
+            "lon": (("y", "x"), da.from_array(lon, chunks=(5, 36)), attrs_lon),
+        }
+    )
+    filename = str(tmp_path / "weights_curvilinear.nc")
+    Regridder(src_grid, src_grid, filename=filename, reuse_weights=True)
+
+    class ComputeCounter(Callback):
+        count = 0
+
+        def _pretask(self, key, dsk, state):
+            ComputeCounter.count += 1
+
+    with ComputeCounter():
+        regridder = Regridder(src_grid, src_grid, filename=filename, reuse_weights=True)
+
+    assert ComputeCounter.count == 0
+    assert regridder._shape_source == (20, 36)
+
+
 def test_plot_static_robust_slicing():
     """Verify plot_static correctly handles non-standard dimension orders using cf-xarray."""
     # Create a 3D DataArray where spatial dims are NOT the last two
@@ -113,3 +142,69 @@ def test_weight_persistence_robustness():
 
     if os.path.exists(filename):
         os.remove(filename)
+
+
+def test_weight_persistence_npz(tmp_path):
+    """
+    Aero Protocol: weights saved as .npz reload identically to NetCDF.
+    Double-Check Test: NumPy vs Dask backends.
+    """
+    src_grid = create_global_grid(10, 10)
+    tgt_grid = create_global_grid(20, 20)
+    nc_file = str(tmp_path / "weights.nc")
+    npz_file = str(tmp_path / "weights.npz")
+
+    ref = Regridder(src_grid, tgt_grid, filename=nc_file, reuse_weights=True)
+    Regridder(src_grid, tgt_grid, filename=npz_file, reuse_weights=True)
+    assert os.path.exists(npz_file)
+
+    from_nc = Regridder(src_grid, tgt_grid, filename=nc_file, reuse_weights=True)
+    from_npz = Regridder(src_grid, tgt_grid, filename=npz_file, reuse_weights=True)
+    assert from_npz._shape_source == from_nc._shape_source == ref._shape_source
+    assert from_npz._dims_target == from_nc._dims_target
+    assert from_npz._loaded_method == "bilinear"
+    assert from_npz.weights.dtype == from_nc.weights.dtype
+    assert (from_npz.weights != from_nc.weights).nnz == 0
+
+    with pytest.raises(ValueError, match="method"):
+        Regridder(
+            src_grid,
+            tgt_grid,
+            method="conservative",
+            filename=npz_file,
+            reuse_weights=True,
+        )
+
+    data = xr.DataArray(
+        np.random.default_rng(0).random((3, 18, 36)),
+        dims=("time", "lat", "lon"),
+        coords={"lat": src_grid.lat, "lon": src_grid.lon},
+    )
+    res_eager = from_npz(data)
+    res_lazy = from_npz(data.chunk({"time": 1}))
+    xr.testing.assert_allclose(res_eager, from_nc(data))
+    xr.testing.assert_allclose(res_eager, res_lazy.compute())
+
+
+def test_weight_load_unsorted_rows(tmp_path):
+    """Weight files whose entries are not sorted by row load identically."""
+    src_grid = create_global_grid(10, 10)
+    tgt_grid = create_global_grid(20, 20)
+    from scipy.sparse import random as sparse_random
+
+    filename = str(tmp_path / "weights.nc")
+    ref = Regridder(src_grid, tgt_grid, filename=filename)
+    ref._weights_matrix = sparse_random(
+        9 * 18, 18 * 36, density=0.02, format="csr", dtype=np.float32, random_state=0
+    )
+    ref._save_weights()
+
+    with xr.open_dataset(filename) as ds:
+        shuffled = ds.isel(n_s=np.random.default_rng(0).permutation(ds.sizes["n_s"]))
+        shuffled.load()
+    shuffled_file = str(tmp_path / "weights_shuffled.nc")
+    shuffled.to_netcdf(shuffled_file)
+
+    loaded = Regridder(src_grid, tgt_grid, filename=shuffled_file, reuse_weights=True)
+    assert loaded.weights.has_sorted_indices
+    assert (loaded.weights != ref.weights).nnz == 0
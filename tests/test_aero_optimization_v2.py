@@ -1,19 +1,17 @@
 import numpy as np
 import xarray as xr
 import pytest
-from xregrid import Regridder, create_global_grid
 
 
-def test_optimization_v2_identity():
+def test_optimization_v2_identity(grid_10, grid_5, regridder_factory, rand_arrays):
     """Verify that the optimized path produces identical results to a known-valid path."""
-    src_grid = create_global_grid(10, 10)
-    tgt_grid = create_global_grid(5, 5)
+    src_grid = grid_10
 
     # skipna=True to trigger the optimized code path
-    regridder = Regridder(src_grid, tgt_grid, method="bilinear", skipna=True)
+    regridder = regridder_factory(grid_10, grid_5, method="bilinear", skipna=True)
 
     # 1. Data with NO NaNs (triggers fast path)
-    data_clean = np.random.rand(18, 36)
+    data_clean = rand_arrays[(18, 36)]
     da_clean = xr.DataArray(
         data_clean,
         dims=("lat", "lon"),
@@ -41,13 +39,12 @@ def test_optimization_v2_identity():
     assert res_dirty is not None
 
 
-def test_lazy_data_handling():
+def test_lazy_data_handling(grid_10, grid_5, regridder_factory, rand_arrays):
     """Verify that Dask-backed data works with the optimized skipna path."""
-    src_grid = create_global_grid(10, 10)
-    tgt_grid = create_global_grid(5, 5)
-    regridder = Regridder(src_grid, tgt_grid, method="bilinear", skipna=True)
+    src_grid = grid_10
+    regridder = regridder_factory(grid_10, grid_5, method="bilinear", skipna=True)
 
-    data = np.random.rand(18, 36)
+    data = rand_arrays[(18, 36)]
     da_lazy = xr.DataArray(
         data, dims=("lat", "lon"), coords={"lat": src_grid.lat, "lon": src_grid.lon}
     ).chunk({"lat": 9})
@@ -61,18 +58,16 @@ def test_lazy_data_handling():
     assert res_computed.shape == (36, 72)
 
 
-def test_dataset_regridding_provenance():
+def test_dataset_regridding_provenance(grid_30, regridder_30_15_bilinear):
     """Verify Dataset regridding preserves history and non-spatial coords."""
-    src_grid = create_global_grid(10, 10)
-    tgt_grid = create_global_grid(5, 5)
-    regridder = Regridder(src_grid, tgt_grid)
+    regridder = regridder_30_15_bilinear
 
     ds = xr.Dataset(
         data_vars={
-            "temp": (("lat", "lon"), np.random.rand(18, 36)),
-            "mask": (("lat", "lon"), np.ones((18, 36))),
+            "temp": (("lat", "lon"), np.zeros((6, 12))),
+            "mask": (("lat", "lon"), np.ones((6, 12))),
         },
-        coords={"lat": src_grid.lat, "lon": src_grid.lon, "time": [0]},
+        coords={"lat": grid_30.lat, "lon": grid_30.lon, "time": [0]},
     )
 
     res_ds = regridder(ds)
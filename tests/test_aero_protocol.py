@@ -2,10 +2,9 @@ import dask.array as da
 import numpy as np
 import pytest
 import xarray as xr
-from xregrid import Regridder, create_global_grid
 
 
-def test_eager_lazy_identity_dim_orders():
+def test_eager_lazy_identity_dim_orders(regridder_factory, rand_arrays):
     """Verify Eager and Lazy results are identical even with different dimension orders."""
     # Source grid: 10x20
     lat = np.linspace(-90, 90, 10)
@@ -18,10 +17,10 @@ def test_eager_lazy_identity_dim_orders():
     src_grid = xr.Dataset(coords={"lat": lat, "lon": lon})
     tgt_grid = xr.Dataset(coords={"lat": lat_out, "lon": lon_out})
 
-    regridder = Regridder(src_grid, tgt_grid, method="bilinear")
+    regridder = regridder_factory(src_grid, tgt_grid, method="bilinear")
 
     # 1. Eager (lat, lon)
-    data = np.random.rand(10, 20)
+    data = rand_arrays[(10, 20)]
     da_eager = xr.DataArray(data, dims=("lat", "lon"), coords={"lat": lat, "lon": lon})
     res_eager = regridder(da_eager)
 
@@ -39,12 +38,11 @@ def test_eager_lazy_identity_dim_orders():
     assert isinstance(regridder(da_lazy).data, da.Array)
 
 
-def test_skipna_robustness():
+def test_skipna_robustness(grid_10, grid_5, regridder_factory):
     """Verify skipna=True handles NaNs correctly in both Eager and Lazy paths."""
-    src_grid = create_global_grid(10, 10)
-    tgt_grid = create_global_grid(5, 5)
+    src_grid = grid_10
 
-    regridder = Regridder(src_grid, tgt_grid, method="bilinear", skipna=True)
+    regridder = regridder_factory(grid_10, grid_5, method="bilinear", skipna=True)
 
     data = np.ones((18, 36))
     data[0, 0] = np.nan  # Put a NaN
@@ -64,15 +62,14 @@ def test_skipna_robustness():
     xr.testing.assert_allclose(res_eager, res_lazy)
 
 
-def test_provenance_tracking():
+def test_provenance_tracking(grid_30, grid_20, regridder_factory, rand_arrays):
     """Verify that history is correctly updated and preserved."""
-    src_grid = create_global_grid(30, 30)
-    tgt_grid = create_global_grid(20, 20)
+    src_grid = grid_30
 
-    regridder = Regridder(src_grid, tgt_grid)
+    regridder = regridder_factory(grid_30, grid_20)
 
     da_coords = {c: src_grid.coords[c] for c in ["lat", "lon"]}
-    da = xr.DataArray(np.random.rand(6, 12), dims=("lat", "lon"), coords=da_coords)
+    da = xr.DataArray(rand_arrays[(6, 12)], dims=("lat", "lon"), coords=da_coords)
     da.attrs["history"] = "Original data"
 
     res = regridder(da)
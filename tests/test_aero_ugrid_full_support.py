@@ -1,7 +1,6 @@
 import numpy as np
 import pytest
 import xarray as xr
-from xregrid import Regridder, create_global_grid
 
 
 def create_mock_ugrid(n_nodes=16, n_faces=9):
@@ -19,24 +18,14 @@ def create_mock_ugrid(n_nodes=16, n_faces=9):
     node_x = node_x_2d.flatten()
     node_y = node_y_2d.flatten()
 
-    # Create quads
-    face_nodes = []
-    face_x = []
-    face_y = []
-    for j in range(n_side - 1):
-        for i in range(n_side - 1):
-            n0 = j * n_side + i
-            n1 = j * n_side + i + 1
-            n2 = (j + 1) * n_side + i + 1
-            n3 = (j + 1) * n_side + i
-            face_nodes.append([n0, n1, n2, n3])
-            face_x.append((node_x[n0] + node_x[n2]) / 2)
-            face_y.append((node_y[n0] + node_y[n2]) / 2)
-
-    face_nodes = np.array(face_nodes)
+    # Create quads, row by row
+    jj, ii = np.meshgrid(np.arange(n_side - 1), np.arange(n_side - 1), indexing="ij")
+    n0 = (jj * n_side + ii).ravel()
+    n2 = n0 + n_side + 1
+    face_nodes = np.stack([n0, n0 + 1, n2, n0 + n_side], axis=1)
     n_faces = len(face_nodes)
-    face_x = np.array(face_x)
-    face_y = np.array(face_y)
+    face_x = (node_x[n0] + node_x[n2]) / 2
+    face_y = (node_y[n0] + node_y[n2]) / 2
 
     ds = xr.Dataset(
         data_vars={
@@ -92,14 +81,13 @@ def create_mock_ugrid(n_nodes=16, n_faces=9):
     return ds
 
 
-def test_ugrid_discovery_and_regrid():
+def test_ugrid_discovery_and_regrid(grid_30, regridder_factory):
     """Verify UGRID discovery and regridding (Eager and Lazy)."""
     src_ds = create_mock_ugrid(n_nodes=25, n_faces=16)
-    tgt_grid = create_global_grid(30, 30)
 
     # Test that Regridder can handle the UGRID dataset
     # We use conservative regridding to test triangulation logic
-    regridder = Regridder(src_ds, tgt_grid, method="conservative")
+    regridder = regridder_factory(src_ds, grid_30, method="conservative")
 
     # 1. Eager test
     res_eager = regridder(src_ds.temp)
@@ -116,13 +104,13 @@ def test_ugrid_discovery_and_regrid():
     xr.testing.assert_allclose(res_eager, res_lazy)
 
 
-def test_ugrid_scientific_hygiene():
+def test_ugrid_scientific_hygiene(regridder_factory):
     """Verify UGRID metadata propagation to UGRID target."""
     src_ds = create_mock_ugrid(n_nodes=16, n_faces=9)
     tgt_ds = create_mock_ugrid(n_nodes=25, n_faces=16)
 
     # For simplicity, use nearest_s2d which doesn't require complex connectivity for target
-    regridder = Regridder(src_ds, tgt_ds, method="nearest_s2d")
+    regridder = regridder_factory(src_ds, tgt_ds, method="nearest_s2d")
 
     res = regridder(src_ds.temp)
 
@@ -41,7 +41,7 @@ def test_aero_weight_loading_roundtrip(tmp_path):
     assert regridder2.na_thres == 0.5
 
     # 3. Test application with Eager (NumPy) data
-    data_np = np.random.rand(18, 36).astype(np.float32)
+    data_np = np.random.default_rng(0).random((18, 36), dtype=np.float32)
     da_np = xr.DataArray(
         data_np,
         coords={"lat": ds_src.lat, "lon": ds_src.lon},
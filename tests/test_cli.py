@@ -1,17 +1,18 @@
-import subprocess
 import sys
 import pytest
 import xarray as xr
 import numpy as np
 from unittest.mock import patch
+from xregrid.cli import main
 
 
-@pytest.fixture
-def sample_input(tmp_path):
-    path = tmp_path / "input.nc"
+@pytest.fixture(scope="session")
+def sample_input(tmp_path_factory):
+    # Read-only input shared by all CLI tests
+    path = tmp_path_factory.mktemp("cli") / "input.nc"
     lat = np.arange(-89, 90, 2)
     lon = np.arange(1, 360, 2)
-    data = np.random.rand(len(lat), len(lon))
+    data = np.random.default_rng(0).random((len(lat), len(lon)))
     ds = xr.Dataset(
         data_vars={"test": (["lat", "lon"], data)},
         coords={
@@ -23,12 +24,12 @@ def sample_input(tmp_path):
     return path
 
 
-def test_cli_help():
-    result = subprocess.run(
-        [sys.executable, "-m", "xregrid.cli", "--help"], capture_output=True, text=True
-    )
-    assert result.returncode == 0
-    assert "xregrid CLI" in result.stdout
+def test_cli_help(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["xregrid", "--help"])
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 0
+    assert "xregrid CLI" in capsys.readouterr().out
 
 
 def test_cli_basic(sample_input, tmp_path, monkeypatch):
@@ -53,8 +54,6 @@ def test_cli_basic(sample_input, tmp_path, monkeypatch):
         ]
         monkeypatch.setattr(sys, "argv", test_args)
 
-        from xregrid.cli import main
-
         main()
 
         assert output.exists()
@@ -80,8 +79,6 @@ def test_cli_regional(sample_input, tmp_path, monkeypatch):
         ]
         monkeypatch.setattr(sys, "argv", test_args)
 
-        from xregrid.cli import main
-
         main()
 
         assert output.exists()
@@ -91,3 +88,39 @@ def test_cli_regional(sample_input, tmp_path, monkeypatch):
         assert target_grid.lat.max() <= 10
         assert target_grid.lon.min() >= 20
         assert target_grid.lon.max() <= 40
+
+
+def test_cli_invalid_extent(sample_input, monkeypatch):
+    """A malformed extent is rejected while parsing the arguments."""
+    test_args = ["xregrid.cli", str(sample_input), "0.5", "--extent=-10,10,20"]
+    monkeypatch.setattr(sys, "argv", test_args)
+
+    from xregrid.cli import parse_args
+
+    with pytest.raises(SystemExit):
+        parse_args()
+
+
+def test_cli_target_chunks(sample_input, tmp_path, monkeypatch):
+    output = tmp_path / "output.nc"
+    with patch("xregrid.cli.Regridder") as mock_regridder:
+        instance = mock_regridder.return_value
+        instance.return_value = xr.open_dataset(sample_input)
+
+        test_args = [
+            "xregrid.cli",
+            str(sample_input),
+            "1.0",
+            "--output",
+            str(output),
+            "--target-chunks",
+            "45",
+        ]
+        monkeypatch.setattr(sys, "argv", test_args)
+
+        main()
+
+        target_grid = mock_regridder.call_args[0][1]
+        assert target_grid.lat.size == 180
+        # Bounds stay lazy and follow the requested chunking
+        assert target_grid.lat_b.chunks[0] == (45, 45, 45, 45)
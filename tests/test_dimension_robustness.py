@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 import xarray as xr
 from xregrid import Regridder
 
@@ -6,7 +7,7 @@ from xregrid import Regridder
 def test_regridder_time_dimension_detection():
     # Setup source and target grids with time
     lats = np.linspace(-90, 90, 10)
-    lons = np.linspace(0, 360, 20)
+    lons = np.linspace(0, 360, 20, endpoint=False)
     times = [np.datetime64("2020-01-01")]
 
     src_ds = xr.Dataset(
@@ -34,7 +35,7 @@ def test_regridder_time_dimension_detection():
             ),
             "lon": (
                 ["lon"],
-                np.linspace(0, 360, 10),
+                np.linspace(0, 360, 10, endpoint=False),
                 {"units": "degrees_east", "standard_name": "longitude"},
             ),
         }
@@ -45,7 +46,9 @@ def test_regridder_time_dimension_detection():
 
     # Create data with time and vertical dimensions
     levs = np.arange(5)
-    data = np.random.rand(len(times), len(levs), len(lats), len(lons))
+    data = np.random.default_rng(0).random(
+        (len(times), len(levs), len(lats), len(lons))
+    )
     da = xr.DataArray(
         data,
         coords={
@@ -80,7 +83,7 @@ def test_regridder_time_dimension_detection():
 def test_regridder_dtype_time_fallback():
     # Setup with time-like dtype but non-standard name
     lats = np.linspace(-90, 90, 10)
-    lons = np.linspace(0, 360, 20)
+    lons = np.linspace(0, 360, 20, endpoint=False)
     times = [np.datetime64("2020-01-01")]
 
     src_ds = xr.Dataset(
@@ -108,7 +111,7 @@ def test_regridder_dtype_time_fallback():
             ),
             "lon": (
                 ["lon"],
-                np.linspace(0, 360, 10),
+                np.linspace(0, 360, 10, endpoint=False),
                 {"units": "degrees_east", "standard_name": "longitude"},
             ),
         }
@@ -121,7 +124,9 @@ def test_regridder_dtype_time_fallback():
 
     # Test DataArray regridding with this non-standard time dim
     da = xr.DataArray(
-        np.random.rand(1, 10, 20), coords=src_ds.coords, dims=("mytime", "lat", "lon")
+        np.random.default_rng(0).random((1, 10, 20)),
+        coords=src_ds.coords,
+        dims=("mytime", "lat", "lon"),
     )
 
     res = regridder(da)
@@ -132,7 +137,7 @@ def test_regridder_dtype_time_fallback():
 def test_non_regriddable_object():
     # Test passing something that shouldn't be regridded
     lats = np.linspace(-90, 90, 10)
-    lons = np.linspace(0, 360, 20)
+    lons = np.linspace(0, 360, 20, endpoint=False)
 
     src_ds = xr.Dataset(
         coords={
@@ -157,7 +162,7 @@ def test_non_regriddable_object():
             ),
             "lon": (
                 ["lon"],
-                np.linspace(0, 360, 10),
+                np.linspace(0, 360, 10, endpoint=False),
                 {"units": "degrees_east", "standard_name": "longitude"},
             ),
         }
@@ -176,7 +181,7 @@ def test_non_regriddable_object():
 def test_regridder_vertical_dimension_detection():
     # Setup source with vertical dimension in lats
     lats = np.linspace(-90, 90, 10)
-    lons = np.linspace(0, 360, 20)
+    lons = np.linspace(0, 360, 20, endpoint=False)
     levs = np.arange(3)
 
     src_ds = xr.Dataset(
@@ -204,7 +209,7 @@ def test_regridder_vertical_dimension_detection():
             ),
             "lon": (
                 ["lon"],
-                np.linspace(0, 360, 10),
+                np.linspace(0, 360, 10, endpoint=False),
                 {"units": "degrees_east", "standard_name": "longitude"},
             ),
         }
@@ -214,7 +219,9 @@ def test_regridder_vertical_dimension_detection():
     assert "lev" not in regridder._dims_source
 
     da = xr.DataArray(
-        np.random.rand(3, 10, 20), coords=src_ds.coords, dims=("lev", "lat", "lon")
+        np.random.default_rng(0).random((3, 10, 20)),
+        coords=src_ds.coords,
+        dims=("lev", "lat", "lon"),
     )
 
     res = regridder(da)
@@ -230,6 +237,11 @@ def test_regridder_ugrid_with_time():
         def __init__(self, ds, uxgrid):
             self._ds = ds
             self.uxgrid = uxgrid
+            # Bind the attributes probed during grid detection once
+            self.data_vars = ds.data_vars
+            self.coords = ds.coords
+            self.dims = ds.dims
+            self.sizes = ds.sizes
 
         def __getattr__(self, name):
             return getattr(self._ds, name)
@@ -237,22 +249,6 @@ def test_regridder_ugrid_with_time():
         def __getitem__(self, key):
             return self._ds[key]
 
-        @property
-        def data_vars(self):
-            return self._ds.data_vars
-
-        @property
-        def coords(self):
-            return self._ds.coords
-
-        @property
-        def dims(self):
-            return self._ds.dims
-
-        @property
-        def sizes(self):
-            return self._ds.sizes
-
     n_face = 10
     n_node = 12
     times = [np.datetime64("2020-01-01")]
@@ -273,9 +269,8 @@ def test_regridder_ugrid_with_time():
     )
 
     # Create connectivity
-    conn = np.zeros((n_face, 3), dtype=int)
-    for i in range(n_face):
-        conn[i] = [i, i + 1, (i + 2) % n_node]
+    i = np.arange(n_face)
+    conn = np.stack([i, i + 1, (i + 2) % n_node], axis=1)
 
     mock_uxgrid.face_node_connectivity = xr.DataArray(
         conn, dims=["n_face", "n_max_face_nodes"]
@@ -285,7 +280,12 @@ def test_regridder_ugrid_with_time():
 
     # Mock UxDataset with time-varying variable
     ds_base = xr.Dataset(
-        {"test_var": (["time", "n_face"], np.random.rand(1, n_face))},
+        {
+            "test_var": (
+                ["time", "n_face"],
+                np.random.default_rng(0).random((1, n_face)),
+            )
+        },
         coords={"time": (["time"], times, {"standard_name": "time"})},
     )
     ds = UxDatasetMock(ds_base, mock_uxgrid)
@@ -299,7 +299,7 @@ def test_regridder_ugrid_with_time():
             ),
             "lon": (
                 ["lon"],
-                np.linspace(0, 360, 10),
+                np.linspace(0, 360, 10, endpoint=False),
                 {"units": "degrees_east", "standard_name": "longitude"},
             ),
         }
@@ -318,81 +318,24 @@ def test_regridder_ugrid_with_time():
     assert res.shape == (1, 5, 10)
 
 
-def test_regridder_raw_ugrid_with_time():
-    n_face = 10
-    n_node = 12
-    times = [np.datetime64("2020-01-01")]
-
-    # Create a raw dataset following UGRID convention
-    conn = np.zeros((n_face, 3), dtype=int)
-    for i in range(n_face):
-        conn[i] = [i, (i + 1) % n_node, (i + 2) % n_node]
-
-    ds = xr.Dataset(
-        data_vars={
-            "temp": (["time", "n_face"], np.random.rand(1, n_face)),
-            "face_node_connectivity": (["n_face", "n_max_face_nodes"], conn),
-        },
-        coords={
-            "time": (["time"], times, {"standard_name": "time"}),
-            "lat_face": (
-                ["time", "n_face"],
-                np.broadcast_to(np.linspace(-90, 90, n_face), (1, n_face)),
-                {"units": "degrees_north"},
-            ),
-            "lon_face": (
-                ["time", "n_face"],
-                np.broadcast_to(np.linspace(0, 360, n_face), (1, n_face)),
-                {"units": "degrees_east"},
-            ),
-            "lat_node": (
-                ["time", "n_node"],
-                np.broadcast_to(np.linspace(-90, 90, n_node), (1, n_node)),
-                {"units": "degrees_north"},
-            ),
-            "lon_node": (
-                ["time", "n_node"],
-                np.broadcast_to(np.linspace(0, 360, n_node), (1, n_node)),
-                {"units": "degrees_east"},
-            ),
-        },
-    )
-
-    ds.face_node_connectivity.attrs["cf_role"] = "face_node_connectivity"
-    ds.face_node_connectivity.attrs["start_index"] = 0
-
-    from xregrid import create_global_grid
-
-    target_grid = create_global_grid(10, 10)
-
-    regridder = Regridder(ds, target_grid, method="nearest_s2d")
-
-    assert "time" not in regridder._dims_source
-    # Since it is UGRID, it should have detected n_face as the spatial dimension for variables
-    assert "n_face" in regridder._dims_source
-
-    res = regridder(ds["temp"])
-    assert "time" in res.dims
-    assert res.shape == (1, 18, 36)
-
-
 def test_regridder_user_specific_structure():
     # Mimic user's dataset structure: (time, node)
     # node is string coordinate, lat/lon are (node)
     n_node = 10
     n_time = 5
     times = np.arange(n_time).astype("datetime64[D]")
-    nodes = np.array([f"NODE_{i}" for i in range(n_node)], dtype="<U19")
+    nodes = np.char.add("NODE_", np.arange(n_node).astype("<U14"))
 
+    rng = np.random.default_rng(0)
     src_ds = xr.Dataset(
         data_vars={
             "day_of_year": (
                 ["time", "node"],
-                np.random.rand(n_time, n_node).astype("float32"),
+                rng.random((n_time, n_node), dtype=np.float32),
             ),
             "aod_550nm": (
                 ["time", "node"],
-                np.random.rand(n_time, n_node).astype("float32"),
+                rng.random((n_time, n_node), dtype=np.float32),
             ),
             "mesh": ([], np.int32(1)),
         },
@@ -430,34 +373,28 @@ def test_regridder_user_specific_structure():
     assert "mesh" in res_ds.data_vars  # Non-spatial data var should be preserved
 
 
-def test_regridder_raw_ugrid_conservative_with_time():
+@pytest.fixture(scope="module")
+def raw_ugrid_time_dataset():
+    """Raw UGRID dataset whose face and node coordinates carry a time dim."""
     n_face = 10
     n_node = 12
     times = [np.datetime64("2020-01-01")]
 
-    # Create a raw dataset following UGRID convention for conservative regridding
     # Conservative needs faces and nodes (for connectivity)
-    conn = np.zeros((n_face, 3), dtype=int)
-    for i in range(n_face):
-        conn[i] = [i, (i + 1) % n_node, (i + 2) % n_node]
+    i = np.arange(n_face)
+    conn = np.stack([i, (i + 1) % n_node, (i + 2) % n_node], axis=1)
 
     ds = xr.Dataset(
         data_vars={
-            "temp": (["time", "n_face"], np.random.rand(1, n_face)),
-            "face_node_connectivity": (["n_face", "n_max_face_nodes"], conn),
+            "temp": (["time", "n_face"], np.random.default_rng(0).random((1, n_face))),
+            "face_node_connectivity": (
+                ["n_face", "n_max_face_nodes"],
+                conn,
+                {"cf_role": "face_node_connectivity", "start_index": 0},
+            ),
         },
         coords={
             "time": (["time"], times, {"standard_name": "time"}),
-            "lat_node": (
-                ["time", "n_node"],
-                np.broadcast_to(np.linspace(-90, 90, n_node), (1, n_node)),
-                {"units": "degrees_north"},
-            ),
-            "lon_node": (
-                ["time", "n_node"],
-                np.broadcast_to(np.linspace(0, 360, n_node), (1, n_node)),
-                {"units": "degrees_east"},
-            ),
             "lat_face": (
                 ["time", "n_face"],
                 np.broadcast_to(np.linspace(-90, 90, n_face), (1, n_face)),
@@ -468,20 +405,30 @@ def test_regridder_raw_ugrid_conservative_with_time():
                 np.broadcast_to(np.linspace(0, 360, n_face), (1, n_face)),
                 {"units": "degrees_east"},
             ),
+            "lat_node": (
+                ["time", "n_node"],
+                np.broadcast_to(np.linspace(-90, 90, n_node), (1, n_node)),
+                {"units": "degrees_north"},
+            ),
+            "lon_node": (
+                ["time", "n_node"],
+                np.broadcast_to(np.linspace(0, 360, n_node), (1, n_node)),
+                {"units": "degrees_east"},
+            ),
         },
     )
+    return ds
 
-    ds.face_node_connectivity.attrs["cf_role"] = "face_node_connectivity"
-    ds.face_node_connectivity.attrs["start_index"] = 0
 
-    from xregrid import create_global_grid
+@pytest.mark.parametrize("method", ["nearest_s2d", "conservative"])
+def test_regridder_raw_ugrid_with_time(raw_ugrid_time_dataset, grid_10, method):
+    ds = raw_ugrid_time_dataset
 
-    target_grid = create_global_grid(10, 10)
-
-    # This should trigger _get_unstructured_mesh_info
-    regridder = Regridder(ds, target_grid, method="conservative")
+    # Conservative goes through _get_unstructured_mesh_info
+    regridder = Regridder(ds, grid_10, method=method)
 
     assert "time" not in regridder._dims_source
+    # Since it is UGRID, it should have detected n_face as the spatial dimension for variables
     assert "n_face" in regridder._dims_source
 
     res = regridder(ds["temp"])
@@ -32,7 +32,7 @@ def test_dtype_preservation_in_apply_weights():
     weights = csr_matrix((np.ones(n), (np.arange(n), np.arange(n))), shape=(n, n))
 
     # Input data as float32
-    data = np.random.rand(2, n).astype(np.float32)
+    data = np.random.default_rng(0).random((2, n), dtype=np.float32)
     data[0, 0] = np.nan  # Add a NaN to trigger slow path
 
     # Apply weights
@@ -18,10 +18,7 @@ def test_stationary_mask_caching():
         data[:, 0:2, 0:2] = np.nan  # Stationary mask
 
         # Mock weight matrix (16 -> 4)
-        weights = np.zeros((4, 16))
-        for i in range(4):
-            weights[i, i] = 1.0
-        weights_sparse = csr_matrix(weights)
+        weights_sparse = csr_matrix(np.eye(4, 16))
 
         weights_key = "test_weights_key"
         _WORKER_CACHE[weights_key] = weights_sparse
@@ -129,3 +126,83 @@ def test_dask_stationary_mask_caching():
     finally:
         client.close()
         cluster.close()
+
+
+def test_stationary_mask_masked_weights():
+    """Verify that the stationary path drops masked columns instead of zero-filling."""
+    _WORKER_CACHE.clear()
+    rng = np.random.default_rng(3)
+    weights = csr_matrix(rng.random((6, 16)) * (rng.random((6, 16)) > 0.4))
+
+    data = rng.random((3, 4, 4), dtype=np.float32)
+    data[:, 0, :] = np.nan  # Stationary mask
+
+    weights_key = "test_masked_weights_key"
+    _WORKER_CACHE[weights_key] = weights
+    res = _apply_weights_core(data, weights_key, ("lat", "lon"), (6,), skipna=True)
+
+    masked = _WORKER_CACHE[f"wm_{weights_key}"]
+    assert masked.shape == weights.shape
+    assert not np.any(np.isin(masked.indices, np.arange(4)))
+
+    # Reference: zero-filled data normalized by the valid weight sum
+    flat = data.reshape(3, 16)
+    valid = ~np.isnan(flat)
+    expected = (weights @ np.where(valid, flat, 0).T).T / (weights @ valid.T).T
+    np.testing.assert_allclose(res, expected, rtol=1e-5)
+
+    # Cached path gives the same answer
+    res_cached = _apply_weights_core(
+        data, weights_key, ("lat", "lon"), (6,), skipna=True
+    )
+    np.testing.assert_allclose(res, res_cached)
+
+
+def test_apply_weights_core_out_buffer():
+    """Verify that results are written into a preallocated output buffer."""
+    rng = np.random.default_rng(4)
+    weights = csr_matrix(rng.random((6, 16)) * (rng.random((6, 16)) > 0.4))
+
+    for n_time in (1, 3):
+        data = rng.random((n_time, 4, 4), dtype=np.float32)
+        expected = _apply_weights_core(data, weights, ("lat", "lon"), (2, 3))
+
+        out = np.full((n_time, 2, 3), -1.0, dtype=np.float32)
+        res = _apply_weights_core(data, weights, ("lat", "lon"), (2, 3), out=out)
+
+        assert res is out
+        np.testing.assert_allclose(out, expected)
+
+
+def test_apply_weights_core_bsr_weights():
+    """Verify that block sparse (BSR) weights give the same result as CSR."""
+    rng = np.random.default_rng(5)
+    weights = csr_matrix(rng.random((6, 16)) * (rng.random((6, 16)) > 0.4))
+    data = rng.random((2, 4, 4))
+
+    res_csr = _apply_weights_core(data, weights, ("lat", "lon"), (6,))
+    res_bsr = _apply_weights_core(
+        data, weights.tobsr(blocksize=(1, 4)), ("lat", "lon"), (6,)
+    )
+    np.testing.assert_allclose(res_bsr, res_csr)
+
+
+def test_moving_mask_beyond_sample_detected():
+    """Verify that a mask change outside the sampled points is not cached."""
+    _WORKER_CACHE.clear()
+    rng = np.random.default_rng(6)
+    weights = csr_matrix(rng.random((8, 2048)) * (rng.random((8, 2048)) > 0.9))
+
+    data = rng.random((3, 32, 64))
+    data[:, 0, 0] = np.nan
+    data[2, -1, -1] = np.nan  # Only the last slice differs, past the sample
+
+    weights_key = "test_moving_mask_key"
+    _WORKER_CACHE[weights_key] = weights
+    res = _apply_weights_core(data, weights_key, ("y", "x"), (8,), skipna=True)
+
+    assert f"ws_{weights_key}" not in _WORKER_CACHE
+    flat = data.reshape(3, -1)
+    valid = ~np.isnan(flat)
+    expected = (weights @ np.where(valid, flat, 0).T).T / (weights @ valid.T).T
+    np.testing.assert_allclose(res, expected, rtol=1e-10)
@@ -1,4 +1,6 @@
 import os
+from unittest.mock import patch
+
 import numpy as np
 import xarray as xr
 from xregrid import Regridder, create_global_grid
@@ -109,3 +111,87 @@ def test_weight_persistence_skipna(tmp_path):
     res_load = regridder_load(source_da)
 
     xr.testing.assert_allclose(res_save, res_load)
+
+
+def test_weight_cache_dir(tmp_path):
+    """Weights are cached by grid content and reused by a new Regridder."""
+    cache_dir = str(tmp_path / "cache")
+    source_da, source_grid = create_sample_data()
+    target_grid = create_global_grid(res_lat=5.0, res_lon=5.0)
+
+    regridder = Regridder(source_grid, target_grid, cache_dir=cache_dir)
+    assert os.listdir(cache_dir) == [os.path.basename(regridder.filename)]
+
+    # Same grids and options: the cached file is reused
+    reused = Regridder(source_grid.copy(deep=True), target_grid, cache_dir=cache_dir)
+    assert reused.filename == regridder.filename
+    assert reused._loaded_method == "bilinear"
+    xr.testing.assert_allclose(regridder(source_da), reused(source_da))
+
+    # Different target coordinates or method: a new entry
+    shifted = target_grid.assign_coords(lon=target_grid.lon + 1.0)
+    other_grid = Regridder(source_grid, shifted, cache_dir=cache_dir)
+    other_method = Regridder(source_grid, target_grid, "patch", cache_dir=cache_dir)
+    assert other_grid.filename != regridder.filename
+    assert other_method.filename != regridder.filename
+    assert len(os.listdir(cache_dir)) == 3
+
+
+def test_weight_memory_cache():
+    """Regridders on equal grids share weights from the in-memory cache."""
+    source_da, source_grid = create_sample_data()
+    target_grid = create_global_grid(res_lat=5.0, res_lon=5.0)
+    regridder = Regridder(source_grid, target_grid, skipna=True, cache_weights=True)
+
+    # Same grids and options: no weight generation, the arrays are shared
+    with patch.object(Regridder, "_generate_weights") as generate:
+        reused = Regridder(
+            source_grid.copy(deep=True), target_grid, skipna=True, cache_weights=True
+        )
+    generate.assert_not_called()
+    assert reused.weights is not regridder.weights
+    assert np.shares_memory(reused.weights.data, regridder.weights.data)
+    assert not reused.weights.data.flags.writeable
+    assert reused._shape_target == regridder._shape_target
+    xr.testing.assert_allclose(regridder(source_da), reused(source_da))
+    xr.testing.assert_allclose(
+        regridder(source_da), reused(source_da.chunk({"lat": 5})).compute()
+    )
+
+    # Other options or the default: the weights are generated again
+    other = Regridder(source_grid, target_grid, cache_weights=True)
+    assert not np.shares_memory(other.weights.data, regridder.weights.data)
+    fresh = Regridder(source_grid, target_grid, skipna=True)
+    assert not np.shares_memory(fresh.weights.data, regridder.weights.data)
+    assert fresh.weights.data.flags.writeable
+
+
+def test_weight_file_memory_cache(tmp_path):
+    """Reloading an unchanged weights file reuses the in-memory weights."""
+    filename = str(tmp_path / "weights.nc")
+    source_da, source_grid = create_sample_data()
+    target_grid = create_global_grid(res_lat=5.0, res_lon=5.0)
+    first = Regridder(
+        source_grid,
+        target_grid,
+        reuse_weights=True,
+        filename=filename,
+        cache_weights=True,
+    )
+
+    # The file just written is served from memory
+    with patch.object(Regridder, "_load_weights") as load:
+        second = Regridder.from_weights(
+            filename, source_grid, target_grid, cache_weights=True
+        )
+    load.assert_not_called()
+    assert np.shares_memory(second.weights.data, first.weights.data)
+    xr.testing.assert_allclose(first(source_da), second(source_da))
+
+    # A rewritten file is read again
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    reloaded = Regridder.from_weights(
+        filename, source_grid, target_grid, cache_weights=True
+    )
+    assert not np.shares_memory(reloaded.weights.data, first.weights.data)
@@ -1,18 +1,17 @@
 import os
-import numpy as np
 import pytest
 import xarray as xr
 from xregrid import Regridder, create_global_grid
 
 
-def test_eager_lazy_identity_and_name_preservation():
+def test_eager_lazy_identity_and_name_preservation(
+    grid_10, regridder_10_5_bilinear, rand_arrays
+):
     """Verify Eager and Lazy results are identical and name/history are preserved."""
-    ds_in = create_global_grid(10, 10)
-    ds_out = create_global_grid(5, 5)
-    regridder = Regridder(ds_in, ds_out, method="bilinear")
+    regridder = regridder_10_5_bilinear
 
-    data = np.random.rand(18, 36)
-    coords = {"lat": ds_in.lat, "lon": ds_in.lon}
+    data = rand_arrays[(18, 36)]
+    coords = {"lat": grid_10.lat, "lon": grid_10.lon}
     name = "test_var"
     attrs = {"units": "K", "history": "original history"}
 
@@ -8,6 +8,7 @@ from xregrid import (
 )
 import os
 import numpy as np
+import pytest
 
 
 def test_create_global_grid():
@@ -39,6 +40,38 @@ def test_create_regional_grid():
     assert np.isclose(ds.lat_b.max(), 45)
 
 
+def test_create_global_grid_fractional_res():
+    """Fractional resolutions yield exact axis lengths for eager and lazy grids."""
+    for chunks in (None, 600):
+        ds = create_global_grid(res_lat=0.1, res_lon=0.1, chunks=chunks)
+        assert ds.lat.size == 1800
+        assert ds.lon.size == 3600
+        assert ds.lat.dtype == np.float64
+        np.testing.assert_allclose(ds.lat_b.values[[0, -1], [0, 1]], [-90, 90])
+        np.testing.assert_allclose(ds.lon_b.values[[0, -1], [0, 1]], [0, 360])
+        np.testing.assert_allclose(np.diff(ds.lat.values), 0.1)
+
+
+def test_create_global_grid_cached_axes():
+    """Repeated grid construction returns independent copies of a cached grid."""
+    ds1 = create_global_grid(res_lat=2, res_lon=2)
+    ds2 = create_global_grid(res_lat=2, res_lon=2)
+    assert ds1 is not ds2
+    assert not np.shares_memory(ds1.lat_b.values, ds2.lat_b.values)
+    xr.testing.assert_equal(ds1, ds2)
+
+    # Changes to one grid do not leak into later ones
+    ds1.lat_b.values[0, 0] = 0.0
+    ds1.attrs["title"] = "changed"
+    ds1.lat.attrs["units"] = "changed"
+    ds1.coords["extra"] = 1
+    ds3 = create_global_grid(res_lat=2, res_lon=2)
+    assert "title" not in ds3.attrs
+    assert ds3.lat.attrs["units"] == "degrees_north"
+    assert ds3.lat_b.values[0, 0] == -90.0
+    assert "extra" not in ds3.coords
+
+
 def test_load_esmf_file(tmp_path):
     # Create a dummy NetCDF file
     filepath = os.path.join(tmp_path, "test_mesh.nc")
@@ -89,3 +122,42 @@ def test_create_mesh_from_coords():
     assert "n_pts" in ds.lat.dims
 
     assert "crs" in ds.attrs
+
+
+def test_get_crs_info_cached():
+    """Identical CRS definitions are parsed once and shared."""
+    pyproj = pytest.importorskip("pyproj")
+    from xregrid.utils import get_crs_info
+
+    wkt = pyproj.CRS("EPSG:3857").to_wkt()
+    da1 = xr.DataArray(np.zeros(2), attrs={"crs": wkt})
+    da2 = xr.DataArray(np.ones(2), attrs={"crs": wkt})
+    assert get_crs_info(da1) is get_crs_info(da2)
+    assert get_crs_info(da1) == pyproj.CRS(wkt)
+
+
+def test_get_crs_info_grid_mapping_lookup():
+    """The cf-xarray grid mapping lookup only runs for CF grid mappings."""
+    pyproj = pytest.importorskip("pyproj")
+    from unittest.mock import PropertyMock, patch
+
+    from xregrid.utils import get_crs_info
+
+    wkt = pyproj.CRS("EPSG:3857").to_wkt()
+    ds = xr.Dataset(
+        {
+            "t": (("y", "x"), np.zeros((2, 3)), {"grid_mapping": "crs"}),
+            "crs": ((), 0, {"crs_wkt": wkt}),
+        }
+    )
+    assert get_crs_info(ds) == pyproj.CRS(wkt)
+
+    plain = xr.Dataset({"t": (("y", "x"), np.zeros((2, 3)))})
+    with patch(
+        "cf_xarray.accessor.CFDatasetAccessor.grid_mappings",
+        new_callable=PropertyMock,
+    ) as mock_gm:
+        assert get_crs_info(plain) is None
+        assert not mock_gm.called
+        get_crs_info(ds)
+        assert mock_gm.called
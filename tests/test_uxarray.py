@@ -18,6 +18,11 @@ class UxDatasetMock:
     def __init__(self, ds, uxgrid):
         self._ds = ds
         self.uxgrid = uxgrid
+        # Bind the attributes probed during grid detection once
+        self.data_vars = ds.data_vars
+        self.coords = ds.coords
+        self.dims = ds.dims
+        self.sizes = ds.sizes
 
     def __getattr__(self, name):
         return getattr(self._ds, name)
@@ -25,22 +30,6 @@ class UxDatasetMock:
     def __getitem__(self, key):
         return self._ds[key]
 
-    @property
-    def data_vars(self):
-        return self._ds.data_vars
-
-    @property
-    def coords(self):
-        return self._ds.coords
-
-    @property
-    def dims(self):
-        return self._ds.dims
-
-    @property
-    def sizes(self):
-        return self._ds.sizes
-
 
 def test_uxarray_support():
     # 1. Create a mocked uxarray object
@@ -55,9 +44,7 @@ def test_uxarray_support():
     mock_uxgrid.face_lon = xr.DataArray(np.linspace(0, 360, n_face), dims=["n_face"])
 
     # Create connectivity
-    conn = np.zeros((n_face, 3), dtype=int)
-    for i in range(n_face):
-        conn[i] = [i, i + 1, i + 2]
+    conn = np.arange(n_face)[:, None] + np.arange(3)
 
     mock_uxgrid.face_node_connectivity = xr.DataArray(
         conn, dims=["n_face", "n_max_face_nodes"]
@@ -94,9 +94,272 @@ def test_plot_diagnostics_smoke():
 
 def test_plot_interactive_smoke():
     """Smoke test for plot_interactive."""
-    from xregrid.viz import hvplot as has_hvplot
-
-    if not has_hvplot:
-        pytest.skip("hvplot missing")
+    pytest.importorskip("hvplot.xarray")
     da = xr.DataArray(np.random.rand(18, 36), dims=("lat", "lon"), name="test")
     plot_interactive(da)
+
+
+def test_plot_static_decimates_large_fields():
+    """
+    Aero Protocol: fields much larger than the figure are block-averaged.
+    Double-Check Test: NumPy vs Dask backends.
+    """
+    import matplotlib.pyplot as plt
+
+    from xregrid.viz import _decimate_for_display
+
+    da = xr.DataArray(
+        np.random.default_rng(0).random((400, 800)),
+        dims=("lat", "lon"),
+        coords={"lat": np.linspace(-90, 90, 400), "lon": np.linspace(0, 360, 800)},
+    )
+    fig = plt.figure(figsize=(2, 1), dpi=50)  # 5000 pixels
+    try:
+        small = _decimate_for_display(da, {"lat", "lon"}, fig)
+        assert small.shape == (100, 200)  # 4 cells per pixel -> stride 4
+        xr.testing.assert_allclose(
+            small, _decimate_for_display(da.chunk({"lat": 100}), {"lat", "lon"}, fig)
+        )
+        # Small fields are left untouched
+        tile = da[:10, :10]
+        assert _decimate_for_display(tile, {"lat", "lon"}, fig) is tile
+
+        with patch("xregrid.viz.ccrs", None):
+            im = plot_static(da, ax=fig.gca())
+        assert im.get_array().size == 100 * 200
+    finally:
+        plt.close(fig)
+
+
+def test_decimate_subsamples_categorical_fields():
+    """
+    Aero Protocol: integer and flag fields are subsampled, not averaged.
+    Double-Check Test: NumPy vs Dask backends.
+    """
+    import matplotlib.pyplot as plt
+
+    from xregrid.viz import _decimate_for_display
+
+    codes = np.random.default_rng(1).integers(0, 3, (400, 800))
+    da = xr.DataArray(
+        codes,
+        dims=("lat", "lon"),
+        attrs={"flag_values": [0, 1, 2], "flag_meanings": "water land ice"},
+    )
+    flags = da.astype(np.float32)
+    fig = plt.figure(figsize=(2, 1), dpi=50)  # 5000 pixels
+    try:
+        for field in (da, flags, da.chunk({"lat": 100})):
+            small = _decimate_for_display(field, {"lat", "lon"}, fig)
+            assert small.shape == (100, 200)
+            np.testing.assert_array_equal(small.values, codes[::4, ::4])
+            assert small.attrs["flag_values"] == [0, 1, 2]
+    finally:
+        plt.close(fig)
+
+
+def test_plot_comparison_reuses_regridder():
+    """Comparison plots on the same grids build their Regridder once."""
+    import xregrid.viz as viz
+
+    src = create_global_grid(10, 10)
+    tgt = create_global_grid(5, 5)
+    src_da = xr.DataArray(
+        np.random.rand(18, 36),
+        dims=("lat", "lon"),
+        coords={"lat": src.lat, "lon": src.lon},
+        name="src",
+    )
+    tgt_da = Regridder(src, tgt)(src_da)
+
+    viz._COMPARISON_REGRIDDERS.clear()
+    with (
+        patch("matplotlib.pyplot.subplots") as mock_subplots,
+        patch("xregrid.viz.plot_static") as mock_plot,
+    ):
+        mock_subplots.return_value = (MagicMock(), [MagicMock() for _ in range(3)])
+        plot_comparison(src_da, tgt_da)
+        plot_comparison(src_da * 2, tgt_da)
+
+    assert len(viz._COMPARISON_REGRIDDERS) == 1
+    # The difference is exact: the target is the regridded source
+    diff = mock_plot.call_args_list[2][0][0]
+    np.testing.assert_allclose(diff.values, 0.0, atol=1e-6)
+
+
+def test_plot_comparison_falls_back_to_interp_like():
+    """A failing weight generation falls back to interp_like for the difference."""
+    import xregrid.viz as viz
+
+    coords = {"lat": np.linspace(-80, 80, 9), "lon": np.linspace(0, 340, 18)}
+    src_da = xr.DataArray(np.random.rand(9, 18), coords=coords, name="src")
+
+    viz._COMPARISON_REGRIDDERS.clear()
+    with (
+        patch("xregrid.regridder.Regridder", side_effect=RuntimeError("ESMF")),
+        patch("matplotlib.pyplot.subplots") as mock_subplots,
+        patch("xregrid.viz.plot_static") as mock_plot,
+    ):
+        axes = [MagicMock() for _ in range(3)]
+        mock_subplots.return_value = (MagicMock(), axes)
+        plot_comparison(src_da, src_da + 1)
+
+    assert len(mock_plot.call_args_list) == 3
+    axes[2].text.assert_not_called()
+    np.testing.assert_allclose(mock_plot.call_args_list[2][0][0].values, 1.0)
+    assert not viz._COMPARISON_REGRIDDERS
+
+
+def test_clear_comparison_cache():
+    """Cached comparison Regridders can be released."""
+    import xregrid.viz as viz
+
+    viz._COMPARISON_REGRIDDERS["key"] = MagicMock()
+    viz.clear_comparison_cache()
+    assert not viz._COMPARISON_REGRIDDERS
+
+
+def test_spatial_dims_memoized():
+    """Spatial-dimension detection is reused for fields with the same metadata."""
+    from xregrid import viz
+
+    da = xr.DataArray(
+        np.zeros((2, 3, 4)),
+        dims=("time", "y", "x"),
+        coords={
+            "lat": (("y", "x"), np.zeros((3, 4)), {"units": "degrees_north"}),
+            "lon": (("y", "x"), np.zeros((3, 4)), {"units": "degrees_east"}),
+        },
+    )
+    viz._SPATIAL_DIMS_CACHE.clear()
+    assert viz._spatial_dims(da) == {"y", "x"}
+
+    with patch.object(viz, "_find_coord") as find_coord:
+        assert viz._spatial_dims(da + 1) == {"y", "x"}
+        find_coord.assert_not_called()
+
+    # Different coordinate metadata is detected afresh
+    assert viz._spatial_dims(da.drop_vars(["lat", "lon"])) == {"y", "x"}
+    assert len(viz._SPATIAL_DIMS_CACHE) == 2
+
+
+def test_plot_static_fast_aspect():
+    """fast_aspect plots geographic fields on plain axes with a cos(lat) aspect."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    da = xr.DataArray(
+        np.random.rand(10, 20),
+        dims=("lat", "lon"),
+        coords={"lat": np.linspace(50, 70, 10), "lon": np.linspace(0, 40, 20)},
+    )
+    fig, ax = plt.subplots()
+    plot_static(da, ax=ax, fast_aspect=True)
+    assert not hasattr(ax, "projection")
+    np.testing.assert_allclose(ax.get_aspect(), 2.0)
+    plt.close(fig)
+
+
+def test_lonlat_mesh_for_utm_fields():
+    """UTM fields get 2D lon/lat vertices from one vectorized transform."""
+    pyproj = pytest.importorskip("pyproj")
+    from xregrid.viz import _lonlat_mesh
+
+    x = np.linspace(400000.0, 500000.0, 6)
+    y = np.linspace(5000000.0, 5100000.0, 4)
+    da = xr.DataArray(
+        np.random.rand(4, 6),
+        dims=("y", "x"),
+        coords={"y": y, "x": x},
+        attrs={"crs": "EPSG:32633"},
+    )
+    da_ll, x_name, y_name = _lonlat_mesh(da, frozenset({"y", "x"}))
+
+    assert (x_name, y_name) == ("lon", "lat")
+    assert da_ll.lon.dims == ("y", "x")
+    transformer = pyproj.Transformer.from_crs("EPSG:32633", "EPSG:4326", always_xy=True)
+    lon, lat = transformer.transform(x[-1], y[0])
+    np.testing.assert_allclose(da_ll.lon.values[0, -1], lon)
+    np.testing.assert_allclose(da_ll.lat.values[0, -1], lat)
+
+    # Existing 2D coordinates are reused without transforming again
+    assert _lonlat_mesh(da_ll, frozenset({"y", "x"}))[0] is da_ll
+
+
+def test_hvplot_imported_lazily():
+    """hvplot is only imported by the first interactive plot."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, xregrid.viz; "
+        "assert 'hvplot' not in sys.modules and 'holoviews' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_cartopy_crs_reused():
+    """Identical projection requests return the same CRS object."""
+    from xregrid.viz import _cartopy_crs
+
+    mock_ccrs = MagicMock()
+    mock_ccrs.PlateCarree.side_effect = lambda **kwargs: object()
+    _cartopy_crs.cache_clear()
+    try:
+        with patch("xregrid.viz.ccrs", mock_ccrs):
+            assert _cartopy_crs("PlateCarree") is _cartopy_crs("PlateCarree")
+            assert _cartopy_crs("PlateCarree", central_longitude=180) is not (
+                _cartopy_crs("PlateCarree")
+            )
+        assert mock_ccrs.PlateCarree.call_count == 2
+    finally:
+        _cartopy_crs.cache_clear()
+
+
+def test_plot_comparison_shares_color_limits():
+    """
+    Aero Protocol: source and target panels share one color scale.
+    Double-Check Test: NumPy vs Dask backends.
+    """
+    coords = {"lat": np.linspace(-80, 80, 9), "lon": np.linspace(0, 340, 18)}
+    src = xr.DataArray(np.linspace(-2, 1, 162).reshape(9, 18), coords=coords)
+    tgt = xr.DataArray(np.linspace(0, 3, 162).reshape(9, 18), coords=coords)
+
+    for a, b in [(src, tgt), (src.chunk({"lat": 3}), tgt.chunk({"lat": 3}))]:
+        with (
+            patch("matplotlib.pyplot.subplots") as mock_subplots,
+            patch("xregrid.viz.plot_static") as mock_plot,
+        ):
+            mock_subplots.return_value = (MagicMock(), [MagicMock() for _ in range(3)])
+            plot_comparison(a, b, regridder=MagicMock(side_effect=lambda x: x))
+
+        src_kw, tgt_kw, diff_kw = (c.kwargs for c in mock_plot.call_args_list)
+        assert (src_kw["vmin"], src_kw["vmax"]) == (-2.0, 3.0)
+        assert (tgt_kw["vmin"], tgt_kw["vmax"]) == (-2.0, 3.0)
+        assert "vmin" not in diff_kw
+
+    # User-provided scaling is left alone
+    with (
+        patch("matplotlib.pyplot.subplots") as mock_subplots,
+        patch("xregrid.viz.plot_static") as mock_plot,
+    ):
+        mock_subplots.return_value = (MagicMock(), [MagicMock() for _ in range(3)])
+        plot_comparison(src, tgt, robust=True)
+    assert "vmin" not in mock_plot.call_args_list[0].kwargs
+
+
+def test_plot_static_rasterizes_mesh():
+    """The plotted mesh is rasterized unless the caller decides otherwise."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    da = xr.DataArray(np.random.rand(18, 36), dims=("lat", "lon"))
+    fig, ax = plt.subplots()
+    with patch("xregrid.viz.ccrs", None):
+        assert plot_static(da, ax=ax).get_rasterized()
+        assert not plot_static(da, ax=ax, rasterized=False).get_rasterized()
+    plt.close(fig)
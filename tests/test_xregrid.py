@@ -184,6 +184,7 @@ def test_regridder_repr():
     assert "periodic=False" in rep
     assert "(10, 20)" in rep
     assert "(15, 25)" in rep
+    assert f"nnz={regridder.weights.nnz}," in rep
 
 
 def test_weights_format():